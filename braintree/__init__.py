@@ -7,6 +7,8 @@ from braintree.amex_express_checkout_card import AmexExpressCheckoutCard
 from braintree.android_pay_card import AndroidPayCard
 from braintree.apple_pay_card import ApplePayCard
 from braintree.apple_pay_gateway import ApplePayGateway
+from braintree.async_braintree_gateway import AsyncBraintreeGateway
+from braintree.async_resource_collection import AsyncResourceCollection
 from braintree.braintree_gateway import BraintreeGateway
 from braintree.client_token import ClientToken
 from braintree.configuration import Configuration
@@ -33,6 +35,7 @@ from braintree.error_codes import ErrorCodes
 from braintree.error_result import ErrorResult
 from braintree.errors import Errors
 from braintree.europe_bank_account import EuropeBankAccount
+from braintree.find_many_result import FindManyResult
 from braintree.us_bank_account import UsBankAccount
 from braintree.merchant import Merchant
 from braintree.merchant_account import MerchantAccount
@@ -71,7 +74,10 @@ from braintree.unknown_payment_method import UnknownPaymentMethod
 from braintree.validation_error_collection import ValidationErrorCollection
 from braintree.venmo_account import VenmoAccount
 from braintree.version import Version
+from braintree.webhook_deduplication_store import WebhookDeduplicationStore, MemoryWebhookDeduplicationStore
 from braintree.webhook_notification import WebhookNotification
 from braintree.webhook_notification_gateway import WebhookNotificationGateway
+from braintree.webhook_pipeline import WebhookPipeline
 from braintree.webhook_testing import WebhookTesting
 from braintree.webhook_testing_gateway import WebhookTestingGateway
+from braintree.webhook_verifier import WebhookVerifier
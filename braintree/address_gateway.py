@@ -14,7 +14,7 @@ class AddressGateway(object):
     def create(self, params=None):
         if params is None:
             params = {}
-        Resource.verify_keys(params, Address.create_signature())
+        Resource.verify_keys(params, Address.create_signature)
         if "customer_id" not in params:
             raise KeyError("customer_id must be provided")
         if not re.search(r"\A[0-9A-Za-z_-]+\Z", params["customer_id"]):
@@ -42,7 +42,7 @@ class AddressGateway(object):
     def update(self, customer_id, address_id, params=None):
         if params is None:
             params = {}
-        Resource.verify_keys(params, Address.update_signature())
+        Resource.verify_keys(params, Address.update_signature)
         response = self.config.http().put(
             self.config.base_merchant_path() + "/customers/" + customer_id + "/addresses/" + address_id,
             {"address": params}
@@ -0,0 +1,56 @@
+from braintree.async_customer_gateway import AsyncCustomerGateway
+from braintree.async_dispute_gateway import AsyncDisputeGateway
+from braintree.async_payment_method_gateway import AsyncPaymentMethodGateway
+from braintree.async_transaction_gateway import AsyncTransactionGateway
+from braintree.configuration import Configuration
+import braintree.configuration
+from braintree.util.async_http import AiohttpStrategy
+from braintree.util.async_http import AsyncHttp
+from braintree.util.instrumentation import InstrumentedGateway
+
+class AsyncBraintreeGateway(object):
+    """
+    A gateway whose operations are coroutines, so that many requests can
+    share a single event loop. Responses are parsed into the same resource
+    classes as :class:`BraintreeGateway <braintree.braintree_gateway.BraintreeGateway>`. ::
+
+        async with braintree.AsyncBraintreeGateway(config) as gateway:
+            result = await gateway.transaction.sale({"amount": "10.00", "payment_method_nonce": nonce})
+
+    ``http_strategy`` is a class instantiated with the configuration and its
+    environment whose ``http_do`` is a coroutine; it defaults to
+    :class:`AiohttpStrategy <braintree.util.async_http.AiohttpStrategy>`.
+    """
+
+    def __init__(self, config=None, **kwargs):
+        if isinstance(config, braintree.configuration.Configuration):
+            self.config = config
+        else:
+            self.config = Configuration(
+                client_id=kwargs.get("client_id"),
+                client_secret=kwargs.get("client_secret"),
+                access_token=kwargs.get("access_token")
+            )
+        http_strategy = kwargs.get("http_strategy") or AiohttpStrategy
+        self.http_strategy = http_strategy(self.config, self.config.environment)
+        self.customer = AsyncCustomerGateway(self)
+        self.dispute = AsyncDisputeGateway(self)
+        self.payment_method = AsyncPaymentMethodGateway(self)
+        self.transaction = AsyncTransactionGateway(self)
+
+        if getattr(self.config, "metrics_sink", None) is not None:
+            for name in ("customer", "dispute", "payment_method", "transaction"):
+                setattr(self, name, InstrumentedGateway(getattr(self, name), name, self.config.metrics_sink))
+
+    def http(self):
+        return AsyncHttp(self.config, self.http_strategy)
+
+    async def close(self):
+        if hasattr(self.http_strategy, "close"):
+            await self.http_strategy.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
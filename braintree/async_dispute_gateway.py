@@ -0,0 +1,49 @@
+from braintree.async_paginated_collection import AsyncPaginatedCollection
+from braintree.dispute import Dispute
+from braintree.exceptions.not_found_error import NotFoundError
+from braintree.paginated_result import PaginatedResult
+from braintree.resource_collection import ResourceCollection
+from braintree.successful_result import SuccessfulResult
+
+class AsyncDisputeGateway(object):
+    def __init__(self, gateway):
+        self.gateway = gateway
+        self.config = gateway.config
+
+    async def find(self, dispute_id):
+        try:
+            if dispute_id is None or dispute_id.strip() == "":
+                raise NotFoundError()
+
+            response = await self.gateway.http().get(self.config.base_merchant_path() + "/disputes/" + dispute_id)
+            return Dispute(response["dispute"])
+        except NotFoundError:
+            raise NotFoundError("dispute with id " + repr(dispute_id) + " not found")
+
+    async def search(self, *query):
+        if isinstance(query[0], list):
+            query = query[0]
+
+        criteria = self.__criteria(query)
+
+        async def fetch_disputes(page):
+            return await self.__fetch_disputes(criteria, page)
+
+        return SuccessfulResult({"disputes": AsyncPaginatedCollection(fetch_disputes)})
+
+    async def __fetch_disputes(self, criteria, page):
+        response = await self.gateway.http().post(self.config.base_merchant_path() + "/disputes/advanced_search?page=" + str(page), {"search": criteria}, idempotent=True)
+        body = response["disputes"]
+
+        disputes = [Dispute(item) for item in ResourceCollection._extract_as_array(response["disputes"], "dispute")]
+        return PaginatedResult(body["total_items"], body["page_size"], disputes)
+
+    def __criteria(self, query):
+        criteria = {}
+
+        for term in query:
+            if criteria.get(term.name):
+                criteria[term.name] = dict(list(criteria[term.name].items()) + list(term.to_param().items()))
+            else:
+                criteria[term.name] = term.to_param()
+        return criteria
@@ -0,0 +1,43 @@
+from collections import deque
+
+class AsyncPaginatedCollection(object):
+    """
+    A class representing results from a paginated list made through an
+    :class:`AsyncBraintreeGateway <braintree.async_braintree_gateway.AsyncBraintreeGateway>`.
+    Supports the async iterator protocol::
+
+        result = await gateway.dispute.search(braintree.DisputeSearch.status == "open")
+        async for dispute in result.disputes:
+            print(dispute.id)
+    """
+
+    def __init__(self, method):
+        self.__method = method
+
+    @property
+    def items(self):
+        """ Returns an async iterator over all of the results. """
+        return _AsyncPageIterator(self.__method)
+
+    def __aiter__(self):
+        return self.items
+
+class _AsyncPageIterator(object):
+    def __init__(self, method):
+        self.__method = method
+        self.__current_page = 0
+        self.__last_page_fetched = False
+        self.__items = deque()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while not self.__items:
+            if self.__last_page_fetched:
+                raise StopAsyncIteration
+            self.__current_page += 1
+            results = await self.__method(self.__current_page)
+            self.__items.extend(results.current_page)
+            self.__last_page_fetched = self.__current_page * results.page_size >= results.total_items
+        return self.__items.popleft()
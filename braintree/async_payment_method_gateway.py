@@ -0,0 +1,61 @@
+from braintree.error_result import ErrorResult
+from braintree.exceptions.not_found_error import NotFoundError
+from braintree.payment_method import PaymentMethod
+from braintree.payment_method_parser import parse_payment_method
+from braintree.resource import Resource
+from braintree.successful_result import SuccessfulResult
+
+from urllib.parse import urlencode
+
+
+class AsyncPaymentMethodGateway(object):
+    def __init__(self, gateway):
+        self.gateway = gateway
+        self.config = gateway.config
+
+    async def create(self, params=None):
+        if params is None:
+            params = {}
+        Resource.verify_keys(params, PaymentMethod.create_signature)
+        response = await self.gateway.http().post(self.config.base_merchant_path() + "/payment_methods", {"payment_method": params})
+        return self.__result(response)
+
+    async def find(self, payment_method_token):
+        try:
+            if payment_method_token is None or payment_method_token.strip() == "":
+                raise NotFoundError()
+
+            response = await self.gateway.http().get(self.config.base_merchant_path() + "/payment_methods/any/" + payment_method_token)
+            return parse_payment_method(self.gateway, response)
+        except NotFoundError:
+            raise NotFoundError("payment method with token " + repr(payment_method_token) + " not found")
+
+    async def update(self, payment_method_token, params):
+        Resource.verify_keys(params, PaymentMethod.update_signature)
+        try:
+            if payment_method_token is None or payment_method_token.strip() == "":
+                raise NotFoundError()
+
+            response = await self.gateway.http().put(self.config.base_merchant_path() + "/payment_methods/any/" + payment_method_token, {"payment_method": params})
+            return self.__result(response)
+        except NotFoundError:
+            raise NotFoundError("payment method with token " + repr(payment_method_token) + " not found")
+
+    async def delete(self, payment_method_token, options=None):
+        if options is None:
+            options = {}
+        Resource.verify_keys(options, PaymentMethod.delete_signature)
+        query_param = ""
+        if options:
+            if 'revoke_all_grants' in options:
+                options['revoke_all_grants'] = str(options['revoke_all_grants']).lower()
+            query_param = "?" + urlencode(options)
+
+        await self.gateway.http().delete(self.config.base_merchant_path() + "/payment_methods/any/" + payment_method_token + query_param)
+        return SuccessfulResult()
+
+    def __result(self, response):
+        if "api_error_response" in response:
+            return ErrorResult(self.gateway, response["api_error_response"])
+        else:
+            return SuccessfulResult({"payment_method": parse_payment_method(self.gateway, response)})
@@ -0,0 +1,151 @@
+import asyncio
+from collections import deque
+from braintree.exceptions.unexpected_error import UnexpectedError
+
+class AsyncResourceCollection(object):
+    """
+    A class representing results from a search made through an
+    :class:`AsyncBraintreeGateway <braintree.async_braintree_gateway.AsyncBraintreeGateway>`.
+    Supports the async iterator protocol::
+
+        results = await gateway.transaction.search(braintree.TransactionSearch.amount == "10.00")
+        async for transaction in results:
+            print(transaction.id)
+    """
+
+    def __init__(self, query, results, method):
+        if "search_results" not in results:
+            raise UnexpectedError("Unprocessable entity due to an invalid request")
+        self.__ids = results["search_results"]["ids"]
+        self.__method = method
+        self.__page_size = results["search_results"]["page_size"]
+        self.__query = query
+
+    @property
+    def maximum_size(self):
+        """
+        Returns the approximate size of the results.  The size is approximate due to race conditions when pulling
+        back results.  Due to its inexact nature, maximum_size should be avoided.
+        """
+        return len(self.__ids)
+
+    @property
+    def first(self):
+        """ Returns an awaitable resolving to the first item in the results. """
+        return self.__first()
+
+    @property
+    def items(self):
+        """ Returns an async iterator over all of the results. """
+        return _AsyncBatchIterator(self.__query, self.__batch_ids(), self.__method)
+
+    def prefetch(self, batches=4):
+        """
+        Returns an async iterator over all of the results that fetches up to ``batches`` pages ahead
+        concurrently on the event loop. Items are yielded in the same order as :attr:`items`.
+
+        A loop that may stop before the last result should close the iterator, which cancels the
+        pages still being fetched, by using it as an async context manager::
+
+            async with results.prefetch(batches=8) as transactions:
+                async for transaction in transactions:
+                    if done(transaction):
+                        break
+
+        or by awaiting its ``aclose()``. Pages still pending are also cancelled when the iterator
+        is garbage collected.
+        """
+        return _AsyncReadAheadIterator(self.__query, self.__batch_ids(), self.__method, batches)
+
+    @property
+    def ids(self):
+        """ Returns the list of ids in the search result. """
+        return self.__ids
+
+    def __aiter__(self):
+        return self.items
+
+    async def __first(self):
+        return (await self.__method(self.__query, self.__ids[0:1]))[0]
+
+    def __batch_ids(self):
+        for i in range(0, len(self.__ids), self.__page_size):
+            yield self.__ids[i:i+self.__page_size]
+
+class _AsyncBatchIterator(object):
+    def __init__(self, query, batches, method):
+        self.__query = query
+        self.__batches = batches
+        self.__method = method
+        self.__items = deque()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while not self.__items:
+            batch = next(self.__batches, None)
+            if batch is None:
+                raise StopAsyncIteration
+            self.__items.extend(await self.__method(self.__query, batch))
+        return self.__items.popleft()
+
+class _AsyncReadAheadIterator(object):
+    def __init__(self, query, batches, method, window):
+        self.__pending = deque()
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        self.__query = query
+        self.__batches = batches
+        self.__method = method
+        self.__window = window
+        self.__items = deque()
+
+    def __aiter__(self):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        """ Stops the iteration, cancelling and awaiting the pages still being fetched. """
+        self.__batches = iter(())
+        self.__items.clear()
+        pending = list(self.__pending)
+        self.__cancel_pending()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    def __del__(self):
+        try:
+            self.__cancel_pending()
+        except RuntimeError:
+            # The event loop of the pending tasks has already been closed.
+            pass
+
+    async def __anext__(self):
+        while not self.__items:
+            while len(self.__pending) < self.__window and self.__schedule_next():
+                pass
+            if not self.__pending:
+                raise StopAsyncIteration
+            try:
+                self.__items.extend(await self.__pending.popleft())
+            except BaseException:
+                self.__cancel_pending()
+                raise
+        return self.__items.popleft()
+
+    def __cancel_pending(self):
+        for task in self.__pending:
+            task.cancel()
+        self.__pending.clear()
+
+    def __schedule_next(self):
+        batch = next(self.__batches, None)
+        if batch is None:
+            return False
+        self.__pending.append(asyncio.ensure_future(self.__method(self.__query, batch)))
+        return True
@@ -0,0 +1,112 @@
+import braintree
+import warnings
+from braintree.async_resource_collection import AsyncResourceCollection
+from braintree.error_result import ErrorResult
+from braintree.resource import Resource
+from braintree.resource_collection import ResourceCollection
+from braintree.successful_result import SuccessfulResult
+from braintree.transaction import Transaction
+from braintree.exceptions.not_found_error import NotFoundError
+from braintree.exceptions.request_timeout_error import RequestTimeoutError
+
+
+class AsyncTransactionGateway(object):
+    def __init__(self, gateway):
+        self.gateway = gateway
+        self.config = gateway.config
+
+    async def create(self, params):
+        Resource.verify_keys(params, Transaction.create_signature)
+        return await self._post("/transactions", {"transaction": params})
+
+    async def credit(self, params):
+        if params is None:
+            params = {}
+        params["type"] = Transaction.Type.Credit
+        return await self.create(params)
+
+    async def find(self, transaction_id):
+        try:
+            if transaction_id is None or transaction_id.strip() == "":
+                raise NotFoundError()
+            response = await self.gateway.http().get(self.config.base_merchant_path() + "/transactions/" + transaction_id)
+            return Transaction(self.gateway, response["transaction"])
+        except NotFoundError:
+            raise NotFoundError("transaction with id " + repr(transaction_id) + " not found")
+
+    async def refund(self, transaction_id, amount_or_options=None):
+        if isinstance(amount_or_options, dict):
+            options = amount_or_options
+        else:
+            options = {
+                "amount": amount_or_options
+            }
+        Resource.verify_keys(options, Transaction.refund_signature)
+        return await self._post("/transactions/" + transaction_id + "/refund", {"transaction": options})
+
+    async def sale(self, params):
+        if "recurring" in params.keys():
+            warnings.warn("Use transaction_source parameter instead", DeprecationWarning)
+        params.update({"type": "sale"})
+        return await self.create(params)
+
+    async def search(self, *query):
+        if isinstance(query[0], list):
+            query = query[0]
+
+        response = await self.gateway.http().post(self.config.base_merchant_path() + "/transactions/advanced_search_ids", {"search": self.__criteria(query)}, idempotent=True)
+        if "search_results" in response:
+            return AsyncResourceCollection(query, response, self.__fetch)
+        else:
+            raise RequestTimeoutError("search timeout")
+
+    async def submit_for_settlement(self, transaction_id, amount=None, params=None):
+        if params is None:
+            params = {}
+        Resource.verify_keys(params, Transaction.submit_for_settlement_signature)
+        transaction_params = {"amount": amount}
+        transaction_params.update(params)
+        return await self._put("/transactions/" + transaction_id + "/submit_for_settlement", {"transaction": transaction_params})
+
+    async def update_details(self, transaction_id, params=None):
+        if params is None:
+            params = {}
+        Resource.verify_keys(params, Transaction.update_details_signature)
+        return await self._put("/transactions/" + transaction_id + "/update_details", {"transaction": params})
+
+    async def void(self, transaction_id):
+        return await self._put("/transactions/" + transaction_id + "/void")
+
+    async def __fetch(self, query, ids):
+        criteria = self.__criteria(query)
+        criteria["ids"] = braintree.transaction_search.TransactionSearch.ids.in_list(ids).to_param()
+        response = await self.gateway.http().post(self.config.base_merchant_path() + "/transactions/advanced_search", {"search": criteria}, idempotent=True)
+        if "credit_card_transactions" in response:
+            return [Transaction(self.gateway, item) for item in ResourceCollection._extract_as_array(response["credit_card_transactions"], "transaction")]
+        else:
+            raise RequestTimeoutError("search timeout")
+
+    def __criteria(self, query):
+        criteria = {}
+        for term in query:
+            if criteria.get(term.name):
+                criteria[term.name] = dict(list(criteria[term.name].items()) + list(term.to_param().items()))
+            else:
+                criteria[term.name] = term.to_param()
+        return criteria
+
+    async def _post(self, url, params=None):
+        if params is None:
+            params = {}
+        response = await self.gateway.http().post(self.config.base_merchant_path() + url, params)
+        return self.__result(response)
+
+    async def _put(self, url, params=None):
+        response = await self.gateway.http().put(self.config.base_merchant_path() + url, params)
+        return self.__result(response)
+
+    def __result(self, response):
+        if "transaction" in response:
+            return SuccessfulResult({"transaction": Transaction(self.gateway, response["transaction"])})
+        elif "api_error_response" in response:
+            return ErrorResult(self.gateway, response["api_error_response"])
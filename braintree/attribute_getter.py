@@ -32,3 +32,49 @@ class AttributeGetter(object):
                                 for attr in detail_list
                                     if hasattr(self, attr))
         return "<%s {%s} at %d>" % (self.__class__.__name__, details, id(self))
+
+    def _defer(self, name, raw_value):
+        """
+        Stores ``raw_value`` to be built into the attribute ``name`` by the
+        class's :class:`LazyAttribute` of that name when it is first read.
+        """
+        self.__dict__.pop(name, None)
+        lazy_attributes = self.__dict__.get("_lazy_attributes")
+        if lazy_attributes is None:
+            lazy_attributes = self._lazy_attributes = {}
+        lazy_attributes[name] = raw_value
+
+class LazyAttribute(object):
+    """
+    An attribute built from its raw value the first time it is read, then
+    cached on the instance. Resources use it for nested objects and
+    amounts so that reading a few fields does not pay for the rest::
+
+        class Transaction(Resource):
+            billing_details = LazyAttribute("billing_details", lambda transaction, billing: Address(transaction.gateway, billing))
+
+            def __init__(self, gateway, attributes):
+                Resource.__init__(self, gateway, attributes)
+                if "billing" in attributes:
+                    self._defer("billing_details", attributes["billing"])
+
+    Reading the attribute when no raw value was deferred raises
+    AttributeError, as it would for a missing eager attribute. The raw value
+    is kept, so copies of a resource made before it is read each build their
+    own attribute, and builders must not modify it: threads reading an
+    attribute at once may each build it, and the first value stored is the
+    one every reader gets.
+    """
+
+    def __init__(self, name, build):
+        self.name = name
+        self.build = build
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        lazy_attributes = instance.__dict__.get("_lazy_attributes") or {}
+        if self.name not in lazy_attributes:
+            raise AttributeError("'%s' object has no attribute '%s'" % (owner.__name__, self.name))
+        value = self.build(instance, lazy_attributes[self.name])
+        return instance.__dict__.setdefault(self.name, value)
@@ -25,6 +25,7 @@ from braintree.us_bank_account_gateway import UsBankAccountGateway
 from braintree.us_bank_account_verification_gateway import UsBankAccountVerificationGateway
 from braintree.webhook_notification_gateway import WebhookNotificationGateway
 from braintree.webhook_testing_gateway import WebhookTestingGateway
+from braintree.util.instrumentation import InstrumentedGateway
 import braintree.configuration
 
 class BraintreeGateway(object):
@@ -36,7 +37,11 @@ class BraintreeGateway(object):
                 client_id=kwargs.get("client_id"),
                 client_secret=kwargs.get("client_secret"),
                 access_token=kwargs.get("access_token"),
-                http_strategy=kwargs.get("http_strategy")
+                http_strategy=kwargs.get("http_strategy"),
+                http_pool=kwargs.get("http_pool"),
+                metrics_sink=kwargs.get("metrics_sink"),
+                rate_limiter=kwargs.get("rate_limiter"),
+                retry_policy=kwargs.get("retry_policy")
             )
         self.add_on = AddOnGateway(self)
         self.address = AddressGateway(self)
@@ -65,3 +70,11 @@ class BraintreeGateway(object):
         self.verification = CreditCardVerificationGateway(self)
         self.webhook_notification = WebhookNotificationGateway(self)
         self.webhook_testing = WebhookTestingGateway(self)
+
+        if getattr(self.config, "metrics_sink", None) is not None:
+            self.__instrument(self.config.metrics_sink)
+
+    def __instrument(self, sink):
+        for name, gateway in list(vars(self).items()):
+            if name not in ("config", "graphql_client"):
+                setattr(self, name, InstrumentedGateway(gateway, name, sink))
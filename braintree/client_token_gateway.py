@@ -20,7 +20,7 @@ class ClientTokenGateway(object):
         if "version" not in params:
             params["version"] = 2
 
-        Resource.verify_keys(params, ClientToken.generate_signature())
+        Resource.verify_keys(params, ClientToken.generate_signature)
         params = {'client_token': params}
 
         response = self.config.http().post(self.config.base_merchant_path() + "/client_token", params)
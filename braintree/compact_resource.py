@@ -0,0 +1,184 @@
+import threading
+from braintree.attribute_getter import LazyAttribute
+
+_MISSING = object()
+_lock = threading.RLock()
+_compact_classes = {}
+
+class CompactResource(object):
+    """
+    Base of the compact form of resource classes, built by :func:`compact`.
+
+    A compact resource is an instance of a subclass of its resource's class, so
+    ``isinstance`` checks, methods, attributes and ``repr`` behave as they do on
+    the resource it was built from. Attribute names are stored once per class in a
+    shared field layout and each instance only holds a list of values, which makes
+    holding many search results in memory considerably cheaper.
+    """
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        # Names without a data descriptor would have gone to the instance dict.
+        if not hasattr(_class_attribute(type(self), name), "__set__"):
+            type(self)._add_field(name)
+        object.__setattr__(self, name, value)
+
+    def __copy__(self):
+        # Lazy fields are built in place, so each copy needs its own value list.
+        instance = object.__new__(type(self))
+        object.__setattr__(instance, "_values", list(self._values))
+        object.__setattr__(instance, "_built", self._built)
+        return instance
+
+    def __reduce__(self):
+        # The generated class cannot be found by name, so a compact resource is pickled as
+        # its resource class and field state and packed again when unpickled.
+        state = {"_setattrs": self._setattrs, "_lazy_attributes": {}}
+        values = self._values
+        for field in type(self)._fields:
+            if field.index < len(values) and values[field.index] is not _MISSING:
+                if field.build is None or self._built >> field.index & 1:
+                    state[field.name] = values[field.index]
+                else:
+                    state["_lazy_attributes"][field.name] = values[field.index]
+        return (_unpickle, (type(self)._resource_class, state))
+
+    @property
+    def _setattrs(self):
+        values = self._values
+        return [
+            field.name
+            for field in type(self)._setattr_fields
+            if field.index < len(values) and values[field.index] is not _MISSING
+        ]
+
+    @classmethod
+    def _add_field(cls, name):
+        with _lock:
+            field = cls.__dict__.get(name)
+            if not isinstance(field, _CompactField):
+                build = None
+                default = _class_attribute(cls, name)
+                if isinstance(default, LazyAttribute):
+                    build = default.build
+                    default = _MISSING
+                field = _CompactField(name, len(cls._fields), build, default)
+                cls._fields.append(field)
+                setattr(cls, name, field)
+            return field
+
+    @classmethod
+    def _pack(cls, state):
+        instance = object.__new__(cls)
+        values = []
+        built = 0
+        setattrs = state.get("_setattrs", ())
+        lazy_attributes = state.get("_lazy_attributes") or {}
+        for name, value in state.items():
+            if name not in ("_setattrs", "_lazy_attributes"):
+                field = cls._add_field(name)
+                if field.build is not None:
+                    built |= 1 << field.index
+                _store(values, field.index, value)
+        for name, raw_value in lazy_attributes.items():
+            _store(values, cls._add_field(name).index, raw_value)
+        for name in setattrs:
+            if name not in cls._setattr_names:
+                with _lock:
+                    if name not in cls._setattr_names:
+                        cls._setattr_fields.append(cls._add_field(name))
+                        cls._setattr_names.add(name)
+        object.__setattr__(instance, "_values", values)
+        object.__setattr__(instance, "_built", built)
+        return instance
+
+class _CompactField(object):
+    """ A data descriptor reading one slot of a compact resource's value list. """
+    __slots__ = ("name", "index", "build", "default")
+
+    def __init__(self, name, index, build, default):
+        self.name = name
+        self.index = index
+        self.build = build
+        self.default = default
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        values = instance._values
+        if self.index < len(values) and values[self.index] is not _MISSING:
+            if self.build is None or instance._built >> self.index & 1:
+                return values[self.index]
+            with _lock:
+                if not instance._built >> self.index & 1:
+                    values[self.index] = self.build(instance, values[self.index])
+                    instance._built |= 1 << self.index
+                return values[self.index]
+        if self.default is _MISSING:
+            raise AttributeError("'%s' object has no attribute '%s'" % (owner.__name__, self.name))
+        if hasattr(self.default, "__get__"):
+            return self.default.__get__(instance, owner)
+        return self.default
+
+    def __set__(self, instance, value):
+        _store(instance._values, self.index, value)
+        if self.build is not None:
+            instance._built |= 1 << self.index
+
+    def __delete__(self, instance):
+        values = instance._values
+        if self.index >= len(values) or values[self.index] is _MISSING:
+            raise AttributeError(self.name)
+        values[self.index] = _MISSING
+
+def _class_attribute(cls, name):
+    for klass in cls.__mro__:
+        if name in klass.__dict__:
+            return klass.__dict__[name]
+    return _MISSING
+
+def _store(values, index, value):
+    if index >= len(values):
+        values.extend([_MISSING] * (index + 1 - len(values)))
+    values[index] = value
+
+def _compact_class(resource_class):
+    with _lock:
+        compact_class = _compact_classes.get(resource_class)
+        if compact_class is None:
+            compact_class = type(resource_class.__name__, (CompactResource, resource_class), {
+                "__slots__": ("_values", "_built"),
+                "__module__": resource_class.__module__,
+                "__qualname__": resource_class.__qualname__,
+                "_resource_class": resource_class,
+                "_fields": [],
+                "_setattr_fields": [],
+                "_setattr_names": set()
+            })
+            # Lazy attributes are shadowed up front so that reading one that was
+            # never set does not fall through to the resource's instance dict.
+            for klass in reversed(resource_class.__mro__):
+                for name, value in list(klass.__dict__.items()):
+                    if isinstance(value, LazyAttribute):
+                        compact_class._add_field(name)
+            _compact_classes[resource_class] = compact_class
+        return compact_class
+
+def _unpickle(resource_class, state):
+    return _compact_class(resource_class)._pack(state)
+
+def compact(resource):
+    """
+    Returns the compact form of ``resource``, which has the same attributes and
+    ``repr`` but stores its values against a field layout shared by every compact
+    resource of its class::
+
+        transactions = [compact(transaction) for transaction in collection]
+
+    Usually reached through :meth:`ResourceCollection.compact` or
+    :meth:`PaginatedCollection.compact`. Returns ``resource`` itself when it is
+    already compact.
+    """
+    if isinstance(resource, CompactResource):
+        return resource
+    return _compact_class(type(resource))._pack(resource.__dict__)
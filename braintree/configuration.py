@@ -1,8 +1,11 @@
+import os
+import threading
 import braintree
 from braintree.credentials_parser import CredentialsParser
 from braintree.environment import Environment
 from braintree.exceptions.configuration_error import ConfigurationError
 from braintree.util.graphql_client import GraphQLClient
+from braintree.util.http_pool import HttpPool
 
 
 class Configuration(object):
@@ -18,6 +21,11 @@ class Configuration(object):
         )
     """
 
+    __gateway_lock = threading.Lock()
+    # Shared by every instance so that configurations stay picklable.
+    __http_pool_lock = threading.Lock()
+    __cached_gateway = None
+
     @staticmethod
     def configure(environment, merchant_id, public_key, private_key, **kwargs):
         Configuration.environment = Environment.parse_environment(environment)
@@ -27,6 +35,12 @@ class Configuration(object):
         Configuration.default_http_strategy = kwargs.get("http_strategy", None)
         Configuration.timeout = kwargs.get("timeout", 60)
         Configuration.wrap_http_exceptions = kwargs.get("wrap_http_exceptions", False)
+        Configuration.default_http_pool = kwargs.get("http_pool", None)
+        Configuration.stream_request_body = kwargs.get("stream_request_body", False)
+        Configuration.retry_policy = kwargs.get("retry_policy", None)
+        Configuration.rate_limiter = kwargs.get("rate_limiter", None)
+        Configuration.metrics_sink = kwargs.get("metrics_sink", None)
+        Configuration.webhook_keys = tuple(tuple(key) for key in kwargs.get("webhook_keys") or ())
 
     @staticmethod
     def for_partner(environment, partner_id, public_key, private_key, **kwargs):
@@ -37,12 +51,47 @@ class Configuration(object):
             private_key=private_key,
             http_strategy=kwargs.get("http_strategy", None),
             timeout=kwargs.get("timeout", 60),
-            wrap_http_exceptions=kwargs.get("wrap_http_exceptions", False)
+            wrap_http_exceptions=kwargs.get("wrap_http_exceptions", False),
+            http_pool=kwargs.get("http_pool", None),
+            stream_request_body=kwargs.get("stream_request_body", False),
+            retry_policy=kwargs.get("retry_policy", None),
+            rate_limiter=kwargs.get("rate_limiter", None),
+            metrics_sink=kwargs.get("metrics_sink", None),
+            webhook_keys=kwargs.get("webhook_keys", ())
         )
 
     @staticmethod
     def gateway():
-        return braintree.braintree_gateway.BraintreeGateway(config=Configuration.instantiate())
+        """
+        Returns the gateway used by the static API. The gateway is built once per process and reused until
+        the static configuration changes.
+        """
+        settings = Configuration.__static_settings()
+        with Configuration.__gateway_lock:
+            cached = Configuration.__cached_gateway
+            if cached is None or cached[0] != os.getpid() or cached[1] != settings:
+                gateway = braintree.braintree_gateway.BraintreeGateway(config=Configuration.instantiate())
+                Configuration.__cached_gateway = (os.getpid(), settings, gateway)
+                return gateway
+            return cached[2]
+
+    @staticmethod
+    def __static_settings():
+        return (
+            getattr(Configuration, "environment", None),
+            getattr(Configuration, "merchant_id", None),
+            getattr(Configuration, "public_key", None),
+            getattr(Configuration, "private_key", None),
+            getattr(Configuration, "default_http_strategy", None),
+            getattr(Configuration, "timeout", None),
+            getattr(Configuration, "wrap_http_exceptions", None),
+            getattr(Configuration, "default_http_pool", None),
+            getattr(Configuration, "stream_request_body", None),
+            getattr(Configuration, "retry_policy", None),
+            getattr(Configuration, "rate_limiter", None),
+            getattr(Configuration, "metrics_sink", None),
+            getattr(Configuration, "webhook_keys", ())
+        )
 
     @staticmethod
     def instantiate():
@@ -53,7 +102,13 @@ class Configuration(object):
             private_key=Configuration.private_key,
             http_strategy=Configuration.default_http_strategy,
             timeout=Configuration.timeout,
-            wrap_http_exceptions=Configuration.wrap_http_exceptions
+            wrap_http_exceptions=Configuration.wrap_http_exceptions,
+            http_pool=Configuration.default_http_pool,
+            stream_request_body=Configuration.stream_request_body,
+            retry_policy=Configuration.retry_policy,
+            rate_limiter=Configuration.rate_limiter,
+            metrics_sink=Configuration.metrics_sink,
+            webhook_keys=getattr(Configuration, "webhook_keys", ())
         )
 
     @staticmethod
@@ -101,6 +156,12 @@ class Configuration(object):
         self.access_token = parser.access_token
         self.timeout = kwargs.get("timeout", 60)
         self.wrap_http_exceptions = kwargs.get("wrap_http_exceptions", False)
+        self._http_pool = kwargs.get("http_pool", None)
+        self.stream_request_body = kwargs.get("stream_request_body", False)
+        self.retry_policy = kwargs.get("retry_policy", None)
+        self.rate_limiter = kwargs.get("rate_limiter", None)
+        self.metrics_sink = kwargs.get("metrics_sink", None)
+        self.webhook_keys = tuple(tuple(key) for key in kwargs.get("webhook_keys") or ())
 
         http_strategy = kwargs.get("http_strategy", None)
 
@@ -121,6 +182,13 @@ class Configuration(object):
     def http(self):
         return braintree.util.http.Http(self)
 
+    def http_pool(self):
+        if self._http_pool is None:
+            with Configuration.__http_pool_lock:
+                if self._http_pool is None:
+                    self._http_pool = HttpPool()
+        return self._http_pool
+
     def graphql_client(self):
         return GraphQLClient(self)
 
@@ -16,7 +16,7 @@ class CreditCardGateway(object):
     def create(self, params=None):
         if params is None:
             params = {}
-        Resource.verify_keys(params, CreditCard.create_signature())
+        Resource.verify_keys(params, CreditCard.create_signature)
         return self._post("/payment_methods", {"credit_card": params})
 
     def delete(self, credit_card_token):
@@ -58,7 +58,7 @@ class CreditCardGateway(object):
     def update(self, credit_card_token, params=None):
         if params is None:
             params = {}
-        Resource.verify_keys(params, CreditCard.update_signature())
+        Resource.verify_keys(params, CreditCard.update_signature)
         response = self.config.http().put(self.config.base_merchant_path() + "/payment_methods/credit_card/" + credit_card_token, {"credit_card": params})
         if "credit_card" in response:
             return SuccessfulResult({"credit_card": CreditCard(self.gateway, response["credit_card"])})
@@ -55,16 +55,20 @@ class CreditCardVerification(AttributeGetter):
             self.three_d_secure_info = None
 
     @staticmethod
-    def find(verification_id):
-        return Configuration.gateway().verification.find(verification_id)
+    def find(verification_id, raw=False):
+        return Configuration.gateway().verification.find(verification_id, raw=raw)
 
     @staticmethod
-    def search(*query):
-        return Configuration.gateway().verification.search(*query)
+    def find_many(verification_ids, **options):
+        return Configuration.gateway().verification.find_many(verification_ids, **options)
+
+    @staticmethod
+    def search(*query, raw=False, checkpoint=None):
+        return Configuration.gateway().verification.search(*query, raw=raw, checkpoint=checkpoint)
 
     @staticmethod
     def create(params):
-        Resource.verify_keys(params, CreditCardVerification.create_signature())
+        Resource.verify_keys(params, CreditCardVerification.create_signature)
         return Configuration.gateway().verification.create(params)
 
     @staticmethod
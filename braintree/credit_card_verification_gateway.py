@@ -1,8 +1,10 @@
 from braintree.credit_card_verification import CreditCardVerification
 from braintree.credit_card_verification_search import CreditCardVerificationSearch
 from braintree.exceptions.not_found_error import NotFoundError
+from braintree.find_many_result import FindManyResult
 from braintree.ids_search import IdsSearch
 from braintree.resource_collection import ResourceCollection
+from braintree.search_checkpoint import SearchCheckpoint
 from braintree.error_result import ErrorResult
 from braintree.successful_result import SuccessfulResult
 
@@ -12,15 +14,21 @@ class CreditCardVerificationGateway(object):
         self.gateway = gateway
         self.config = gateway.config
 
-    def find(self, verification_id):
+    def find(self, verification_id, raw=False):
         try:
             if verification_id is None or verification_id.strip() == "":
                 raise NotFoundError()
             response = self.config.http().get(self.config.base_merchant_path() + "/verifications/" + verification_id)
+            if raw:
+                return response["verification"]
             return CreditCardVerification(self.gateway, response["verification"])
         except NotFoundError:
             raise NotFoundError("Verification with id " + repr(verification_id) + " not found")
 
+    def find_many(self, verification_ids, raw=False, chunk_size=50, workers=4):
+        """ Finds the credit card verifications with the given ids in concurrent chunks. See :meth:`TransactionGateway.find_many <braintree.transaction_gateway.TransactionGateway.find_many>`. """
+        return FindManyResult.fetch(verification_ids, self.__fetch_raw if raw else self.__fetch, chunk_size, workers)
+
     def __criteria(self, query):
         criteria = {}
         for term in query:
@@ -31,24 +39,27 @@ class CreditCardVerificationGateway(object):
         return criteria
 
     def __fetch(self, query, ids):
+        return [CreditCardVerification(self.gateway, item) for item in self.__fetch_raw(query, ids)]
+
+    def __fetch_raw(self, query, ids):
         criteria = self.__criteria(query)
         criteria["ids"] = CreditCardVerificationSearch.ids.in_list(ids).to_param()
-        response = self.config.http().post(self.config.base_merchant_path() + "/verifications/advanced_search", {"search": criteria})
-        return [CreditCardVerification(self.gateway, item) for item in
-                ResourceCollection._extract_as_array(response["credit_card_verifications"], "verification")]
+        response = self.config.http().post(self.config.base_merchant_path() + "/verifications/advanced_search", {"search": criteria}, idempotent=True)
+        return ResourceCollection._extract_as_array(response["credit_card_verifications"], "verification")
 
 
-    def search(self, *query):
+    def search(self, *query, raw=False, checkpoint=None):
         if isinstance(query[0], list):
             query = query[0]
 
-        response = self.config.http().post(self.config.base_merchant_path() + "/verifications/advanced_search_ids", {"search": self.__criteria(query)})
-        return ResourceCollection(query, response, self.__fetch)
+        criteria = self.__criteria(query)
+        response, search_checkpoint = SearchCheckpoint.run(checkpoint, "verifications", criteria, lambda: self.config.http().post(self.config.base_merchant_path() + "/verifications/advanced_search_ids", {"search": criteria}, idempotent=True))
+        return ResourceCollection(query, response, self.__fetch_raw if raw else self.__fetch, self.__fetch_raw, search_checkpoint)
 
     def __fetch_verifications(self, query, verification_ids):
         criteria = {}
         criteria["ids"] = IdsSearch.ids.in_list(verification_ids).to_param()
-        response = self.config.http().post(self.config.base_merchant_path() + "/verifications/advanced_search", {"search": criteria})
+        response = self.config.http().post(self.config.base_merchant_path() + "/verifications/advanced_search", {"search": criteria}, idempotent=True)
         return [CreditCardVerification(self.gateway, item) for item in ResourceCollection._extract_as_array(response["credit_card_verifications"], "verification")]
 
     def create(self, params):
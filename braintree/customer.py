@@ -89,9 +89,9 @@ class Customer(Resource):
         return super(Customer, self).__repr__(detail_list)
 
     @staticmethod
-    def all():
-        """ Return a collection of all customers. """
-        return Configuration.gateway().customer.all()
+    def all(raw=False, checkpoint=None):
+        """ Return a collection of all customers, or of their parsed response dicts with ``raw=True``. """
+        return Configuration.gateway().customer.all(raw=raw, checkpoint=checkpoint)
 
     @staticmethod
     def create(params=None):
@@ -124,20 +124,24 @@ class Customer(Resource):
         return Configuration.gateway().customer.delete(customer_id)
 
     @staticmethod
-    def find(customer_id, association_filter_id=None):
+    def find(customer_id, association_filter_id=None, raw=False):
         """
         Find an customer, given a customer_id.  This does not return a result
         object.  This will raise a :class:`NotFoundError <braintree.exceptions.not_found_error.NotFoundError>` if the provided customer_id
-        is not found. ::
+        is not found. With ``raw=True`` the parsed response dict is returned instead of a Customer. ::
 
             customer = braintree.Customer.find("my_customer_id")
         """
 
-        return Configuration.gateway().customer.find(customer_id, association_filter_id)
+        return Configuration.gateway().customer.find(customer_id, association_filter_id, raw=raw)
 
     @staticmethod
-    def search(*query):
-        return Configuration.gateway().customer.search(*query)
+    def find_many(customer_ids, **options):
+        return Configuration.gateway().customer.find_many(customer_ids, **options)
+
+    @staticmethod
+    def search(*query, raw=False, checkpoint=None):
+        return Configuration.gateway().customer.search(*query, raw=raw, checkpoint=checkpoint)
 
     @staticmethod
     def update(customer_id, params=None):
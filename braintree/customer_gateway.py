@@ -2,9 +2,11 @@ import braintree
 from braintree.customer import Customer
 from braintree.error_result import ErrorResult
 from braintree.exceptions.not_found_error import NotFoundError
+from braintree.find_many_result import FindManyResult
 from braintree.ids_search import IdsSearch
 from braintree.resource import Resource
 from braintree.resource_collection import ResourceCollection
+from braintree.search_checkpoint import SearchCheckpoint
 from braintree.successful_result import SuccessfulResult
 
 
@@ -13,21 +15,21 @@ class CustomerGateway(object):
         self.gateway = gateway
         self.config = gateway.config
 
-    def all(self):
-        response = self.config.http().post(self.config.base_merchant_path() + "/customers/advanced_search_ids")
-        return ResourceCollection({}, response, self.__fetch)
+    def all(self, raw=False, checkpoint=None):
+        response, search_checkpoint = SearchCheckpoint.run(checkpoint, "customers", {}, lambda: self.config.http().post(self.config.base_merchant_path() + "/customers/advanced_search_ids", idempotent=True))
+        return ResourceCollection({}, response, self.__fetch_raw if raw else self.__fetch, self.__fetch_raw, search_checkpoint)
 
     def create(self, params=None):
         if params is None:
             params = {}
-        Resource.verify_keys(params, Customer.create_signature())
+        Resource.verify_keys(params, Customer.create_signature)
         return self._post("/customers", {"customer": params})
 
     def delete(self, customer_id):
         self.config.http().delete(self.config.base_merchant_path() + "/customers/" + customer_id)
         return SuccessfulResult()
 
-    def find(self, customer_id, association_filter_id=None):
+    def find(self, customer_id, association_filter_id=None, raw=False):
         try:
             if customer_id is None or customer_id.strip() == "":
                 raise NotFoundError()
@@ -37,21 +39,28 @@ class CustomerGateway(object):
                 query_params = "?association_filter_id=" + association_filter_id
 
             response = self.config.http().get(self.config.base_merchant_path() + "/customers/" + customer_id + query_params)
+            if raw:
+                return response["customer"]
             return Customer(self.gateway, response["customer"])
         except NotFoundError:
             raise NotFoundError("customer with id " + repr(customer_id) + " not found")
 
-    def search(self, *query):
+    def find_many(self, customer_ids, raw=False, chunk_size=50, workers=4):
+        """ Finds the customers with the given ids in concurrent chunks. See :meth:`TransactionGateway.find_many <braintree.transaction_gateway.TransactionGateway.find_many>`. """
+        return FindManyResult.fetch(customer_ids, self.__fetch_raw if raw else self.__fetch, chunk_size, workers)
+
+    def search(self, *query, raw=False, checkpoint=None):
         if isinstance(query[0], list):
             query = query[0]
 
-        response = self.config.http().post(self.config.base_merchant_path() + "/customers/advanced_search_ids", {"search": self.__criteria(query)})
-        return ResourceCollection(query, response, self.__fetch)
+        criteria = self.__criteria(query)
+        response, search_checkpoint = SearchCheckpoint.run(checkpoint, "customers", criteria, lambda: self.config.http().post(self.config.base_merchant_path() + "/customers/advanced_search_ids", {"search": criteria}, idempotent=True))
+        return ResourceCollection(query, response, self.__fetch_raw if raw else self.__fetch, self.__fetch_raw, search_checkpoint)
 
     def update(self, customer_id, params=None):
         if params is None:
             params = {}
-        Resource.verify_keys(params, Customer.update_signature())
+        Resource.verify_keys(params, Customer.update_signature)
         response = self.config.http().put(self.config.base_merchant_path() + "/customers/" + customer_id, {"customer": params})
         if "customer" in response:
             return SuccessfulResult({"customer": Customer(self.gateway, response["customer"])})
@@ -68,10 +77,13 @@ class CustomerGateway(object):
         return criteria
 
     def __fetch(self, query, ids):
+        return [Customer(self.gateway, item) for item in self.__fetch_raw(query, ids)]
+
+    def __fetch_raw(self, query, ids):
         criteria = self.__criteria(query)
         criteria["ids"] = braintree.customer_search.CustomerSearch.ids.in_list(ids).to_param()
-        response = self.config.http().post(self.config.base_merchant_path() + "/customers/advanced_search", {"search": criteria})
-        return [Customer(self.gateway, item) for item in ResourceCollection._extract_as_array(response["customers"], "customer")]
+        response = self.config.http().post(self.config.base_merchant_path() + "/customers/advanced_search", {"search": criteria}, idempotent=True)
+        return ResourceCollection._extract_as_array(response["customers"], "customer")
 
     def _post(self, url, params=None):
         if params is None:
@@ -1,5 +1,5 @@
 from decimal import Decimal
-from braintree.attribute_getter import AttributeGetter
+from braintree.attribute_getter import AttributeGetter, LazyAttribute
 from braintree.transaction_details import TransactionDetails
 from braintree.dispute_details import DisputeEvidence, DisputeStatusHistory
 from braintree.configuration import Configuration
@@ -162,21 +162,22 @@ class Dispute(AttributeGetter):
 
         return Configuration.gateway().dispute.search(*query)
 
+    amount = LazyAttribute("amount", lambda dispute, amount: Decimal(amount) if amount is not None else amount)
+    amount_disputed = LazyAttribute("amount_disputed", lambda dispute, amount: Decimal(amount) if amount is not None else amount)
+    amount_won = LazyAttribute("amount_won", lambda dispute, amount: Decimal(amount) if amount is not None else amount)
+    transaction_details = LazyAttribute("transaction_details", lambda dispute, transaction: TransactionDetails(transaction))
+    transaction = LazyAttribute("transaction", lambda dispute, _: dispute.transaction_details)
+    evidence = LazyAttribute("evidence", lambda dispute, evidence: [DisputeEvidence(item) for item in evidence] if evidence is not None else evidence)
+    status_history = LazyAttribute("status_history", lambda dispute, status_history: [DisputeStatusHistory(item) for item in status_history] if status_history is not None else status_history)
+
     def __init__(self, attributes):
         AttributeGetter.__init__(self, attributes)
 
-        if "amount" in attributes and getattr(self, "amount", None) is not None:
-            self.amount = Decimal(self.amount)
-        if "amount_disputed" in attributes and getattr(self, "amount_disputed", None) is not None:
-            self.amount_disputed = Decimal(self.amount_disputed)
-        if "amount_won" in attributes and getattr(self, "amount_won", None) is not None:
-            self.amount_won = Decimal(self.amount_won)
+        for name in ("amount", "amount_disputed", "amount_won", "evidence", "status_history"):
+            if name in attributes:
+                self._defer(name, attributes[name])
         if "transaction" in attributes:
-            self.transaction_details = TransactionDetails(attributes.pop("transaction"))
-            self.transaction = self.transaction_details
-        if "evidence" in attributes and getattr(self, "evidence", None) is not None:
-            self.evidence = [DisputeEvidence(evidence) for evidence in self.evidence]
-        if "status_history" in attributes and getattr(self, "status_history", None) is not None:
-            self.status_history = [DisputeStatusHistory(status_history) for status_history in self.status_history]
+            self._defer("transaction_details", attributes["transaction"])
+            self._defer("transaction", None)
         if "processor_comments" in attributes and self.processor_comments is not None:
             self.forwarded_comments = self.processor_comments
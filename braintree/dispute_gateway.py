@@ -138,13 +138,14 @@ class DisputeGateway(object):
         if isinstance(query[0], list):
             query = query[0]
 
-        self.search_criteria = self.__criteria(query)
+        criteria = self.__criteria(query)
+        self.search_criteria = criteria
 
-        pc = PaginatedCollection(self.__fetch_disputes)
+        pc = PaginatedCollection(lambda page: self.__fetch_disputes(criteria, page))
         return SuccessfulResult({"disputes": pc})
 
-    def __fetch_disputes(self, page):
-        response = self.config.http().post(self.config.base_merchant_path() + "/disputes/advanced_search?page=" + str(page), {"search": self.search_criteria})
+    def __fetch_disputes(self, criteria, page):
+        response = self.config.http().post(self.config.base_merchant_path() + "/disputes/advanced_search?page=" + str(page), {"search": criteria}, idempotent=True)
         body = response["disputes"]
 
         disputes = [Dispute(item) for item in ResourceCollection._extract_as_array(response["disputes"], "dispute")]
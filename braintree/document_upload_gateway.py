@@ -14,7 +14,7 @@ class DocumentUploadGateway(object):
     def create(self, params=None):
         if params is None:
             params = {}
-        Resource.verify_keys(params, DocumentUpload.create_signature())
+        Resource.verify_keys(params, DocumentUpload.create_signature)
 
         if "file" in params and not hasattr(params["file"], "read"):
             raise ValueError("file must be a file handle")
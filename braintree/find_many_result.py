@@ -0,0 +1,67 @@
+from collections import OrderedDict
+from braintree.util.read_ahead import read_ahead
+
+class FindManyResult(object):
+    """
+    An instance of this class is returned from ``find_many``. It holds the resources that were
+    found in the order their ids were given, and the ids that were not found::
+
+        result = braintree.Transaction.find_many(["id1", "id2", "missing"])
+        for transaction in result:
+            print(transaction.id)
+        print(result.missing_ids)   # ["missing"]
+
+    Each id appears once, at its first position in the given ids; None and blank ids are
+    skipped.
+    """
+
+    def __init__(self, resources, missing_ids):
+        self.resources = resources
+        self.missing_ids = missing_ids
+
+    @staticmethod
+    def fetch(ids, method, chunk_size, workers):
+        """
+        Fetches ``ids`` with ``method(query, ids)`` in chunks of ``chunk_size``, running up to
+        ``workers`` chunks at a time, and returns the :class:`FindManyResult`.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+
+        ids = list(ids)
+        unique_ids = list(OrderedDict.fromkeys(resource_id for resource_id in ids if FindManyResult.__is_id(resource_id)))
+        chunks = [([], unique_ids[i:i + chunk_size]) for i in range(0, len(unique_ids), chunk_size)]
+
+        found = {}
+        if len(chunks) == 1:
+            pages = [method(*chunks[0])]
+        else:
+            pages = read_ahead(method, chunks, max(1, workers))
+        for page in pages:
+            for item in page:
+                found[item["id"] if isinstance(item, dict) else item.id] = item
+
+        resources = OrderedDict((resource_id, found[resource_id]) for resource_id in unique_ids if resource_id in found)
+        missing_ids = [resource_id for resource_id in unique_ids if resource_id not in resources]
+        return FindManyResult(resources, missing_ids)
+
+    @staticmethod
+    def __is_id(resource_id):
+        if isinstance(resource_id, str):
+            return resource_id.strip() != ""
+        return resource_id is not None
+
+    @property
+    def items(self):
+        """ Returns the resources that were found, in the order their ids were given. """
+        return list(self.resources.values())
+
+    def get(self, resource_id, default=None):
+        """ Returns the resource with ``resource_id``, or ``default`` when it was not found. """
+        return self.resources.get(resource_id, default)
+
+    def __iter__(self):
+        return iter(self.resources.values())
+
+    def __len__(self):
+        return len(self.resources)
@@ -16,13 +16,13 @@ class MerchantAccountGateway(object):
     def create(self, params=None):
         if params is None:
             params = {}
-        Resource.verify_keys(params, MerchantAccountGateway._create_signature())
+        Resource.verify_keys(params, MerchantAccountGateway._create_signature)
         return self._post("/merchant_accounts/create_via_api", {"merchant_account": params})
 
     def update(self, merchant_account_id, params=None):
         if params is None:
             params = {}
-        Resource.verify_keys(params, MerchantAccountGateway._update_signature())
+        Resource.verify_keys(params, MerchantAccountGateway._update_signature)
         return self._put("/merchant_accounts/%s/update_via_api" % merchant_account_id, {"merchant_account": params})
 
     def find(self, merchant_account_id):
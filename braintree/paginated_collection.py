@@ -1,4 +1,7 @@
 import braintree
+from braintree.compact_resource import compact
+from braintree.paginated_result import PaginatedResult
+from braintree.util.read_ahead import read_ahead
 
 class PaginatedCollection(object):
     """
@@ -29,5 +32,41 @@ class PaginatedCollection(object):
             if current_page * results.page_size >= total_items:
                 break
 
+    def prefetch(self, workers=4):
+        """
+        Returns a generator over all of the results that, once the first page reports the total number of
+        items, fetches the remaining pages in parallel on up to ``workers`` threads. Items are yielded in
+        page order::
+
+            for dispute in braintree.Dispute.search(search_criteria).disputes.prefetch(workers=8):
+                print(dispute.id)
+        """
+        results = self.__method(1)
+        for item in results.current_page:
+            yield item
+
+        if results.page_size <= 0:
+            return
+
+        last_page = -(-results.total_items // results.page_size)
+        pages = ((page,) for page in range(2, last_page + 1))
+        for page_results in read_ahead(self.__method, pages, workers):
+            for item in page_results.current_page:
+                yield item
+
+    def compact(self):
+        """
+        Returns a collection over the same results whose items are compact resources, which
+        have the same attributes as the resources :attr:`items` yields but share their field
+        layout, so that holding many results in memory costs much less.
+        """
+        method = self.__method
+
+        def fetch_compact(page):
+            results = method(page)
+            return PaginatedResult(results.total_items, results.page_size, [compact(item) for item in results.current_page])
+
+        return PaginatedCollection(fetch_compact)
+
     def __iter__(self):
         return self.items
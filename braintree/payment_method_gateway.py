@@ -35,7 +35,7 @@ class PaymentMethodGateway(object):
     def create(self, params=None):
         if params is None:
             params = {}
-        Resource.verify_keys(params, PaymentMethod.create_signature())
+        Resource.verify_keys(params, PaymentMethod.create_signature)
         return self._post("/payment_methods", {"payment_method": params})
 
     def find(self, payment_method_token):
@@ -49,7 +49,7 @@ class PaymentMethodGateway(object):
             raise NotFoundError("payment method with token " + repr(payment_method_token) + " not found")
 
     def update(self, payment_method_token, params):
-        Resource.verify_keys(params, PaymentMethod.update_signature())
+        Resource.verify_keys(params, PaymentMethod.update_signature)
         try:
             if payment_method_token is None or payment_method_token.strip() == "":
                 raise NotFoundError()
@@ -64,7 +64,7 @@ class PaymentMethodGateway(object):
     def delete(self, payment_method_token, options=None):
         if options is None:
             options = {}
-        Resource.verify_keys(options, PaymentMethod.delete_signature())
+        Resource.verify_keys(options, PaymentMethod.delete_signature)
         query_param = ""
         if options:
             if 'revoke_all_grants' in options:
@@ -14,8 +14,7 @@ class PaymentMethodNonceGateway(object):
 
     def create(self, payment_method_token, params = {"payment_method_nonce": {}}):
         try:
-            schema = [{"payment_method_nonce": ["merchant_account_id", "authentication_insight", {"authentication_insight_options": ["amount", "recurring_customer_consent", "recurring_max_amount"]}]}]
-            Resource.verify_keys(params, schema)
+            Resource.verify_keys(params, PaymentMethodNonceGateway._create_signature)
             response = self.config.http().post(self.config.base_merchant_path() + "/payment_methods/" + payment_method_token + "/nonces", params)
             if "api_error_response" in response:
                 return ErrorResult(self.gateway, response["api_error_response"])
@@ -35,5 +34,9 @@ class PaymentMethodNonceGateway(object):
         except NotFoundError:
             raise NotFoundError("payment method nonce with id " + repr(payment_method_nonce) + " not found")
 
+    @staticmethod
+    def _create_signature():
+        return [{"payment_method_nonce": ["merchant_account_id", "authentication_insight", {"authentication_insight_options": ["amount", "recurring_customer_consent", "recurring_max_amount"]}]}]
+
     def _parse_payment_method_nonce(self, response):
         return PaymentMethodNonce(self.gateway, response["payment_method_nonce"])
@@ -29,7 +29,7 @@ class PayPalAccountGateway(object):
     def update(self, paypal_account_token, params=None):
         if params is None:
             params = {}
-        Resource.verify_keys(params, PayPalAccount.signature())
+        Resource.verify_keys(params, PayPalAccount.signature)
         response = self.config.http().put(self.config.base_merchant_path() + "/payment_methods/paypal_account/" + paypal_account_token, {"paypal_account": params})
         if "paypal_account" in response:
             return SuccessfulResult({"paypal_account": PayPalAccount(self.gateway, response["paypal_account"])})
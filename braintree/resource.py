@@ -1,7 +1,10 @@
 import re
 import string
 import sys
+import threading
+from collections import OrderedDict
 from braintree.attribute_getter import AttributeGetter
+from braintree.util.instrumentation import current_timing
 
 text_type = str
 raw_type = bytes
@@ -9,56 +12,155 @@ raw_type = bytes
 class Resource(AttributeGetter):
     @staticmethod
     def verify_keys(params, signature):
-        allowed_keys = Resource.__flattened_signature(signature)
-        params_keys = Resource.__flattened_params_keys(params)
+        """
+        Raises KeyError when ``params`` has keys outside ``signature``. ``signature`` is
+        either a signature list or a function returning one, such as
+        ``Transaction.create_signature``; a function is called and compiled once.
+        """
+        timing = current_timing()
+        if timing is None:
+            Resource.__verify_keys(params, signature)
+        else:
+            with timing.phase("verify_keys"):
+                Resource.__verify_keys(params, signature)
 
-        invalid_keys = [key for key in params_keys if key not in allowed_keys]
-        invalid_keys = Resource.__remove_wildcard_keys(allowed_keys, invalid_keys)
+    @staticmethod
+    def __verify_keys(params, signature):
+        compiled = Resource.__compiled_signature(signature)
+        invalid_keys = [key for key in compiled.invalid_keys(params) if not compiled.allows_flattened_key(key)]
 
         if len(invalid_keys) > 0:
             keys_string = ", ".join(invalid_keys)
             raise KeyError("Invalid keys: " + keys_string)
 
     @staticmethod
-    def __flattened_params_keys(params, parent=None):
-        if isinstance(params, text_type) or isinstance(params, raw_type):
-            return [ "%s[%s]" % (parent, params) ]
-        else:
-            keys = []
-            for key, val in params.items():
-                full_key = "%s[%s]" % (parent, key) if parent else key
-                if isinstance(val, dict):
-                    keys += Resource.__flattened_params_keys(val, full_key)
-                elif isinstance(val, list):
-                    for item in val:
-                        keys += Resource.__flattened_params_keys(item, full_key)
-                else:
-                    keys.append(full_key)
-            return keys
+    def __compiled_signature(signature):
+        if callable(signature):
+            compiled = _compiled_signature_methods.get(signature)
+            if compiled is None:
+                compiled = _compiled_signature_methods[signature] = _CompiledSignature(signature())
+            return compiled
 
-    @staticmethod
-    def __flattened_signature(signature, parent=None):
-        flat_sig = []
+        # Signature lists are usually rebuilt for every call, so they are cached by their
+        # printed form, evicting the least recently used.
+        cache_key = repr(signature)
+        with _compiled_signatures_lock:
+            compiled = _compiled_signatures.get(cache_key)
+            if compiled is not None:
+                _compiled_signatures.move_to_end(cache_key)
+                return compiled
+        compiled = _CompiledSignature(signature)
+        with _compiled_signatures_lock:
+            _compiled_signatures[cache_key] = compiled
+            if len(_compiled_signatures) > _COMPILED_SIGNATURES_LIMIT:
+                _compiled_signatures.popitem(last=False)
+        return compiled
+
+    def __init__(self, gateway, attributes):
+        AttributeGetter.__init__(self, attributes)
+        self.gateway = gateway
+
+_COMPILED_SIGNATURES_LIMIT = 512
+
+_compiled_signatures = OrderedDict()
+_compiled_signatures_lock = threading.Lock()
+_compiled_signature_methods = {}
+
+_ANY_KEY = "__any_key__"
+
+_WILDCARD_SEGMENT = re.compile(r"[\w-]+\Z")
+
+class _SignatureNode(object):
+    __slots__ = ("children", "allowed", "wildcard")
+
+    def __init__(self):
+        self.children = {}
+        self.allowed = False
+        self.wildcard = None
+
+    def child(self, key):
+        node = self.children.get(key)
+        if node is None:
+            node = self.children[key] = _SignatureNode()
+        return node
+
+class _CompiledSignature(object):
+    """
+    A signature compiled into a trie of its keys. Params are validated by
+    walking the trie; only the keys that miss it are flattened into strings
+    and checked against the flattened signature and its ``__any_key__``
+    patterns, which keeps the results identical to matching flattened keys.
+    """
+
+    def __init__(self, signature):
+        self.root = _SignatureNode()
+        self.allowed_keys = set()
+        wildcard_patterns = []
+        self.__compile(signature, self.root, None, wildcard_patterns)
+        self.wildcard = re.compile(r"(?:%s)\Z" % "|".join(wildcard_patterns)) if wildcard_patterns else None
+
+    def __compile(self, signature, node, parent, wildcard_patterns):
         for item in signature:
             if isinstance(item, dict):
                 for key, val in item.items():
-                    full_key = '{0}[{1}]'.format(parent, key) if parent else key
-                    flat_sig += Resource.__flattened_signature(val, full_key)
+                    full_key = "{0}[{1}]".format(parent, key) if parent else key
+                    self.__compile(val, self.__child(node, key, parent), full_key, wildcard_patterns)
             else:
-                full_key = '{0}[{1}]'.format(parent, item) if parent else item
-                flat_sig.append(full_key)
-        return flat_sig
+                full_key = "{0}[{1}]".format(parent, item) if parent else item
+                self.__child(node, item, parent).allowed = True
+                self.allowed_keys.add(full_key)
+                if "[" + _ANY_KEY + "]" in full_key:
+                    wildcard_patterns.append(re.escape(full_key).replace(re.escape("[" + _ANY_KEY + "]"), r"\[[\w-]+\]"))
 
-    @staticmethod
-    def __remove_wildcard_keys(allowed_keys, invalid_keys):
-        wildcard_keys = [re.sub("(?<=[^\\\\])_", "\\_", re.escape(key)).replace("\\[\\_\\_any\\_key\\_\\_\\]", "\\[[\w-]+\\]") for key in allowed_keys if re.search("\\[__any_key__\\]", key)]
-        new_keys = []
-        for key in invalid_keys:
-            if len([match for match in wildcard_keys if re.match("\A" + match + "\Z", key)]) == 0:
-                new_keys.append(key)
-        return new_keys
+    def __child(self, node, key, parent):
+        if key == _ANY_KEY and parent:
+            if node.wildcard is None:
+                node.wildcard = _SignatureNode()
+            return node.wildcard
+        return node.child(key)
 
-    def __init__(self, gateway, attributes):
-        AttributeGetter.__init__(self, attributes)
-        self.gateway = gateway
+    def allows_flattened_key(self, key):
+        return key in self.allowed_keys or (self.wildcard is not None and self.wildcard.match(key) is not None)
+
+    def invalid_keys(self, params):
+        invalid_keys = []
+        self.__walk(params, self.root, None, invalid_keys)
+        return invalid_keys
+
+    def __walk(self, params, node, path, invalid_keys):
+        if isinstance(params, text_type) or isinstance(params, raw_type):
+            if not self.__allows(node, params):
+                invalid_keys.append("%s[%s]" % (_flattened_path(path), params))
+            return
+
+        for key, val in params.items():
+            child = self.__lookup(node, key)
+            if isinstance(val, dict):
+                self.__walk(val, child, (path, key), invalid_keys)
+            elif isinstance(val, list):
+                for item in val:
+                    self.__walk(item, child, (path, key), invalid_keys)
+            elif child is None or not child.allowed:
+                invalid_keys.append(_flattened_path((path, key)))
+
+    def __allows(self, node, key):
+        child = self.__lookup(node, key)
+        return child is not None and child.allowed
+
+    def __lookup(self, node, key):
+        if node is None:
+            return None
+        child = node.children.get(key)
+        if child is None and node.wildcard is not None and isinstance(key, text_type) and _WILDCARD_SEGMENT.match(key):
+            child = node.wildcard
+        return child
 
+def _flattened_path(path):
+    keys = []
+    while path is not None:
+        path, key = path
+        keys.append(key)
+    full_key = None
+    for key in reversed(keys):
+        full_key = "%s[%s]" % (full_key, key) if full_key else key
+    return full_key
@@ -1,5 +1,9 @@
+import copy
 import braintree
+from braintree.compact_resource import compact
 from braintree.exceptions.unexpected_error import UnexpectedError
+from braintree.util.columnar import ColumnFrame
+from braintree.util.read_ahead import read_ahead
 
 class ResourceCollection(object):
     """
@@ -10,11 +14,14 @@ class ResourceCollection(object):
             print transaction.id
     """
 
-    def __init__(self, query, results, method):
+    def __init__(self, query, results, method, raw_method=None, checkpoint=None):
         if "search_results" not in results:
             raise UnexpectedError("Unprocessable entity due to an invalid request")
         self.__ids = results["search_results"]["ids"]
         self.__method = method
+        self.__raw_method = raw_method
+        self.__checkpoint = checkpoint
+        self.__resume_batch = checkpoint.next_batch if checkpoint is not None else 0
         self.__page_size = results["search_results"]["page_size"]
         self.__query = query
 
@@ -33,10 +40,79 @@ class ResourceCollection(object):
 
     @property
     def items(self):
-        """ Returns a generator allowing iteration over all of the results. """
-        for batch in self.__batch_ids():
+        """
+        Returns a generator allowing iteration over all of the results. When the search was
+        resumed from a ``checkpoint``, the first iteration starts at the first batch not yet
+        consumed; once an iteration completes, the collection can be iterated again from the start.
+        """
+        for batch_index, batch in self.__checkpointed_batches():
             for item in self.__method(self.__query, batch):
                 yield item
+            self.__batch_consumed(batch_index)
+        self.__finish()
+
+    def prefetch(self, batches=4):
+        """
+        Returns a generator over all of the results that fetches up to ``batches`` pages ahead in parallel
+        while the current page is consumed. Items are yielded in the same order as :attr:`items`::
+
+            for transaction in braintree.Transaction.search(search_criteria).prefetch(batches=8):
+                print(transaction.id)
+        """
+        query = self.__query
+        indexed_batches = list(self.__checkpointed_batches())
+        pages = read_ahead(self.__method, ((query, ids) for _, ids in indexed_batches), batches)
+        for (batch_index, _), page in zip(indexed_batches, pages):
+            for item in page:
+                yield item
+            self.__batch_consumed(batch_index)
+        self.__finish()
+
+    def compact(self):
+        """
+        Returns a collection over the same results whose items are compact resources, which
+        have the same attributes as the resources :attr:`items` yields but share their field
+        layout, so that holding many results in memory costs much less::
+
+            transactions = list(braintree.Transaction.search(search_criteria).compact())
+
+        Raises ValueError for a search run with ``raw=True``, whose items are parsed response
+        dicts rather than resources.
+        """
+        if self.__raw_method is not None and self.__method == self.__raw_method:
+            raise ValueError("raw search results cannot be compacted - search without raw=True")
+        collection = copy.copy(self)
+        method = self.__method
+        collection.__method = lambda query, ids: [compact(item) for item in method(query, ids)]
+        return collection
+
+    def to_columns(self, columns, batches=1):
+        """
+        Returns a :class:`~braintree.util.columnar.ColumnFrame` holding the given columns of
+        every result in typed buffers. Records are read from the parsed responses without
+        building resources, and with ``batches`` greater than 1 that many pages are fetched
+        ahead in parallel::
+
+            frame = braintree.Transaction.search(search_criteria).to_columns(
+                ["id", "amount", "status", "created_at", "credit_card.card_type"], batches=4)
+
+        The frame always holds every result: a search resumed from a ``checkpoint`` reads the
+        batches consumed before as well, since the frame that held them is gone, and only
+        records its progress.
+        """
+        frame = ColumnFrame(columns)
+        method = self.__raw_method or self.__method
+        query = self.__query
+        indexed_batches = list(self.__checkpointed_batches(resume=False))
+        if batches > 1:
+            pages = read_ahead(method, ((query, ids) for _, ids in indexed_batches), batches)
+        else:
+            pages = (method(query, ids) for _, ids in indexed_batches)
+        for (batch_index, _), page in zip(indexed_batches, pages):
+            frame.extend(page)
+            self.__batch_consumed(batch_index)
+        self.__finish()
+        return frame
 
     @property
     def ids(self):
@@ -46,9 +122,21 @@ class ResourceCollection(object):
     def __iter__(self):
         return self.items
 
-    def __batch_ids(self):
-        for i in range(0, len(self.__ids), self.__page_size):
-                yield self.__ids[i:i+self.__page_size]
+    def __checkpointed_batches(self, resume=True):
+        # Only the first iteration of a resumed search skips the batches already consumed.
+        start, self.__resume_batch = self.__resume_batch if resume else 0, 0
+        for batch_index in range(start, -(-len(self.__ids) // self.__page_size)):
+            offset = batch_index * self.__page_size
+            yield batch_index, self.__ids[offset:offset + self.__page_size]
+
+    def __batch_consumed(self, batch_index):
+        if self.__checkpoint is not None:
+            self.__checkpoint.batch_consumed(batch_index)
+
+    def __finish(self):
+        if self.__checkpoint is not None:
+            self.__checkpoint.finish()
+            self.__checkpoint = None
 
 
     @staticmethod
@@ -0,0 +1,115 @@
+import json
+import os
+from datetime import date, datetime
+from decimal import Decimal
+
+FORMAT_VERSION = 1
+
+def _encode(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError("cannot store %r in a search checkpoint" % (value,))
+
+class SearchCheckpoint(object):
+    """
+    Progress of iterating a search, kept in a local file so that an interrupted iteration can
+    resume from the next unfetched batch instead of starting over. Passed as ``checkpoint`` to
+    ``search`` or ``all``::
+
+        collection = gateway.transaction.search(search_criteria, checkpoint="/var/tmp/export.checkpoint")
+        for transaction in collection:
+            export(transaction)
+
+    The first line of the file holds the search's criteria and the ids it matched; each batch
+    whose items have all been yielded appends a line with the index of the next batch. When a
+    search is run again with the same checkpoint file and criteria, the stored ids are used
+    without searching again and iteration starts at the next unconsumed batch, so the items of
+    a batch that was being consumed when the process stopped are yielded again. The file is
+    removed once every batch has been consumed.
+    """
+
+    def __init__(self, path, resource, criteria):
+        self.path = path
+        self.resource = resource
+        self.criteria = json.loads(json.dumps(criteria, default=_encode, sort_keys=True))
+        self.next_batch = 0
+        self.__results = None
+        self.__load()
+
+    @staticmethod
+    def run(path, resource, criteria, search):
+        """
+        Returns the search response and checkpoint for a search of ``resource`` with
+        ``criteria``. ``search`` is only called when ``path`` does not hold stored results
+        yet; without a ``path`` the checkpoint is None.
+        """
+        if path is None:
+            return search(), None
+        checkpoint = SearchCheckpoint(path, resource, criteria)
+        if checkpoint.search_results is not None:
+            return {"search_results": checkpoint.search_results}, checkpoint
+        response = search()
+        if "search_results" in response:
+            checkpoint.start(response["search_results"])
+        return response, checkpoint
+
+    @property
+    def search_results(self):
+        """ Returns the stored search results, or None when the search has not been stored yet. """
+        return self.__results
+
+    def start(self, search_results):
+        """ Stores ``search_results`` for the criteria, replacing any earlier file. """
+        header = {
+            "format": FORMAT_VERSION,
+            "resource": self.resource,
+            "criteria": self.criteria,
+            "page_size": search_results["page_size"],
+            "ids": search_results["ids"]
+        }
+        temporary_path = self.path + ".tmp"
+        with open(temporary_path, "w") as f:
+            f.write(json.dumps(header, sort_keys=True) + "\n")
+        os.replace(temporary_path, self.path)
+        self.__results = {"page_size": header["page_size"], "ids": header["ids"]}
+        self.next_batch = 0
+
+    def batch_consumed(self, batch):
+        """ Records that every item of ``batch``, counted from 0, has been yielded. """
+        self.next_batch = batch + 1
+        with open(self.path, "a") as f:
+            f.write(json.dumps({"next_batch": self.next_batch}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def finish(self):
+        """ Removes the checkpoint file once iteration has completed. """
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def __load(self):
+        try:
+            with open(self.path) as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return
+        if not lines:
+            return
+
+        header = json.loads(lines[0])
+        if header.get("format") != FORMAT_VERSION:
+            raise ValueError("unsupported search checkpoint format in " + self.path)
+        if header["resource"] != self.resource or header["criteria"] != self.criteria:
+            raise ValueError("search checkpoint " + self.path + " was written for a different search")
+
+        for line in lines[1:]:
+            try:
+                self.next_batch = json.loads(line)["next_batch"]
+            except ValueError:
+                # A line cut short by an interruption; the previous one stands.
+                break
+        self.__results = {"page_size": header["page_size"], "ids": header["ids"]}
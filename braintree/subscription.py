@@ -3,6 +3,7 @@ from braintree.util.http import Http
 import braintree
 import warnings
 from braintree.add_on import AddOn
+from braintree.attribute_getter import LazyAttribute
 from braintree.descriptor import Descriptor
 from braintree.discount import Discount
 from braintree.exceptions.not_found_error import NotFoundError
@@ -120,16 +121,21 @@ class Subscription(Resource):
         ] + Subscription._add_ons_discounts_signature()
 
     @staticmethod
-    def find(subscription_id):
+    def find(subscription_id, raw=False):
         """
         Find a subscription given a subscription_id.  This does not return a result
         object.  This will raise a :class:`NotFoundError <braintree.exceptions.not_found_error.NotFoundError>`
-        if the provided subscription_id is not found. ::
+        if the provided subscription_id is not found. With ``raw=True`` the parsed response
+        dict is returned instead of a Subscription. ::
 
             subscription = braintree.Subscription.find("my_subscription_id")
         """
 
-        return Configuration.gateway().subscription.find(subscription_id)
+        return Configuration.gateway().subscription.find(subscription_id, raw=raw)
+
+    @staticmethod
+    def find_many(subscription_ids, **options):
+        return Configuration.gateway().subscription.find_many(subscription_ids, **options)
 
     @staticmethod
     def retry_charge(subscription_id, amount=None, submit_for_settlement=False):
@@ -166,7 +172,7 @@ class Subscription(Resource):
         return Configuration.gateway().subscription.cancel(subscription_id)
 
     @staticmethod
-    def search(*query):
+    def search(*query, raw=False, checkpoint=None):
         """
         Allows searching on subscriptions. There are two types of fields that are searchable: text and
         multiple value fields. Searchable text fields are:
@@ -184,9 +190,11 @@ class Subscription(Resource):
                 braintree.SubscriptionSearch.days_past_due == "30",
                 braintree.SubscriptionSearch.status.in_list([braintree.Subscription.Status.PastDue])
             ])
+
+        With ``raw=True`` the collection yields the parsed response dicts instead of Subscriptions.
         """
 
-        return Configuration.gateway().subscription.search(*query)
+        return Configuration.gateway().subscription.search(*query, raw=raw, checkpoint=checkpoint)
 
     @staticmethod
     def update_signature():
@@ -231,23 +239,21 @@ class Subscription(Resource):
             }
         ]
 
+    price = LazyAttribute("price", lambda subscription, price: Decimal(price))
+    balance = LazyAttribute("balance", lambda subscription, balance: Decimal(balance))
+    next_billing_period_amount = LazyAttribute("next_billing_period_amount", lambda subscription, amount: Decimal(amount))
+    add_ons = LazyAttribute("add_ons", lambda subscription, add_ons: [AddOn(subscription.gateway, add_on) for add_on in add_ons])
+    descriptor = LazyAttribute("descriptor", lambda subscription, descriptor: Descriptor(subscription.gateway, descriptor))
+    discounts = LazyAttribute("discounts", lambda subscription, discounts: [Discount(subscription.gateway, discount) for discount in discounts])
+    status_history = LazyAttribute("status_history", lambda subscription, status_history: [SubscriptionStatusEvent(subscription.gateway, status_event) for status_event in status_history])
+    transactions = LazyAttribute("transactions", lambda subscription, transactions: [Transaction(subscription.gateway, transaction) for transaction in transactions])
+
     def __init__(self, gateway, attributes):
         Resource.__init__(self, gateway, attributes)
-        if "price" in attributes:
-            self.price = Decimal(self.price)
-        if "balance" in attributes:
-            self.balance = Decimal(self.balance)
-        if "next_billing_period_amount" in attributes:
-            self.next_billing_period_amount = Decimal(self.next_billing_period_amount)
-        if "add_ons" in attributes:
-            self.add_ons = [AddOn(gateway, add_on) for add_on in self.add_ons]
+        for name in ("price", "balance", "next_billing_period_amount", "add_ons", "discounts", "status_history", "transactions"):
+            if name in attributes:
+                self._defer(name, attributes[name])
         if "descriptor" in attributes:
-            self.descriptor = Descriptor(gateway, attributes.pop("descriptor"))
+            self._defer("descriptor", attributes["descriptor"])
         if "description" in attributes:
             self.description = attributes["description"]
-        if "discounts" in attributes:
-            self.discounts = [Discount(gateway, discount) for discount in self.discounts]
-        if "status_history" in attributes:
-            self.status_history = [SubscriptionStatusEvent(gateway, status_event) for status_event in self.status_history]
-        if "transactions" in attributes:
-            self.transactions = [Transaction(gateway, transaction) for transaction in self.transactions]
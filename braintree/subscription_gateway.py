@@ -3,8 +3,10 @@ import braintree
 from braintree.subscription import Subscription
 from braintree.error_result import ErrorResult
 from braintree.exceptions.not_found_error import NotFoundError
+from braintree.find_many_result import FindManyResult
 from braintree.resource import Resource
 from braintree.resource_collection import ResourceCollection
+from braintree.search_checkpoint import SearchCheckpoint
 from braintree.successful_result import SuccessfulResult
 from braintree.transaction import Transaction
 
@@ -24,22 +26,28 @@ class SubscriptionGateway(object):
     def create(self, params=None):
         if params is None:
             params = {}
-        Resource.verify_keys(params, Subscription.create_signature())
+        Resource.verify_keys(params, Subscription.create_signature)
         response = self.config.http().post(self.config.base_merchant_path() + "/subscriptions", {"subscription": params})
         if "subscription" in response:
             return SuccessfulResult({"subscription": Subscription(self.gateway, response["subscription"])})
         elif "api_error_response" in response:
             return ErrorResult(self.gateway, response["api_error_response"])
 
-    def find(self, subscription_id):
+    def find(self, subscription_id, raw=False):
         try:
             if subscription_id is None or subscription_id.strip() == "":
                 raise NotFoundError()
             response = self.config.http().get(self.config.base_merchant_path() + "/subscriptions/" + subscription_id)
+            if raw:
+                return response["subscription"]
             return Subscription(self.gateway, response["subscription"])
         except NotFoundError:
             raise NotFoundError("subscription with id " + repr(subscription_id) + " not found")
 
+    def find_many(self, subscription_ids, raw=False, chunk_size=50, workers=4):
+        """ Finds the subscriptions with the given ids in concurrent chunks. See :meth:`TransactionGateway.find_many <braintree.transaction_gateway.TransactionGateway.find_many>`. """
+        return FindManyResult.fetch(subscription_ids, self.__fetch_raw if raw else self.__fetch, chunk_size, workers)
+
     def retry_charge(self, subscription_id, amount=None, submit_for_settlement=False):
         response = self.config.http().post(self.config.base_merchant_path() + "/transactions", {"transaction": {
             "amount": amount,
@@ -52,17 +60,18 @@ class SubscriptionGateway(object):
         elif "api_error_response" in response:
             return ErrorResult(self.gateway, response["api_error_response"])
 
-    def search(self, *query):
+    def search(self, *query, raw=False, checkpoint=None):
         if isinstance(query[0], list):
             query = query[0]
 
-        response = self.config.http().post(self.config.base_merchant_path() + "/subscriptions/advanced_search_ids", {"search": self.__criteria(query)})
-        return ResourceCollection(query, response, self.__fetch)
+        criteria = self.__criteria(query)
+        response, search_checkpoint = SearchCheckpoint.run(checkpoint, "subscriptions", criteria, lambda: self.config.http().post(self.config.base_merchant_path() + "/subscriptions/advanced_search_ids", {"search": criteria}, idempotent=True))
+        return ResourceCollection(query, response, self.__fetch_raw if raw else self.__fetch, self.__fetch_raw, search_checkpoint)
 
     def update(self, subscription_id, params=None):
         if params is None:
             params = {}
-        Resource.verify_keys(params, Subscription.update_signature())
+        Resource.verify_keys(params, Subscription.update_signature)
         response = self.config.http().put(self.config.base_merchant_path() + "/subscriptions/" + subscription_id, {"subscription": params})
         if "subscription" in response:
             return SuccessfulResult({"subscription": Subscription(self.gateway, response["subscription"])})
@@ -79,8 +88,11 @@ class SubscriptionGateway(object):
         return criteria
 
     def __fetch(self, query, ids):
+        return [Subscription(self.gateway, item) for item in self.__fetch_raw(query, ids)]
+
+    def __fetch_raw(self, query, ids):
         criteria = self.__criteria(query)
         criteria["ids"] = braintree.subscription_search.SubscriptionSearch.ids.in_list(ids).to_param()
-        response = self.config.http().post(self.config.base_merchant_path() + "/subscriptions/advanced_search", {"search": criteria})
-        return [Subscription(self.gateway, item) for item in ResourceCollection._extract_as_array(response["subscriptions"], "subscription")]
+        response = self.config.http().post(self.config.base_merchant_path() + "/subscriptions/advanced_search", {"search": criteria}, idempotent=True)
+        return ResourceCollection._extract_as_array(response["subscriptions"], "subscription")
 
@@ -0,0 +1,753 @@
+import argparse
+import os
+import random
+import re
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from decimal import Decimal, InvalidOperation
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from urllib.parse import parse_qs, urlencode, urlsplit
+import requests
+from braintree.braintree_gateway import BraintreeGateway
+import braintree.configuration
+from braintree.environment import Environment
+from braintree.util.datetime_parser import parse_datetime
+from braintree.util.xml_util import XmlUtil
+from braintree.webhook_notification import WebhookNotification
+
+class FakeGateway(object):
+    """
+    A local stand-in for the Braintree gateway for load and latency testing.
+    It speaks the XML endpoints used by the transaction, customer, payment
+    method, subscription, credit card verification and dispute gateways,
+    including ``advanced_search_ids``/``advanced_search`` and paged dispute
+    searches, and serves a seeded dataset of the configured size. ::
+
+        with FakeGateway(transactions=5000, latency=0.05, error_rate=0.01) as fake:
+            gateway = braintree.BraintreeGateway(fake.configuration())
+            for transaction in gateway.transaction.search(braintree.TransactionSearch.status == "settled").items:
+                ...
+
+    It can also be run on its own and used with ``Environment.Development``::
+
+        GATEWAY_PORT=3000 python -m braintree.test.fake_gateway --port 3000 --latency 0.05
+
+    Every request first waits ``latency`` seconds plus up to
+    ``latency_jitter`` more. A fraction ``error_rate`` of requests then fail
+    with one of ``errors``: an HTTP status such as 429 or 503, or
+    ``"timeout"``, which holds the connection for ``hang_time`` seconds and
+    closes it without a response. 429 responses carry ``retry_after`` as a
+    ``Retry-After`` header when it is set. ``search_limit`` caps the number
+    of ids returned by ``advanced_search_ids``.
+
+    Any merchant id and credentials are accepted; ``public_key`` and
+    ``private_key`` are only used to sign webhook notifications.
+    """
+
+    def __init__(self, host="localhost", port=0, latency=0, latency_jitter=0, error_rate=0, errors=(429, 503),
+                 retry_after=None, hang_time=5, transactions=1000, customers=100, subscriptions=100,
+                 verifications=100, disputes=100, page_size=50, dispute_page_size=10, search_limit=None, seed=0,
+                 merchant_id="integration_merchant_id", public_key="integration_public_key",
+                 private_key="integration_private_key"):
+        self.host = host
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.errors = errors
+        self.retry_after = retry_after
+        self.hang_time = hang_time
+        self.page_size = page_size
+        self.dispute_page_size = dispute_page_size
+        self.search_limit = search_limit
+        self.merchant_id = merchant_id
+        self.public_key = public_key
+        self.private_key = private_key
+        self.request_count = 0
+        self.injected_error_count = 0
+        self.__port = port
+        self.__random = random.Random(seed)
+        self.__lock = threading.Lock()
+        self.__sequence = 0
+        self.__server = None
+        self.__thread = None
+        self.__records = _Dataset(self.__random).build(transactions, customers, subscriptions, verifications, disputes)
+        self.__webhook_testing = BraintreeGateway(self.configuration()).webhook_testing
+
+    @property
+    def port(self):
+        return self.__server.server_address[1] if self.__server else self.__port
+
+    def environment(self):
+        return Environment("fake", self.host, str(self.port), "http://auth.venmo.dev:9292", False, None)
+
+    def configuration(self, **kwargs):
+        return braintree.configuration.Configuration(self.environment(), self.merchant_id, public_key=self.public_key, private_key=self.private_key, **kwargs)
+
+    def start(self):
+        self.__server = _Server((self.host, self.__port), _Handler)
+        self.__server.fake_gateway = self
+        self.__thread = threading.Thread(target=self.__server.serve_forever, name="braintree-fake-gateway")
+        self.__thread.daemon = True
+        self.__thread.start()
+        return self
+
+    def serve_forever(self):
+        self.__server = _Server((self.host, self.__port), _Handler)
+        self.__server.fake_gateway = self
+        try:
+            self.__server.serve_forever()
+        finally:
+            self.__server.server_close()
+
+    def stop(self):
+        if self.__server is not None:
+            self.__server.shutdown()
+            self.__server.server_close()
+            self.__thread.join()
+            self.__server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def ids(self, resource):
+        """ Returns the ids of a resource in the dataset, e.g. ``ids("transactions")``. """
+        with self.__lock:
+            return list(self.__records[resource].keys())
+
+    def sample_notification(self, kind, id):
+        """ Returns a webhook notification signed with this gateway's keys, as ``bt_signature`` and ``bt_payload``. """
+        return self.__webhook_testing.sample_notification(kind, id)
+
+    def deliver_webhooks(self, url, count, kinds=(WebhookNotification.Kind.TransactionSettled,)):
+        """
+        Posts ``count`` signed webhook notifications to ``url`` as form data,
+        the way the gateway delivers them, and returns the response statuses.
+        """
+        session = requests.Session()
+        statuses = []
+        for sample in self.__webhook_testing.sample_notifications(count, kinds=list(kinds), id_prefix="webhook"):
+            statuses.append(session.post(url, data=sample).status_code)
+        session.close()
+        return statuses
+
+    def _handle(self, handler):
+        with self.__lock:
+            self.request_count += 1
+            delay = self.latency + (self.__random.uniform(0, self.latency_jitter) if self.latency_jitter else 0)
+            error = self.__random.choice(self.errors) if self.errors and self.__random.random() < self.error_rate else None
+            if error is not None:
+                self.injected_error_count += 1
+
+        body = handler.read_body()
+        if delay:
+            time.sleep(delay)
+
+        if error == "timeout":
+            time.sleep(self.hang_time)
+            handler.close_connection = True
+            return None
+        elif error is not None:
+            headers = {"Retry-After": str(self.retry_after)} if error == 429 and self.retry_after is not None else {}
+            return error, "", headers
+
+        if "Authorization" not in handler.headers:
+            return 401, "", {}
+
+        url = urlsplit(handler.path)
+        for verb, pattern, name in _ROUTES:
+            match = pattern.match(url.path)
+            if verb == handler.command and match:
+                params = XmlUtil.dict_from_xml(body) if body.strip() else {}
+                query = dict((key, values[0]) for key, values in parse_qs(url.query).items())
+                with self.__lock:
+                    status, response = getattr(self, name)(params, query, *match.groups())
+                return status, response, {}
+        return 404, "", {}
+
+    def _search_ids(self, params, query, resource):
+        criteria = params.get("search") or {}
+        ids = [record["id"] for record in reversed(self.__records[resource].values()) if _matches(record, criteria)]
+        if self.search_limit is not None:
+            ids = ids[:self.search_limit]
+        return 200, XmlUtil.xml_from_dict({"search_results": {"page_size": self.page_size, "ids": ids}})
+
+    def _search(self, params, query, resource):
+        ids = (params.get("search") or {}).get("ids") or []
+        records = self.__records[resource]
+        singular, collection = _COLLECTIONS[resource]
+        return 200, _collection_xml(collection, singular, [records[id] for id in ids if id in records])
+
+    def _find(self, params, query, resource, id):
+        record = self.__records[resource].get(id)
+        if record is None:
+            return 404, ""
+        return 200, XmlUtil.xml_from_dict({_COLLECTIONS[resource][0]: record})
+
+    def _dispute_search(self, params, query):
+        criteria = params.get("search") or {}
+        disputes = [record for record in reversed(self.__records["disputes"].values()) if _matches(record, criteria)]
+        page = int(query.get("page", 1))
+        start = (page - 1) * self.dispute_page_size
+        return 200, _collection_xml("disputes", "dispute", disputes[start:start + self.dispute_page_size], {
+            "current_page_number": page,
+            "page_size": self.dispute_page_size,
+            "total_items": len(disputes)
+        })
+
+    def _transaction_create(self, params, query):
+        attributes = params.get("transaction") or {}
+        if not attributes.get("amount"):
+            return _validation_error("transaction", "amount", "81502", "Amount is required.", params)
+        options = attributes.get("options") or {}
+        status = "submitted_for_settlement" if options.get("submit_for_settlement") in (True, "true") else "authorized"
+        customer = self.__records["customers"].get(attributes.get("customer_id"))
+        transaction = _Dataset(self.__random).transaction(
+            self.__next_id("txn"), attributes["amount"], status, datetime.utcnow(),
+            kind=attributes.get("type", "sale"),
+            customer=customer,
+            order_id=attributes.get("order_id")
+        )
+        self.__records["transactions"][transaction["id"]] = transaction
+        return 201, XmlUtil.xml_from_dict({"transaction": transaction})
+
+    def _transaction_action(self, params, query, id, action):
+        transaction = self.__records["transactions"].get(id)
+        if transaction is None:
+            return 404, ""
+        allowed = {"submit_for_settlement": ("authorized",), "void": ("authorized", "submitted_for_settlement")}[action]
+        if transaction["status"] not in allowed:
+            return _validation_error("transaction", "base", "91507", "Cannot " + action.replace("_", " ") + " transaction in status " + transaction["status"] + ".", params)
+        transaction["status"] = "voided" if action == "void" else "submitted_for_settlement"
+        transaction["status_history"].append(_status_event(transaction["status"], transaction["amount"], datetime.utcnow()))
+        transaction["updated_at"] = datetime.utcnow()
+        return 200, XmlUtil.xml_from_dict({"transaction": transaction})
+
+    def _transaction_refund(self, params, query, id):
+        transaction = self.__records["transactions"].get(id)
+        if transaction is None:
+            return 404, ""
+        if transaction["status"] != "settled":
+            return _validation_error("transaction", "base", "91506", "Cannot refund transaction unless it is settled.", params)
+        amount = (params.get("transaction") or {}).get("amount") or transaction["amount"]
+        refund = _Dataset(self.__random).transaction(self.__next_id("txn"), amount, "submitted_for_settlement", datetime.utcnow(), kind="credit")
+        refund["refunded_transaction_id"] = id
+        transaction.setdefault("refund_ids", []).append(refund["id"])
+        self.__records["transactions"][refund["id"]] = refund
+        return 201, XmlUtil.xml_from_dict({"transaction": refund})
+
+    def _customer_create(self, params, query):
+        attributes = params.get("customer") or {}
+        customer = _Dataset(self.__random).customer(attributes.get("id") or self.__next_id("customer"), datetime.utcnow(), cards=0)
+        customer.update(_scalars(attributes, ("first_name", "last_name", "company", "email", "phone", "fax", "website")))
+        self.__records["customers"][customer["id"]] = customer
+        return 201, XmlUtil.xml_from_dict({"customer": customer})
+
+    def _customer_update(self, params, query, id):
+        customer = self.__records["customers"].get(id)
+        if customer is None:
+            return 404, ""
+        customer.update(_scalars(params.get("customer") or {}, ("first_name", "last_name", "company", "email", "phone", "fax", "website")))
+        customer["updated_at"] = datetime.utcnow()
+        return 200, XmlUtil.xml_from_dict({"customer": customer})
+
+    def _customer_delete(self, params, query, id):
+        customer = self.__records["customers"].pop(id, None)
+        if customer is None:
+            return 404, ""
+        for card in customer["credit_cards"]:
+            self.__records["payment_methods"].pop(card["token"], None)
+        return 200, ""
+
+    def _payment_method_create(self, params, query):
+        attributes = params.get("payment_method") or {}
+        customer = self.__records["customers"].get(attributes.get("customer_id"))
+        if customer is None:
+            return _validation_error("payment_method", "customer_id", "93105", "Customer ID is invalid.", params)
+        card = _Dataset(self.__random).credit_card(attributes.get("token") or self.__next_id("token"), customer["id"], datetime.utcnow())
+        customer["credit_cards"].append(card)
+        self.__records["payment_methods"][card["token"]] = card
+        return 201, XmlUtil.xml_from_dict({"credit_card": card})
+
+    def _payment_method_find(self, params, query, token):
+        card = self.__records["payment_methods"].get(token)
+        if card is None:
+            return 404, ""
+        return 200, XmlUtil.xml_from_dict({"credit_card": card})
+
+    def _payment_method_update(self, params, query, token):
+        card = self.__records["payment_methods"].get(token)
+        if card is None:
+            return 404, ""
+        card.update(_scalars(params.get("payment_method") or {}, ("cardholder_name", "expiration_month", "expiration_year")))
+        card["updated_at"] = datetime.utcnow()
+        return 200, XmlUtil.xml_from_dict({"credit_card": card})
+
+    def _payment_method_delete(self, params, query, token):
+        card = self.__records["payment_methods"].pop(token, None)
+        if card is None:
+            return 404, ""
+        customer = self.__records["customers"].get(card["customer_id"])
+        if customer is not None:
+            customer["credit_cards"] = [c for c in customer["credit_cards"] if c["token"] != token]
+        return 200, ""
+
+    def _subscription_create(self, params, query):
+        attributes = params.get("subscription") or {}
+        if attributes.get("payment_method_token") not in self.__records["payment_methods"]:
+            return _validation_error("subscription", "payment_method_token", "91903", "Payment method token is invalid.", params)
+        subscription = _Dataset(self.__random).subscription(
+            attributes.get("id") or self.__next_id("subscription"),
+            attributes["payment_method_token"],
+            datetime.utcnow(),
+            plan_id=attributes.get("plan_id", "integration_trialless_plan"),
+            price=attributes.get("price", "12.34")
+        )
+        self.__records["subscriptions"][subscription["id"]] = subscription
+        return 201, XmlUtil.xml_from_dict({"subscription": subscription})
+
+    def _subscription_update(self, params, query, id):
+        subscription = self.__records["subscriptions"].get(id)
+        if subscription is None:
+            return 404, ""
+        subscription.update(_scalars(params.get("subscription") or {}, ("plan_id", "price", "payment_method_token")))
+        subscription["updated_at"] = datetime.utcnow()
+        return 200, XmlUtil.xml_from_dict({"subscription": subscription})
+
+    def _subscription_cancel(self, params, query, id):
+        subscription = self.__records["subscriptions"].get(id)
+        if subscription is None:
+            return 404, ""
+        if subscription["status"] == "Canceled":
+            return _validation_error("subscription", "status", "81905", "Subscription has already been canceled.", params)
+        subscription["status"] = "Canceled"
+        subscription["updated_at"] = datetime.utcnow()
+        return 200, XmlUtil.xml_from_dict({"subscription": subscription})
+
+    def _webhook_sample(self, params, query):
+        sample = self.__webhook_testing.sample_notification(query.get("kind", WebhookNotification.Kind.Check), query.get("id", "webhook_id"))
+        return 200, urlencode(sample)
+
+    def __next_id(self, prefix):
+        self.__sequence += 1
+        return "%s_new_%d" % (prefix, self.__sequence)
+
+_RESOURCES = "(transactions|customers|subscriptions|verifications)"
+
+_COLLECTIONS = {
+    "transactions": ("transaction", "credit_card_transactions"),
+    "customers": ("customer", "customers"),
+    "subscriptions": ("subscription", "subscriptions"),
+    "verifications": ("verification", "credit_card_verifications"),
+    "disputes": ("dispute", "disputes")
+}
+
+_ROUTES = [(verb, re.compile("^/merchants/[^/]+" + path + "$"), name) for verb, path, name in [
+    ("POST", "/" + _RESOURCES + "/advanced_search_ids", "_search_ids"),
+    ("POST", "/" + _RESOURCES + "/advanced_search", "_search"),
+    ("POST", "/disputes/advanced_search", "_dispute_search"),
+    ("POST", "/transactions", "_transaction_create"),
+    ("PUT", "/transactions/([^/]+)/(submit_for_settlement|void)", "_transaction_action"),
+    ("POST", "/transactions/([^/]+)/refund", "_transaction_refund"),
+    ("POST", "/customers", "_customer_create"),
+    ("PUT", "/customers/([^/]+)", "_customer_update"),
+    ("DELETE", "/customers/([^/]+)", "_customer_delete"),
+    ("POST", "/payment_methods", "_payment_method_create"),
+    ("GET", "/payment_methods/any/([^/]+)", "_payment_method_find"),
+    ("PUT", "/payment_methods/any/([^/]+)", "_payment_method_update"),
+    ("DELETE", "/payment_methods/any/([^/]+)", "_payment_method_delete"),
+    ("POST", "/subscriptions", "_subscription_create"),
+    ("PUT", "/subscriptions/([^/]+)/cancel", "_subscription_cancel"),
+    ("PUT", "/subscriptions/([^/]+)", "_subscription_update"),
+    ("GET", "/(transactions|customers|subscriptions|verifications|disputes)/([^/]+)", "_find"),
+    ("GET", "/webhooks/sample_notification", "_webhook_sample")
+]]
+
+class _Server(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.__respond()
+
+    def do_POST(self):
+        self.__respond()
+
+    def do_PUT(self):
+        self.__respond()
+
+    def do_DELETE(self):
+        self.__respond()
+
+    def read_body(self):
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int(self.rfile.readline().split(b";")[0].strip(), 16)
+                if size == 0:
+                    self.rfile.readline()
+                    return b"".join(chunks).decode("utf-8")
+                chunks.append(self.rfile.read(size))
+                self.rfile.readline()
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length).decode("utf-8") if length else ""
+
+    def log_message(self, format, *args):
+        pass
+
+    def __respond(self):
+        response = self.server.fake_gateway._handle(self)
+        if response is None:
+            return
+        status, body, headers = response
+        body = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/xml; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+class _Dataset(object):
+    """ Builds the records served by the fake gateway, in the attribute form of the resource classes. """
+
+    def __init__(self, random):
+        self.random = random
+
+    def build(self, transactions, customers, subscriptions, verifications, disputes):
+        now = datetime.utcnow().replace(microsecond=0)
+        records = dict((resource, OrderedDict()) for resource in ("transactions", "customers", "payment_methods", "subscriptions", "verifications", "disputes"))
+
+        for index in range(customers):
+            customer = self.customer("customer_%d" % index, self.__created_at(now, index, customers))
+            records["customers"][customer["id"]] = customer
+            for card in customer["credit_cards"]:
+                records["payment_methods"][card["token"]] = card
+
+        customer_list = list(records["customers"].values())
+        token_list = list(records["payment_methods"].keys())
+
+        for index in range(transactions):
+            status = self.random.choice(_TRANSACTION_STATUSES)
+            amount = "%d.%02d" % (self.random.randint(1, 2000), self.random.randint(0, 99))
+            customer = self.random.choice(customer_list) if customer_list else None
+            transaction = self.transaction("txn_%d" % index, amount, status, self.__created_at(now, index, transactions), customer=customer)
+            records["transactions"][transaction["id"]] = transaction
+
+        for index in range(subscriptions):
+            token = self.random.choice(token_list) if token_list else "token"
+            subscription = self.subscription("subscription_%d" % index, token, self.__created_at(now, index, subscriptions))
+            records["subscriptions"][subscription["id"]] = subscription
+
+        for index in range(verifications):
+            verification = self.verification("verification_%d" % index, self.__created_at(now, index, verifications))
+            records["verifications"][verification["id"]] = verification
+
+        transaction_list = list(records["transactions"].values())
+        for index in range(disputes):
+            transaction = self.random.choice(transaction_list) if transaction_list else None
+            dispute = self.dispute("dispute_%d" % index, transaction, self.__created_at(now, index, disputes))
+            records["disputes"][dispute["id"]] = dispute
+
+        return records
+
+    def transaction(self, id, amount, status, created_at, kind="sale", customer=None, order_id=None):
+        customer = customer or self.customer("customer_for_" + id, created_at)
+        card = customer["credit_cards"][0] if customer["credit_cards"] else self.credit_card("token_for_" + id, customer["id"], created_at)
+        history = [_status_event("authorized", amount, created_at)]
+        if status in ("submitted_for_settlement", "settled", "voided"):
+            history.append(_status_event("submitted_for_settlement" if status != "voided" else "voided", amount, created_at + timedelta(seconds=1)))
+        if status == "settled":
+            history.append(_status_event("settled", amount, created_at + timedelta(hours=20)))
+        if status == "processor_declined":
+            history = [_status_event("processor_declined", amount, created_at)]
+
+        transaction = {
+            "id": id,
+            "type": kind,
+            "status": status,
+            "amount": amount,
+            "currency_iso_code": "USD",
+            "merchant_account_id": "sandbox_credit_card",
+            "order_id": order_id or "order_" + id,
+            "created_at": created_at,
+            "updated_at": history[-1]["timestamp"],
+            "processor_response_code": "2000" if status == "processor_declined" else "1000",
+            "processor_response_text": "Do Not Honor" if status == "processor_declined" else "Approved",
+            "payment_instrument_type": "credit_card",
+            "customer": _scalars(customer, ("id", "first_name", "last_name", "company", "email", "phone", "website")),
+            "billing": customer["addresses"][0] if customer["addresses"] else {},
+            "credit_card": _scalars(card, ("token", "bin", "last_4", "card_type", "expiration_month", "expiration_year", "cardholder_name", "customer_location", "unique_number_identifier", "image_url")),
+            "status_history": history,
+            "add_ons": [],
+            "discounts": [],
+            "disputes": [],
+            "authorization_adjustments": [],
+            "refund_ids": [],
+            "risk_data": {"id": "risk_" + id, "decision": "Approve", "device_data_captured": True, "fraud_service_provider": "kount"},
+            "custom_fields": {"store_me": "value"}
+        }
+        if status == "settled":
+            transaction["disbursement_details"] = {
+                "settlement_amount": amount,
+                "settlement_currency_iso_code": "USD",
+                "settlement_currency_exchange_rate": "1",
+                "funds_held": False,
+                "success": True,
+                "disbursement_date": (created_at + timedelta(days=2)).strftime("%Y-%m-%d")
+            }
+        return transaction
+
+    def customer(self, id, created_at, cards=1):
+        first_name, last_name = self.random.choice(_FIRST_NAMES), self.random.choice(_LAST_NAMES)
+        address = {
+            "id": "address_" + id,
+            "customer_id": id,
+            "first_name": first_name,
+            "last_name": last_name,
+            "street_address": "%d W Merchandise Mart Plaza" % self.random.randint(1, 999),
+            "locality": "Chicago",
+            "region": "IL",
+            "postal_code": "60654",
+            "country_code_alpha2": "US",
+            "country_name": "United States of America",
+            "created_at": created_at,
+            "updated_at": created_at
+        }
+        return {
+            "id": id,
+            "first_name": first_name,
+            "last_name": last_name,
+            "company": "Braintree",
+            "email": "%s.%s@example.com" % (first_name.lower(), id),
+            "phone": "312-555-%04d" % self.random.randint(0, 9999),
+            "website": "https://www.example.com",
+            "created_at": created_at,
+            "updated_at": created_at,
+            "addresses": [address],
+            "credit_cards": [self.credit_card("token_%s_%d" % (id, card), id, created_at) for card in range(cards)]
+        }
+
+    def credit_card(self, token, customer_id, created_at):
+        card_type, bin, last_4 = self.random.choice(_CARDS)
+        return {
+            "token": token,
+            "customer_id": customer_id,
+            "bin": bin,
+            "last_4": last_4,
+            "card_type": card_type,
+            "cardholder_name": "Cardholder " + customer_id,
+            "expiration_month": "%02d" % self.random.randint(1, 12),
+            "expiration_year": str(created_at.year + self.random.randint(1, 5)),
+            "expired": False,
+            "default": True,
+            "customer_location": "US",
+            "unique_number_identifier": "unique_" + token,
+            "image_url": "https://assets.braintreegateway.com/payment_method_logo/%s.png" % card_type.lower(),
+            "created_at": created_at,
+            "updated_at": created_at,
+            "subscriptions": []
+        }
+
+    def subscription(self, id, token, created_at, plan_id="integration_trialless_plan", price="12.34"):
+        return {
+            "id": id,
+            "plan_id": plan_id,
+            "status": self.random.choice(("Active", "Active", "Active", "PastDue", "Canceled")),
+            "price": price,
+            "balance": "0.00",
+            "next_billing_period_amount": price,
+            "payment_method_token": token,
+            "merchant_account_id": "sandbox_credit_card",
+            "billing_day_of_month": created_at.day,
+            "current_billing_cycle": 1,
+            "first_billing_date": created_at.strftime("%Y-%m-%d"),
+            "next_billing_date": (created_at + timedelta(days=30)).strftime("%Y-%m-%d"),
+            "created_at": created_at,
+            "updated_at": created_at,
+            "add_ons": [],
+            "discounts": [],
+            "status_history": [],
+            "transactions": []
+        }
+
+    def verification(self, id, created_at):
+        status = self.random.choice(("verified", "verified", "verified", "processor_declined", "gateway_rejected"))
+        card_type, bin, last_4 = self.random.choice(_CARDS)
+        return {
+            "id": id,
+            "status": status,
+            "amount": "1.00",
+            "currency_iso_code": "USD",
+            "merchant_account_id": "sandbox_credit_card",
+            "processor_response_code": "1000" if status == "verified" else "2000",
+            "processor_response_text": "Approved" if status == "verified" else "Do Not Honor",
+            "created_at": created_at,
+            "credit_card": {"bin": bin, "last_4": last_4, "card_type": card_type, "token": "token_" + id}
+        }
+
+    def dispute(self, id, transaction, created_at):
+        amount = transaction["amount"] if transaction else "10.00"
+        status = self.random.choice(("open", "open", "won", "lost", "accepted"))
+        return {
+            "id": id,
+            "amount": amount,
+            "amount_disputed": amount,
+            "amount_won": amount if status == "won" else "0.00",
+            "case_number": "CASE-%06d" % self.random.randint(0, 999999),
+            "currency_iso_code": "USD",
+            "kind": self.random.choice(("chargeback", "retrieval", "pre_arbitration")),
+            "reason": self.random.choice(("fraud", "duplicate", "product_not_received", "not_recognized")),
+            "status": status,
+            "merchant_account_id": "sandbox_credit_card",
+            "received_date": created_at.strftime("%Y-%m-%d"),
+            "reply_by_date": (created_at + timedelta(days=7)).strftime("%Y-%m-%d"),
+            "created_at": created_at,
+            "updated_at": created_at,
+            "transaction": {
+                "id": transaction["id"] if transaction else "txn_for_" + id,
+                "amount": amount,
+                "created_at": transaction["created_at"] if transaction else created_at
+            },
+            "evidence": [],
+            "status_history": [{"status": "open", "timestamp": created_at, "effective_date": created_at.strftime("%Y-%m-%d")}]
+        }
+
+    def __created_at(self, now, index, count):
+        # Spread over the last 90 days in ascending order, like the gateway's insertion order.
+        return now - timedelta(seconds=int((count - index) * 90 * 86400 / max(count, 1)) - self.random.randint(0, 60))
+
+_TRANSACTION_STATUSES = ("settled",) * 14 + ("submitted_for_settlement",) * 2 + ("authorized",) * 2 + ("voided", "processor_declined")
+
+_FIRST_NAMES = ("Jane", "John", "Maria", "Wei", "Aisha", "Carlos", "Yuki", "Olga")
+
+_LAST_NAMES = ("Doe", "Smith", "Garcia", "Chen", "Okafor", "Silva", "Tanaka", "Ivanova")
+
+_CARDS = (("Visa", "411111", "1111"), ("MasterCard", "555555", "4444"), ("American Express", "378282", "0005"), ("Discover", "601111", "1117"))
+
+def _status_event(status, amount, timestamp):
+    return {"status": status, "amount": amount, "timestamp": timestamp, "transaction_source": "api", "user": "integration_user"}
+
+def _scalars(attributes, keys):
+    return dict((key, attributes[key]) for key in keys if key in attributes)
+
+def _collection_xml(name, item_name, records, extra=None):
+    parts = ["<%s type=\"collection\">" % name.replace("_", "-")]
+    for key, value in (extra or {}).items():
+        parts.append(XmlUtil.xml_from_dict({key: value}))
+    for record in records:
+        parts.append(XmlUtil.xml_from_dict({item_name: record}))
+    parts.append("</%s>" % name.replace("_", "-"))
+    return "".join(parts)
+
+def _validation_error(resource, attribute, code, message, params):
+    return 422, XmlUtil.xml_from_dict({"api_error_response": {
+        "message": message,
+        "errors": {"errors": [], resource: {"errors": [{"code": code, "attribute": attribute, "message": message}]}},
+        "params": params
+    }})
+
+def _search_value(record, name):
+    if name in record:
+        return record[name]
+    # Searches on <status>_at, such as settled_at, match the status history.
+    if name.endswith("_at"):
+        for event in record.get("status_history") or []:
+            if event["status"] == name[:-3]:
+                return event["timestamp"]
+    return None
+
+def _comparable(value, bound):
+    if isinstance(value, datetime):
+        return value, bound if isinstance(bound, datetime) else parse_datetime(bound)
+    try:
+        return Decimal(value), Decimal(bound)
+    except (InvalidOperation, TypeError):
+        return str(value), str(bound)
+
+def _matches(record, criteria):
+    for name, condition in criteria.items():
+        if name == "ids":
+            if record["id"] not in condition:
+                return False
+            continue
+        value = _search_value(record, name)
+        if isinstance(condition, list):
+            if value is None or str(value) not in condition:
+                return False
+        elif isinstance(condition, dict):
+            if value is None:
+                return False
+            if "is" in condition and str(value) != condition["is"]:
+                return False
+            if "is_not" in condition and str(value) == condition["is_not"]:
+                return False
+            if "starts_with" in condition and not str(value).startswith(condition["starts_with"]):
+                return False
+            if "ends_with" in condition and not str(value).endswith(condition["ends_with"]):
+                return False
+            if "contains" in condition and condition["contains"] not in str(value):
+                return False
+            if "min" in condition:
+                value_, bound = _comparable(value, condition["min"])
+                if value_ < bound:
+                    return False
+            if "max" in condition:
+                value_, bound = _comparable(value, condition["max"])
+                if value_ > bound:
+                    return False
+    return True
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m braintree.test.fake_gateway", description="Run a local fake Braintree gateway.")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=int(os.getenv("GATEWAY_PORT") or 3000))
+    parser.add_argument("--latency", type=float, default=0, help="seconds added to every response")
+    parser.add_argument("--latency-jitter", type=float, default=0, help="up to this many random extra seconds per response")
+    parser.add_argument("--error-rate", type=float, default=0, help="fraction of requests that fail with an injected error")
+    parser.add_argument("--errors", default="429,503", help="comma separated injected errors: HTTP statuses or 'timeout'")
+    parser.add_argument("--retry-after", type=int, help="Retry-After seconds sent with injected 429 responses")
+    parser.add_argument("--hang-time", type=float, default=5, help="seconds an injected timeout holds the connection")
+    parser.add_argument("--transactions", type=int, default=1000)
+    parser.add_argument("--customers", type=int, default=100)
+    parser.add_argument("--subscriptions", type=int, default=100)
+    parser.add_argument("--verifications", type=int, default=100)
+    parser.add_argument("--disputes", type=int, default=100)
+    parser.add_argument("--search-limit", type=int, help="maximum number of ids returned by advanced_search_ids")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    fake = FakeGateway(
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        error_rate=args.error_rate,
+        errors=tuple(error if error == "timeout" else int(error) for error in args.errors.split(",") if error),
+        retry_after=args.retry_after,
+        hang_time=args.hang_time,
+        transactions=args.transactions,
+        customers=args.customers,
+        subscriptions=args.subscriptions,
+        verifications=args.verifications,
+        disputes=args.disputes,
+        search_limit=args.search_limit,
+        seed=args.seed
+    )
+    print("Fake gateway listening on http://%s:%d" % (args.host, args.port))
+    try:
+        fake.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
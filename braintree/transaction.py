@@ -15,6 +15,7 @@ from braintree.status_event import StatusEvent
 from braintree.error_result import ErrorResult
 from braintree.resource import Resource
 from braintree.address import Address
+from braintree.attribute_getter import LazyAttribute
 from braintree.configuration import Configuration
 from braintree.credit_card import CreditCard
 from braintree.customer import Customer
@@ -323,15 +324,20 @@ class Transaction(Resource):
         return Transaction.create(params)
 
     @staticmethod
-    def find(transaction_id):
+    def find(transaction_id, raw=False):
         """
         Find a transaction, given a transaction_id. This does not return
         a result object. This will raise a :class:`NotFoundError <braintree.exceptions.not_found_error.NotFoundError>` if the provided
-        credit_card_id is not found. ::
+        credit_card_id is not found. With ``raw=True`` the parsed response dict is returned
+        instead of a Transaction. ::
 
             transaction = braintree.Transaction.find("my_transaction_id")
         """
-        return Configuration.gateway().transaction.find(transaction_id)
+        return Configuration.gateway().transaction.find(transaction_id, raw=raw)
+
+    @staticmethod
+    def find_many(transaction_ids, **options):
+        return Configuration.gateway().transaction.find_many(transaction_ids, **options)
 
     @staticmethod
     def hold_in_escrow(transaction_id):
@@ -391,8 +397,16 @@ class Transaction(Resource):
         return Transaction.create(params)
 
     @staticmethod
-    def search(*query):
-        return Configuration.gateway().transaction.search(*query)
+    def search(*query, raw=False, checkpoint=None):
+        return Configuration.gateway().transaction.search(*query, raw=raw, checkpoint=checkpoint)
+
+    @staticmethod
+    def sharded_search(start, end, *query, **options):
+        """
+        Searches transactions between ``start`` and ``end`` in concurrent time windows. See
+        :meth:`TransactionGateway.sharded_search <braintree.transaction_gateway.TransactionGateway.sharded_search>`.
+        """
+        return Configuration.gateway().transaction.sharded_search(start, end, *query, **options)
 
     @staticmethod
     def release_from_escrow(transaction_id):
@@ -668,82 +682,94 @@ class Transaction(Resource):
             params = {}
         return Configuration.gateway().transaction.submit_for_partial_settlement(transaction_id, amount, params)
 
-    def __init__(self, gateway, attributes):
-        Resource.__init__(self, gateway, attributes)
-
-        self.amount = Decimal(self.amount)
-        if "tax_amount" in attributes and getattr(self, "tax_amount", None):
-            self.tax_amount = Decimal(self.tax_amount)
-        if "discount_amount" in attributes and getattr(self, "discount_amount", None):
-            self.discount_amount = Decimal(self.discount_amount)
-        if "shipping_amount" in attributes and getattr(self, "shipping_amount", None):
-            self.shipping_amount = Decimal(self.shipping_amount)
-        if "billing" in attributes:
-            self.billing_details = Address(gateway, attributes.pop("billing"))
-        if "credit_card" in attributes:
-            self.credit_card_details = CreditCard(gateway, attributes.pop("credit_card"))
-        if "paypal" in attributes:
-            self.paypal_details = PayPalAccount(gateway, attributes.pop("paypal"))
-        if "paypal_here" in attributes:
-            self.paypal_here_details = PayPalHere(gateway, attributes.pop("paypal_here"))
-        if "local_payment" in attributes:
-            self.local_payment_details = LocalPayment(gateway, attributes.pop("local_payment"))
-        if "europe_bank_account" in attributes:
-            self.europe_bank_account_details = EuropeBankAccount(gateway, attributes.pop("europe_bank_account"))
-        if "us_bank_account" in attributes:
-            self.us_bank_account = UsBankAccount(gateway, attributes.pop("us_bank_account"))
-        if "apple_pay" in attributes:
-            self.apple_pay_details = ApplePayCard(gateway, attributes.pop("apple_pay"))
+    # Nested resources and amounts are built on first access, so that reading
+    # a few fields of many transactions does not pay for the rest.
+    amount = LazyAttribute("amount", lambda transaction, amount: Decimal(amount))
+    tax_amount = LazyAttribute("tax_amount", lambda transaction, amount: Decimal(amount) if amount else amount)
+    discount_amount = LazyAttribute("discount_amount", lambda transaction, amount: Decimal(amount) if amount else amount)
+    shipping_amount = LazyAttribute("shipping_amount", lambda transaction, amount: Decimal(amount) if amount else amount)
+    billing_details = LazyAttribute("billing_details", lambda transaction, billing: Address(transaction.gateway, billing))
+    credit_card_details = LazyAttribute("credit_card_details", lambda transaction, credit_card: CreditCard(transaction.gateway, credit_card))
+    paypal_details = LazyAttribute("paypal_details", lambda transaction, paypal: PayPalAccount(transaction.gateway, paypal))
+    paypal_here_details = LazyAttribute("paypal_here_details", lambda transaction, paypal_here: PayPalHere(transaction.gateway, paypal_here))
+    local_payment_details = LazyAttribute("local_payment_details", lambda transaction, local_payment: LocalPayment(transaction.gateway, local_payment))
+    europe_bank_account_details = LazyAttribute("europe_bank_account_details", lambda transaction, europe_bank_account: EuropeBankAccount(transaction.gateway, europe_bank_account))
+    us_bank_account = LazyAttribute("us_bank_account", lambda transaction, us_bank_account: UsBankAccount(transaction.gateway, us_bank_account))
+    apple_pay_details = LazyAttribute("apple_pay_details", lambda transaction, apple_pay: ApplePayCard(transaction.gateway, apple_pay))
+    android_pay_card_details = LazyAttribute("android_pay_card_details", lambda transaction, android_pay_card: AndroidPayCard(transaction.gateway, android_pay_card))
+    amex_express_checkout_card_details = LazyAttribute("amex_express_checkout_card_details", lambda transaction, card: AmexExpressCheckoutCard(transaction.gateway, card))
+    venmo_account_details = LazyAttribute("venmo_account_details", lambda transaction, venmo_account: VenmoAccount(transaction.gateway, venmo_account))
+    visa_checkout_card_details = LazyAttribute("visa_checkout_card_details", lambda transaction, visa_checkout_card: VisaCheckoutCard(transaction.gateway, visa_checkout_card))
+    masterpass_card_details = LazyAttribute("masterpass_card_details", lambda transaction, masterpass_card: MasterpassCard(transaction.gateway, masterpass_card))
+    samsung_pay_card_details = LazyAttribute("samsung_pay_card_details", lambda transaction, samsung_pay_card: SamsungPayCard(transaction.gateway, samsung_pay_card))
+    customer_details = LazyAttribute("customer_details", lambda transaction, customer: Customer(transaction.gateway, customer))
+    shipping_details = LazyAttribute("shipping_details", lambda transaction, shipping: Address(transaction.gateway, shipping))
+    add_ons = LazyAttribute("add_ons", lambda transaction, add_ons: [AddOn(transaction.gateway, add_on) for add_on in add_ons])
+    discounts = LazyAttribute("discounts", lambda transaction, discounts: [Discount(transaction.gateway, discount) for discount in discounts])
+    status_history = LazyAttribute("status_history", lambda transaction, status_history: [StatusEvent(transaction.gateway, status_event) for status_event in status_history])
+    subscription_details = LazyAttribute("subscription_details", lambda transaction, subscription: SubscriptionDetails(subscription))
+    descriptor = LazyAttribute("descriptor", lambda transaction, descriptor: Descriptor(transaction.gateway, descriptor))
+    disbursement_details = LazyAttribute("disbursement_details", lambda transaction, disbursement_details: DisbursementDetail(disbursement_details))
+    disputes = LazyAttribute("disputes", lambda transaction, disputes: [Dispute(dispute) for dispute in disputes])
+    authorization_adjustments = LazyAttribute("authorization_adjustments", lambda transaction, adjustments: [AuthorizationAdjustment(adjustment) for adjustment in adjustments])
+    risk_data = LazyAttribute("risk_data", lambda transaction, risk_data: RiskData(risk_data))
+    three_d_secure_info = LazyAttribute("three_d_secure_info", lambda transaction, three_d_secure_info: ThreeDSecureInfo(three_d_secure_info))
+    facilitated_details = LazyAttribute("facilitated_details", lambda transaction, facilitated_details: FacilitatedDetails(facilitated_details))
+    facilitator_details = LazyAttribute("facilitator_details", lambda transaction, facilitator_details: FacilitatorDetails(facilitator_details))
+
+    # Attributes that are replaced by their built value, and attributes built
+    # from a raw attribute that is removed from the transaction's attributes.
+    __built_attributes = ("add_ons", "discounts", "status_history", "descriptor", "disputes", "authorization_adjustments")
+    __details_attributes = (
+        ("billing", "billing_details"),
+        ("credit_card", "credit_card_details"),
+        ("paypal", "paypal_details"),
+        ("paypal_here", "paypal_here_details"),
+        ("local_payment", "local_payment_details"),
+        ("europe_bank_account", "europe_bank_account_details"),
+        ("us_bank_account", "us_bank_account"),
+        ("apple_pay", "apple_pay_details"),
         # NEXT_MAJOR_VERSION rename to google_pay_card_details
-        if "android_pay_card" in attributes:
-            self.android_pay_card_details = AndroidPayCard(gateway, attributes.pop("android_pay_card"))
+        ("android_pay_card", "android_pay_card_details"),
         # NEXT_MAJOR_VERSION remove amex express checkout
-        if "amex_express_checkout_card" in attributes:
-            self.amex_express_checkout_card_details = AmexExpressCheckoutCard(gateway, attributes.pop("amex_express_checkout_card"))
-        if "venmo_account" in attributes:
-            self.venmo_account_details = VenmoAccount(gateway, attributes.pop("venmo_account"))
-        if "visa_checkout_card" in attributes:
-            self.visa_checkout_card_details = VisaCheckoutCard(gateway, attributes.pop("visa_checkout_card"))
+        ("amex_express_checkout_card", "amex_express_checkout_card_details"),
+        ("venmo_account", "venmo_account_details"),
+        ("visa_checkout_card", "visa_checkout_card_details"),
         # NEXt_MAJOR_VERSION remove masterpass
-        if "masterpass_card" in attributes:
-            self.masterpass_card_details = MasterpassCard(gateway, attributes.pop("masterpass_card"))
-        if "samsung_pay_card" in attributes:
-            self.samsung_pay_card_details = SamsungPayCard(gateway, attributes.pop("samsung_pay_card"))
-        if "customer" in attributes:
-            self.customer_details = Customer(gateway, attributes.pop("customer"))
-        if "shipping" in attributes:
-            self.shipping_details = Address(gateway, attributes.pop("shipping"))
-        if "add_ons" in attributes:
-            self.add_ons = [AddOn(gateway, add_on) for add_on in self.add_ons]
-        if "discounts" in attributes:
-            self.discounts = [Discount(gateway, discount) for discount in self.discounts]
-        if "status_history" in attributes:
-            self.status_history = [StatusEvent(gateway, status_event) for status_event in self.status_history]
-        if "subscription" in attributes:
-            self.subscription_details = SubscriptionDetails(attributes.pop("subscription"))
-        if "descriptor" in attributes:
-            self.descriptor = Descriptor(gateway, attributes.pop("descriptor"))
-        if "disbursement_details" in attributes:
-            self.disbursement_details = DisbursementDetail(attributes.pop("disbursement_details"))
-        if "disputes" in attributes:
-            self.disputes = [Dispute(dispute) for dispute in self.disputes]
-        if "authorization_adjustments" in attributes:
-            self.authorization_adjustments = [AuthorizationAdjustment(authorization_adjustment) for authorization_adjustment in self.authorization_adjustments]
+        ("masterpass_card", "masterpass_card_details"),
+        ("samsung_pay_card", "samsung_pay_card_details"),
+        ("customer", "customer_details"),
+        ("shipping", "shipping_details"),
+        ("subscription", "subscription_details"),
+        ("disbursement_details", "disbursement_details"),
+        ("facilitated_details", "facilitated_details"),
+        ("facilitator_details", "facilitator_details")
+    )
+
+    def __init__(self, gateway, attributes):
+        Resource.__init__(self, gateway, attributes)
+
+        self._defer("amount", self.amount)
+        for name in ("tax_amount", "discount_amount", "shipping_amount"):
+            if name in attributes:
+                self._defer(name, attributes[name])
+        for key, name in Transaction.__details_attributes:
+            if key in attributes:
+                self._defer(name, attributes[key])
+        for name in Transaction.__built_attributes:
+            if name in attributes:
+                self._defer(name, attributes[name])
         if "payment_instrument_type" in attributes:
             self.payment_instrument_type = attributes["payment_instrument_type"]
 
         if "risk_data" in attributes:
-            self.risk_data = RiskData(attributes["risk_data"])
+            self._defer("risk_data", attributes["risk_data"])
         else:
             self.risk_data = None
         if "three_d_secure_info" in attributes and not attributes["three_d_secure_info"] is None:
-            self.three_d_secure_info = ThreeDSecureInfo(attributes["three_d_secure_info"])
+            self._defer("three_d_secure_info", attributes["three_d_secure_info"])
         else:
             self.three_d_secure_info = None
-        if "facilitated_details" in attributes:
-            self.facilitated_details = FacilitatedDetails(attributes.pop("facilitated_details"))
-        if "facilitator_details" in attributes:
-            self.facilitator_details = FacilitatorDetails(attributes.pop("facilitator_details"))
         if "network_transaction_id" in attributes:
             self.network_transaction_id = attributes["network_transaction_id"]
 
@@ -1,8 +1,13 @@
 import braintree
 import warnings
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import date, datetime, timedelta
 from braintree.error_result import ErrorResult
+from braintree.find_many_result import FindManyResult
 from braintree.resource import Resource
 from braintree.resource_collection import ResourceCollection
+from braintree.search_checkpoint import SearchCheckpoint
+from braintree.search import Search
 from braintree.successful_result import SuccessfulResult
 from braintree.transaction import Transaction
 from braintree.exceptions.not_found_error import NotFoundError
@@ -15,7 +20,7 @@ class TransactionGateway(object):
         self.config = gateway.config
 
     def clone_transaction(self, transaction_id, params):
-        Resource.verify_keys(params, Transaction.clone_signature())
+        Resource.verify_keys(params, Transaction.clone_signature)
         return self._post("/transactions/" + transaction_id + "/clone", {"transaction-clone": params})
 
     def cancel_release(self, transaction_id):
@@ -26,7 +31,7 @@ class TransactionGateway(object):
             return ErrorResult(self.gateway, response["api_error_response"])
 
     def create(self, params):
-        Resource.verify_keys(params, Transaction.create_signature())
+        Resource.verify_keys(params, Transaction.create_signature)
         return self._post("/transactions", {"transaction": params})
 
     def credit(self, params):
@@ -35,15 +40,31 @@ class TransactionGateway(object):
         params["type"] = Transaction.Type.Credit
         return self.create(params)
 
-    def find(self, transaction_id):
+    def find(self, transaction_id, raw=False):
         try:
             if transaction_id is None or transaction_id.strip() == "":
                 raise NotFoundError()
             response = self.config.http().get(self.config.base_merchant_path() + "/transactions/" + transaction_id)
+            if raw:
+                return response["transaction"]
             return Transaction(self.gateway, response["transaction"])
         except NotFoundError:
             raise NotFoundError("transaction with id " + repr(transaction_id) + " not found")
 
+    def find_many(self, transaction_ids, raw=False, chunk_size=50, workers=4):
+        """
+        Finds the transactions with the given ids using id-list searches of up to ``chunk_size``
+        ids, running up to ``workers`` of them concurrently. Returns a
+        :class:`FindManyResult <braintree.find_many_result.FindManyResult>` with the transactions
+        in the order of ``transaction_ids`` and the ids that were not found. With ``raw=True`` the
+        parsed response dicts are returned instead of Transactions. ::
+
+            result = gateway.transaction.find_many(["id1", "id2"])
+            for transaction in result:
+                print(transaction.id)
+        """
+        return FindManyResult.fetch(transaction_ids, self.__fetch_raw if raw else self.__fetch, chunk_size, workers)
+
     def hold_in_escrow(self, transaction_id):
         """
         Holds an existing submerchant transaction for escrow. It expects a transaction_id. ::
@@ -69,7 +90,7 @@ class TransactionGateway(object):
             options = {
                 "amount": amount_or_options
             }
-        Resource.verify_keys(options, Transaction.refund_signature())
+        Resource.verify_keys(options, Transaction.refund_signature)
         response = self.config.http().post(self.config.base_merchant_path() + "/transactions/" + transaction_id + "/refund", {"transaction": options})
         if "transaction" in response:
             return SuccessfulResult({"transaction": Transaction(self.gateway, response["transaction"])})
@@ -82,16 +103,91 @@ class TransactionGateway(object):
         params.update({"type": "sale"})
         return self.create(params)
 
-    def search(self, *query):
+    def search(self, *query, raw=False, checkpoint=None):
         if isinstance(query[0], list):
             query = query[0]
 
-        response = self.config.http().post(self.config.base_merchant_path() + "/transactions/advanced_search_ids", {"search": self.__criteria(query)})
+        criteria = self.__criteria(query)
+        response, search_checkpoint = SearchCheckpoint.run(checkpoint, "transactions", criteria, lambda: self.config.http().post(self.config.base_merchant_path() + "/transactions/advanced_search_ids", {"search": criteria}, idempotent=True))
         if "search_results" in response:
-            return ResourceCollection(query, response, self.__fetch)
+            return ResourceCollection(query, response, self.__fetch_raw if raw else self.__fetch, self.__fetch_raw, search_checkpoint)
         else:
             raise RequestTimeoutError("search timeout")
 
+    def sharded_search(self, start, end, *query, field="created_at", windows=8, max_ids=50000, min_window=timedelta(minutes=1), workers=4, raw=False, checkpoint=None):
+        """
+        Searches transactions whose ``field`` (``"created_at"``, ``"settled_at"`` or another
+        date range field) is between ``start`` and ``end`` by splitting the range into
+        ``windows`` time windows that are searched concurrently on up to ``workers``
+        threads. A window whose search times out or returns ``max_ids`` or more ids is
+        split in half and searched again, down to windows of ``min_window``; when such a
+        window still times out or returns ``max_ids`` or more ids, the search raises rather
+        than return a partial result. Dates are taken as midnight. Ids are merged
+        in window order without the duplicates found on window boundaries, and returned as
+        a collection like :meth:`search` returns::
+
+            collection = gateway.transaction.sharded_search(
+                datetime(2020, 3, 1), datetime(2020, 4, 1),
+                braintree.TransactionSearch.status == braintree.Transaction.Status.Settled
+            )
+            for transaction in collection.prefetch(batches=8):
+                print(transaction.id)
+
+        With a ``checkpoint``, the merged ids are stored and reused when the search is run again.
+        """
+        if query and isinstance(query[0], list):
+            query = query[0]
+
+        node = getattr(braintree.transaction_search.TransactionSearch, field, None)
+        if not isinstance(node, Search.RangeNodeBuilder):
+            raise ValueError("cannot shard a transaction search on " + repr(field))
+        if any(term.name == field for term in query):
+            raise ValueError(field + " is set by the search windows and cannot also be part of the query")
+        if end <= start:
+            raise ValueError("end must be after start")
+
+        criteria = {"query": self.__criteria(query), "field": field, "start": start, "end": end}
+        start, end = self.__as_datetime(start), self.__as_datetime(end)
+        response, search_checkpoint = SearchCheckpoint.run(checkpoint, "transactions", criteria, lambda: self.__search_windows(query, node, start, end, windows, max_ids, min_window, workers))
+        return ResourceCollection(query, response, self.__fetch_raw if raw else self.__fetch, self.__fetch_raw, search_checkpoint)
+
+    def __search_windows(self, query, node, start, end, windows, max_ids, min_window, workers):
+        found = []
+        page_size = None
+        pending = set()
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            pending = set(executor.submit(self.__search_window, query, node, window) for window in self.__split_window(start, end, windows))
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    window, results = future.result()
+                    if results is None or len(results["ids"]) >= max_ids:
+                        halves = self.__split_window(window[0], window[1], 2)
+                        # Halves stop shrinking once the window is a single microsecond.
+                        if window[1] - window[0] > min_window and all(half[0] < half[1] for half in halves):
+                            pending.update(executor.submit(self.__search_window, query, node, half) for half in halves)
+                            continue
+                        if results is None:
+                            raise RequestTimeoutError("search timeout")
+                        raise ValueError("search window from %s to %s matches %d or more transactions - raise max_ids or lower min_window" % (window[0], window[1], max_ids))
+                    found.append((window, results["ids"]))
+                    page_size = results["page_size"]
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+        ids = []
+        seen = set()
+        for _, window_ids in sorted(found, key=lambda item: item[0][0]):
+            for transaction_id in window_ids:
+                if transaction_id not in seen:
+                    seen.add(transaction_id)
+                    ids.append(transaction_id)
+
+        return {"search_results": {"ids": ids, "page_size": page_size or 50}}
+
     def release_from_escrow(self, transaction_id):
         response = self.config.http().put(self.config.base_merchant_path() + "/transactions/" + transaction_id + "/release_from_escrow", {})
         if "transaction" in response:
@@ -102,7 +198,7 @@ class TransactionGateway(object):
     def submit_for_settlement(self, transaction_id, amount=None, params=None):
         if params is None:
             params = {}
-        Resource.verify_keys(params, Transaction.submit_for_settlement_signature())
+        Resource.verify_keys(params, Transaction.submit_for_settlement_signature)
         transaction_params = {"amount": amount}
         transaction_params.update(params)
         response = self.config.http().put(self.config.base_merchant_path() + "/transactions/" + transaction_id + "/submit_for_settlement",
@@ -115,7 +211,7 @@ class TransactionGateway(object):
     def update_details(self, transaction_id, params=None):
         if params is None:
             params = {}
-        Resource.verify_keys(params, Transaction.update_details_signature())
+        Resource.verify_keys(params, Transaction.update_details_signature)
         response = self.config.http().put(self.config.base_merchant_path() + "/transactions/" + transaction_id + "/update_details",
                 {"transaction": params})
         if "transaction" in response:
@@ -126,7 +222,7 @@ class TransactionGateway(object):
     def submit_for_partial_settlement(self, transaction_id, amount, params=None):
         if params is None:
             params = {}
-        Resource.verify_keys(params, Transaction.submit_for_settlement_signature())
+        Resource.verify_keys(params, Transaction.submit_for_settlement_signature)
         transaction_params = {"amount": amount}
         transaction_params.update(params)
         response = self.config.http().post(self.config.base_merchant_path() + "/transactions/" + transaction_id + "/submit_for_partial_settlement",
@@ -144,14 +240,37 @@ class TransactionGateway(object):
             return ErrorResult(self.gateway, response["api_error_response"])
 
     def __fetch(self, query, ids):
+        return [Transaction(self.gateway, item) for item in self.__fetch_raw(query, ids)]
+
+    def __fetch_raw(self, query, ids):
         criteria = self.__criteria(query)
         criteria["ids"] = braintree.transaction_search.TransactionSearch.ids.in_list(ids).to_param()
-        response = self.config.http().post(self.config.base_merchant_path() + "/transactions/advanced_search", {"search": criteria})
+        response = self.config.http().post(self.config.base_merchant_path() + "/transactions/advanced_search", {"search": criteria}, idempotent=True)
         if "credit_card_transactions" in response:
-            return [Transaction(self.gateway, item) for item in ResourceCollection._extract_as_array(response["credit_card_transactions"], "transaction")]
+            return ResourceCollection._extract_as_array(response["credit_card_transactions"], "transaction")
         else:
             raise RequestTimeoutError("search timeout")
 
+    def __search_window(self, query, node, window):
+        criteria = self.__criteria(list(query) + [node.between(window[0], window[1])])
+        try:
+            response = self.config.http().post(self.config.base_merchant_path() + "/transactions/advanced_search_ids", {"search": criteria}, idempotent=True)
+        except RequestTimeoutError:
+            return window, None
+        return window, response.get("search_results")
+
+    @staticmethod
+    def __as_datetime(value):
+        if isinstance(value, date) and not isinstance(value, datetime):
+            return datetime(value.year, value.month, value.day)
+        return value
+
+    @staticmethod
+    def __split_window(start, end, count):
+        step = (end - start) / count
+        bounds = [start + step * index for index in range(count)] + [end]
+        return [(bounds[index], bounds[index + 1]) for index in range(count)]
+
     def __criteria(self, query):
         criteria = {}
         for term in query:
@@ -53,12 +53,12 @@ class UsBankAccountVerification(AttributeGetter):
         return Configuration.gateway().us_bank_account_verification.confirm_micro_transfer_amounts(verification_id, amounts)
 
     @staticmethod
-    def find(verification_id):
-        return Configuration.gateway().us_bank_account_verification.find(verification_id)
+    def find(verification_id, raw=False):
+        return Configuration.gateway().us_bank_account_verification.find(verification_id, raw=raw)
 
     @staticmethod
-    def search(*query):
-        return Configuration.gateway().us_bank_account_verification.search(*query)
+    def search(*query, raw=False, checkpoint=None):
+        return Configuration.gateway().us_bank_account_verification.search(*query, raw=raw, checkpoint=checkpoint)
 
     def __eq__(self, other):
         if not isinstance(other, UsBankAccountVerification):
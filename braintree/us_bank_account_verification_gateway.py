@@ -4,6 +4,7 @@ from braintree.exceptions.not_found_error import NotFoundError
 from braintree.error_result import ErrorResult
 from braintree.successful_result import SuccessfulResult
 from braintree.resource_collection import ResourceCollection
+from braintree.search_checkpoint import SearchCheckpoint
 
 class UsBankAccountVerificationGateway(object):
     def __init__(self, gateway):
@@ -32,7 +33,7 @@ class UsBankAccountVerificationGateway(object):
         except NotFoundError:
             raise NotFoundError("UsBankAccountVerification with id " + repr(verification_id) + " not found")
 
-    def find(self, verification_id):
+    def find(self, verification_id, raw=False):
         try:
             if verification_id is None or verification_id.strip() == "":
                 raise NotFoundError()
@@ -41,20 +42,29 @@ class UsBankAccountVerificationGateway(object):
                 self.config.base_merchant_path() + "/us_bank_account_verifications/" + verification_id
             )
 
+            if raw:
+                return response["us_bank_account_verification"]
             return UsBankAccountVerification(self.gateway, response["us_bank_account_verification"])
         except NotFoundError:
             raise NotFoundError("UsBankAccountVerification with id " + repr(verification_id) + " not found")
 
-    def search(self, *query):
+    def search(self, *query, raw=False, checkpoint=None):
         if isinstance(query[0], list):
             query = query[0]
 
-        response = self.config.http().post(
-            self.config.base_merchant_path() + "/us_bank_account_verifications/advanced_search_ids",
-            {"search": self.__criteria(query)}
+        criteria = self.__criteria(query)
+        response, search_checkpoint = SearchCheckpoint.run(
+            checkpoint,
+            "us_bank_account_verifications",
+            criteria,
+            lambda: self.config.http().post(
+                self.config.base_merchant_path() + "/us_bank_account_verifications/advanced_search_ids",
+                {"search": criteria},
+                idempotent=True
+            )
         )
 
-        return ResourceCollection(query, response, self.__fetch)
+        return ResourceCollection(query, response, self.__fetch_raw if raw else self.__fetch, self.__fetch_raw, search_checkpoint)
 
     def __criteria(self, query):
         criteria = {}
@@ -68,18 +78,20 @@ class UsBankAccountVerificationGateway(object):
         return criteria
 
     def __fetch(self, query, ids):
+        return [UsBankAccountVerification(self.gateway, item) for item in self.__fetch_raw(query, ids)]
+
+    def __fetch_raw(self, query, ids):
         criteria = self.__criteria(query)
 
         criteria["ids"] = UsBankAccountVerificationSearch.ids.in_list(ids).to_param()
 
         response = self.config.http().post(
             self.config.base_merchant_path() + "/us_bank_account_verifications/advanced_search",
-            {"search": criteria}
+            {"search": criteria},
+            idempotent=True
         )
 
-        collection_array = ResourceCollection._extract_as_array(
+        return ResourceCollection._extract_as_array(
             response["us_bank_account_verifications"],
             "us_bank_account_verification"
         )
-
-        return [UsBankAccountVerification(self.gateway, item) for item in collection_array]
@@ -1,7 +1,21 @@
+from braintree.util.async_http import AiohttpStrategy
+from braintree.util.async_http import AsyncHttp
+from braintree.util.columnar import AmountColumn
+from braintree.util.columnar import CategoryColumn
+from braintree.util.columnar import ColumnFrame
+from braintree.util.columnar import DatetimeColumn
+from braintree.util.columnar import StringColumn
 from braintree.util.constants import Constants
 from braintree.util.crypto import Crypto
 from braintree.util.generator import Generator
 from braintree.util.http import Http
+from braintree.util.http_pool import HttpPool
+from braintree.util.instrumentation import InstrumentedGateway
+from braintree.util.instrumentation import MetricsSink
+from braintree.util.instrumentation import OperationTiming
+from braintree.util.pooled_http import PooledHttp
+from braintree.util.rate_limiter import RateLimiter
+from braintree.util.retry_policy import RetryPolicy
 from braintree.util.graphql_client import GraphQLClient
 from braintree.util.parser import Parser
 from braintree.util.xml_util import XmlUtil
@@ -0,0 +1,156 @@
+import asyncio
+import ssl
+from time import perf_counter
+from braintree.environment import Environment
+from braintree.exceptions.configuration_error import ConfigurationError
+from braintree.exceptions.http.connection_error import ConnectionError
+from braintree.exceptions.http.invalid_response_error import InvalidResponseError
+from braintree.exceptions.http.timeout_error import ConnectTimeoutError
+from braintree.exceptions.http.timeout_error import ReadTimeoutError
+from braintree.exceptions.http.timeout_error import TimeoutError
+from braintree.exceptions.unexpected_error import UnexpectedError
+from braintree.util.http import Http, _RequestAttempts
+from braintree.util.instrumentation import NULL_TIMING, current_timing, finish_timing, http_operation, start_timing
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+class AsyncHttp(Http):
+    """
+    Awaitable counterpart of :class:`Http <braintree.util.http.Http>`. ``get``,
+    ``post``, ``put`` and ``delete`` return coroutines that resolve to the
+    same parsed response dictionaries.
+    """
+
+    def __init__(self, config, http_strategy, environment=None):
+        Http.__init__(self, config, environment)
+        self.http_strategy = http_strategy
+
+    async def _make_request(self, http_verb, path, content_type, params=None, files=None, header_overrides=None, idempotent=False):
+        metrics_sink = getattr(self.config, "metrics_sink", None)
+        if metrics_sink is None:
+            return await self.__send(http_verb, path, content_type, params, files, header_overrides, idempotent, NULL_TIMING)
+
+        timing = current_timing()
+        if timing is not None:
+            return await self.__send(http_verb, path, content_type, params, files, header_overrides, idempotent, timing)
+
+        timing, token, started = start_timing(http_operation(http_verb, path))
+        try:
+            return await self.__send(http_verb, path, content_type, params, files, header_overrides, idempotent, timing)
+        except Exception as e:
+            timing.error = e.__class__.__name__
+            raise
+        finally:
+            finish_timing(metrics_sink, timing, token, started)
+
+    async def __send(self, http_verb, path, content_type, params, files, header_overrides, idempotent, timing):
+        attempts = _RequestAttempts(self.config, idempotent, timing)
+
+        while True:
+            full_path, headers, request_body = attempts.prepare(self, path, content_type, params, files, header_overrides)
+
+            delay = attempts.rate_limit_delay(http_verb, full_path)
+            if delay > 0:
+                await asyncio.sleep(delay)
+                attempts.waited(delay)
+
+            phase_started = perf_counter()
+            try:
+                response = await self.http_strategy.http_do(http_verb, full_path, headers, request_body)
+            except Exception as e:
+                timing.add("network", perf_counter() - phase_started)
+                delay = attempts.retry_delay_for_exception(e)
+                if delay is not None:
+                    await asyncio.sleep(delay)
+                    attempts.retried(delay)
+                    continue
+                if self.config.wrap_http_exceptions:
+                    self.http_strategy.handle_exception(e)
+                else:
+                    raise
+            timing.add("network", perf_counter() - phase_started)
+
+            delay = attempts.retry_delay_for_response(request_body, response)
+            if delay is not None:
+                await asyncio.sleep(delay)
+                attempts.retried(delay)
+                continue
+
+            return attempts.process(self, response, content_type)
+
+class AiohttpStrategy(object):
+    """
+    The default async http strategy. Requests are sent through a single
+    ``aiohttp.ClientSession`` that is created on first use inside the running
+    event loop and shared by every concurrent request. ``limit`` caps the
+    total number of open connections and ``limit_per_host`` the number of
+    connections to a single host.
+
+    Requires the ``aiohttp`` package (``pip install braintree[async]``).
+    """
+
+    def __init__(self, config, environment=None, limit=100, limit_per_host=0):
+        if aiohttp is None:
+            raise ConfigurationError("aiohttp is required for the async gateway - install braintree[async]")
+
+        self.config = config
+        self.environment = environment or self.config.environment
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.__session = None
+        self.__ssl_context = None
+
+    async def http_do(self, http_verb, path, headers, request_body):
+        if isinstance(request_body, tuple):
+            raise UnexpectedError("multipart requests are not supported by the async gateway")
+        if not isinstance(request_body, (str, bytes)):
+            request_body = b"".join(request_body)
+
+        async with self.__client_session().request(
+            http_verb,
+            path,
+            headers=self.__text_headers(headers),
+            data=request_body,
+            ssl=self.__ssl()
+        ) as response:
+            return [response.status, await response.text(), response.headers]
+
+    def handle_exception(self, exception):
+        if isinstance(exception, getattr(aiohttp, "ConnectionTimeoutError", ())):
+            raise ConnectTimeoutError(exception)
+        elif isinstance(exception, aiohttp.ServerTimeoutError):
+            raise ReadTimeoutError(exception)
+        elif isinstance(exception, asyncio.TimeoutError):
+            raise TimeoutError(exception)
+        elif isinstance(exception, aiohttp.ClientConnectionError):
+            raise ConnectionError(exception)
+        elif isinstance(exception, aiohttp.ClientResponseError):
+            raise InvalidResponseError(exception)
+        else:
+            raise UnexpectedError(exception)
+
+    async def close(self):
+        if self.__session is not None:
+            await self.__session.close()
+            self.__session = None
+
+    def __client_session(self):
+        if self.__session is None or self.__session.closed:
+            self.__session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.limit, limit_per_host=self.limit_per_host),
+                timeout=aiohttp.ClientTimeout(total=self.config.timeout)
+            )
+        return self.__session
+
+    def __ssl(self):
+        if self.config.environment == Environment.Development:
+            return False
+        if self.__ssl_context is None:
+            self.__ssl_context = ssl.create_default_context(cafile=self.environment.ssl_certificate)
+        return self.__ssl_context
+
+    def __text_headers(self, headers):
+        return dict((key, value.decode("ascii") if isinstance(value, bytes) else value) for key, value in headers.items())
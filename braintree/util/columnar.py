@@ -0,0 +1,291 @@
+import re
+from abc import ABC, abstractmethod
+from array import array
+from collections import OrderedDict
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal, ROUND_HALF_EVEN
+from braintree.exceptions.configuration_error import ConfigurationError
+from braintree.util.datetime_parser import parse_datetime
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+_AMOUNT_REGEX = re.compile(r"(-?)(\d+)(?:\.(\d*))?\Z")
+_EPOCH = datetime(1970, 1, 1)
+
+_CATEGORY_NAMES = frozenset([
+    "status",
+    "type",
+    "kind",
+    "source",
+    "card_type",
+    "currency_iso_code",
+    "merchant_account_id",
+    "plan_id",
+    "processor_response_code",
+    "processor_response_type",
+    "gateway_rejection_reason",
+    "country_of_issuance",
+    "reason",
+    "reason_code"
+])
+
+def _require_numpy():
+    if numpy is None:
+        raise ConfigurationError("numpy is required to convert columns to arrays - install braintree[columnar]")
+
+def _buffer_array(values, dtype, copy):
+    _require_numpy()
+    shared = numpy.frombuffer(values, dtype=dtype)
+    return shared.copy() if copy else shared
+
+class Column(ABC):
+    """
+    Base of the typed column buffers a :class:`ColumnFrame` is made of. Each column reads
+    the value at ``path`` of every record, given as the dotted keys of the parsed response
+    (``"credit_card.card_type"``); by default the path is the column's name.
+
+    ``to_numpy`` returns a copy of the column. With ``copy=False`` the array shares the
+    column's buffer where the layout allows, and appending to the column afterwards raises
+    BufferError for as long as the array is alive.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+
+    @abstractmethod
+    def append(self, value):
+        pass
+
+    @abstractmethod
+    def __len__(self):
+        pass
+
+    @abstractmethod
+    def __getitem__(self, index):
+        pass
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    @abstractmethod
+    def to_numpy(self, copy=True):
+        pass
+
+class AmountColumn(Column):
+    """
+    Amounts as fixed-point int64 values in units of ``10 ** -scale``, so that ``"10.25"``
+    is stored as ``1025`` with the default scale of 2. Missing amounts are stored as
+    :attr:`MISSING`.
+    """
+    MISSING = -(1 << 63)
+
+    def __init__(self, path=None, scale=2):
+        Column.__init__(self, path)
+        self.scale = scale
+        self.values = array("q")
+
+    def append(self, value):
+        self.values.append(self.__fixed_point(value))
+
+    def __fixed_point(self, value):
+        if value is None or value == "":
+            return AmountColumn.MISSING
+        if isinstance(value, str):
+            match = _AMOUNT_REGEX.match(value)
+            if match is not None and len(match.group(3) or "") <= self.scale:
+                sign, whole, fraction = match.groups()
+                units = int(whole + (fraction or "").ljust(self.scale, "0"))
+                return -units if sign else units
+        return int(Decimal(value).scaleb(self.scale).to_integral_value(ROUND_HALF_EVEN))
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, index):
+        value = self.values[index]
+        if value == AmountColumn.MISSING:
+            return None
+        return Decimal(value).scaleb(-self.scale)
+
+    def to_numpy(self, copy=True):
+        return _buffer_array(self.values, "int64", copy)
+
+class CategoryColumn(Column):
+    """
+    Values from a small set, such as statuses and types, stored as int32 codes into
+    :attr:`categories`. Missing values are stored as code -1.
+    """
+    MISSING = -1
+
+    def __init__(self, path=None):
+        Column.__init__(self, path)
+        self.categories = []
+        self.codes = array("i")
+        self.__index = {}
+
+    def append(self, value):
+        if value is None:
+            self.codes.append(CategoryColumn.MISSING)
+            return
+        code = self.__index.get(value)
+        if code is None:
+            code = self.__index[value] = len(self.categories)
+            self.categories.append(value)
+        self.codes.append(code)
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __getitem__(self, index):
+        code = self.codes[index]
+        if code == CategoryColumn.MISSING:
+            return None
+        return self.categories[code]
+
+    def to_numpy(self, copy=True):
+        return _buffer_array(self.codes, "int32", copy)
+
+class DatetimeColumn(Column):
+    """
+    Timestamps as int64 microseconds since the epoch in UTC, which is the layout of
+    numpy's ``datetime64[us]``. Dates are stored as midnight UTC and missing values as
+    :attr:`MISSING`, which numpy reads as ``NaT``.
+    """
+    MISSING = -(1 << 63)
+
+    def __init__(self, path=None):
+        Column.__init__(self, path)
+        self.values = array("q")
+
+    def append(self, value):
+        if value is None or value == "":
+            self.values.append(DatetimeColumn.MISSING)
+            return
+        if isinstance(value, str):
+            value = parse_datetime(value)
+        if isinstance(value, datetime):
+            if value.tzinfo is not None:
+                value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        elif isinstance(value, date):
+            value = datetime(value.year, value.month, value.day)
+        delta = value - _EPOCH
+        self.values.append((delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, index):
+        value = self.values[index]
+        if value == DatetimeColumn.MISSING:
+            return None
+        return _EPOCH + timedelta(microseconds=value)
+
+    def to_numpy(self, copy=True):
+        return _buffer_array(self.values, "int64", copy).view("datetime64[us]")
+
+class StringColumn(Column):
+    """
+    Strings stored as a table: one UTF-8 buffer holding every value back to back and
+    int64 offsets of where each value ends. Other values are stored as their ``str``.
+    """
+
+    def __init__(self, path=None):
+        Column.__init__(self, path)
+        self.data = bytearray()
+        self.offsets = array("q", [0])
+        self.present = bytearray()
+
+    def append(self, value):
+        if value is None:
+            self.present.append(0)
+        else:
+            self.present.append(1)
+            if not isinstance(value, str):
+                value = str(value)
+            self.data += value.encode("utf-8")
+        self.offsets.append(len(self.data))
+
+    def __len__(self):
+        return len(self.present)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not self.present[index]:
+            return None
+        return self.data[self.offsets[index]:self.offsets[index + 1]].decode("utf-8")
+
+    def to_numpy(self, copy=True):
+        _require_numpy()
+        return numpy.array(list(self), dtype=object)
+
+def infer_column(name):
+    """ Returns the column used for ``name`` when a :class:`ColumnFrame` is given only names. """
+    key = name.rsplit(".", 1)[-1]
+    if key.endswith("amount") or key in ("price", "balance"):
+        return AmountColumn()
+    if key.endswith("_at") or key.endswith("_date"):
+        return DatetimeColumn()
+    if key in _CATEGORY_NAMES or key.endswith("_status") or key.endswith("_type"):
+        return CategoryColumn()
+    return StringColumn()
+
+class ColumnFrame(object):
+    """
+    Search results held column by column in typed buffers, for analytics over many
+    records without building a resource for each one::
+
+        frame = braintree.Transaction.search(search_criteria).to_columns(["id", "amount", "status", "created_at"])
+        frame["amount"].values                  # array of int64 cents
+        frame.to_numpy()["created_at"]          # datetime64[us] array, requires numpy
+
+    Columns are given either as a list of names, whose column types are inferred from
+    the names, or as an ordered mapping of names to :class:`Column` instances.
+    """
+
+    def __init__(self, columns):
+        if isinstance(columns, dict):
+            self.columns = OrderedDict(columns)
+        else:
+            self.columns = OrderedDict((name, infer_column(name)) for name in columns)
+        self.__paths = [
+            (column, (column.path or name).split("."))
+            for name, column in self.columns.items()
+        ]
+
+    def append(self, record):
+        """ Appends one record, a parsed response dict or a resource, to every column. """
+        for column, path in self.__paths:
+            value = record
+            for key in path:
+                if value is None:
+                    break
+                if isinstance(value, dict):
+                    value = value.get(key)
+                else:
+                    value = getattr(value, key, None)
+            column.append(value)
+
+    def extend(self, records):
+        for record in records:
+            self.append(record)
+        return self
+
+    def __len__(self):
+        for column in self.columns.values():
+            return len(column)
+        return 0
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def to_numpy(self, copy=True):
+        """
+        Returns a dict of column names to numpy arrays. With ``copy=False`` the arrays share
+        the column buffers where possible, and the frame cannot be extended while they are alive.
+        """
+        return OrderedDict((name, column.to_numpy(copy)) for name, column in self.columns.items())
@@ -26,13 +26,8 @@ class Crypto:
         if left is None or right is None:
             return False
 
-        left_bytes = [ord(char) for char in left]
-        right_bytes = [ord(char) for char in right]
-
-        if len(left_bytes) != len(right_bytes):
-            return False
-
-        result = 0
-        for left_byte, right_byte in zip(left_bytes, right_bytes):
-            result |= left_byte ^ right_byte
-        return result == 0
+        if isinstance(left, text_type):
+            left = left.encode("utf-8")
+        if isinstance(right, text_type):
+            right = right.encode("utf-8")
+        return hmac.compare_digest(left, right)
@@ -1,4 +1,5 @@
 import datetime
+import re
 import sys
 from decimal import Decimal
 
@@ -6,59 +7,145 @@ integer_types = int
 text_type = str
 binary_type = bytes
 
+_ESCAPE_TABLE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    "'": "&apos;",
+    '"': "&quot;"
+})
+_NEEDS_ESCAPING = re.compile("[&<>'\"]")
+
 class Generator(object):
+    """
+    Serializes a dictionary into the XML request format in a single pass.
+    Fragments are emitted in order to a writer, so nested structures are
+    never copied while the document is assembled. ::
+
+        Generator(params).generate()                # str
+        Generator(params).write(io.StringIO())      # any object with write(str)
+        Generator(params).chunks(8192)              # lazy iterator of utf-8 bytes
+    """
+
+    # Most keys come from the request signatures, but custom field names are
+    # caller supplied, so the number of cached keys is capped.
+    __tag_cache = {}
+    __tag_cache_limit = 4096
+
     def __init__(self, dict):
         self.dict = dict
 
     def generate(self):
-        return self.__generate_dict(self.dict)
+        parts = []
+        self.__generate_dict(self.dict, parts.append)
+        return "".join(parts)
+
+    def write(self, writer):
+        self.__generate_dict(self.dict, writer.write)
+        return writer
+
+    def chunks(self, chunk_size=8192):
+        chunk = []
+        size = 0
+        for part in self.__iter_dict(self.dict):
+            chunk.append(part)
+            size += len(part)
+            if size >= chunk_size:
+                yield "".join(chunk).encode("utf-8")
+                chunk = []
+                size = 0
+        if chunk:
+            yield "".join(chunk).encode("utf-8")
 
     def __escape(self, value):
-        return value.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace("'", "&apos;").replace('"', "&quot;")
+        if _NEEDS_ESCAPING.search(value) is None:
+            return value
+        return value.translate(_ESCAPE_TABLE)
+
+    def __tags(self, key):
+        tags = Generator.__tag_cache.get(key)
+        if tags is None:
+            escaped = self.__escape(key)
+            # The typed variants keep the key unescaped in the open tag.
+            tags = (
+                "<" + escaped + ">",
+                "</" + escaped + ">",
+                "<" + key + " type=\"array\">",
+                "<" + key + " type=\"boolean\">",
+                "<" + key + " type=\"integer\">",
+                "<" + key + " type=\"datetime\">"
+            )
+            if len(Generator.__tag_cache) < Generator.__tag_cache_limit:
+                Generator.__tag_cache[key] = tags
+        return tags
 
     def __generate_boolean(self, value):
-        return str(value).lower()
+        return "true" if value else "false"
 
     def __generate_datetime(self, value):
         return value.strftime("%Y-%m-%dT%H:%M:%SZ")
 
-    def __generate_dict(self, dictionary):
-        xml = ""
+    def __generate_text(self, value):
+        return self.__escape(value).encode('ascii', 'xmlcharrefreplace').decode('utf-8')
+
+    def __generate_dict(self, dictionary, write):
         for key, val in dictionary.items():
-            xml += self.__generate_node(key, val)
-        return xml
+            self.__generate_node(key, val, write)
 
-    def __generate_list(self, list):
-        xml = ""
+    def __generate_list(self, list, write):
         for item in list:
-            xml += self.__generate_node("item", item)
-        return xml
+            self.__generate_node("item", item, write)
+
+    def __generate_node(self, key, value, write):
+        tags = Generator.__tag_cache.get(key) or self.__tags(key)
 
-    def __generate_node(self, key, value):
-        open_tag = "<" + self.__escape(key) + ">"
-        close_tag = "</" + self.__escape(key) + ">"
+        if isinstance(value, dict):
+            write(tags[0])
+            self.__generate_dict(value, write)
+            write(tags[1])
+        elif isinstance(value, list):
+            write(tags[2])
+            self.__generate_list(value, write)
+            write(tags[1])
+        else:
+            write(self.__generate_scalar(tags, value))
+
+    def __iter_dict(self, dictionary):
+        for key, val in dictionary.items():
+            for part in self.__iter_node(key, val):
+                yield part
+
+    def __iter_node(self, key, value):
+        tags = Generator.__tag_cache.get(key) or self.__tags(key)
 
+        if isinstance(value, dict):
+            yield tags[0]
+            for part in self.__iter_dict(value):
+                yield part
+            yield tags[1]
+        elif isinstance(value, list):
+            yield tags[2]
+            for item in value:
+                for part in self.__iter_node("item", item):
+                    yield part
+            yield tags[1]
+        else:
+            yield self.__generate_scalar(tags, value)
+
+    def __generate_scalar(self, tags, value):
         if isinstance(value, text_type):
-            return open_tag + self.__escape(value).encode('ascii', 'xmlcharrefreplace').decode('utf-8') + close_tag
+            return tags[0] + self.__generate_text(value) + tags[1]
         elif isinstance(value, binary_type):
-            return open_tag + self.__escape(value) + close_tag
+            return tags[0] + self.__generate_text(value.decode('utf-8')) + tags[1]
         elif isinstance(value, Decimal):
-            return open_tag + str(value) + close_tag
-        elif isinstance(value, dict):
-            return open_tag + self.__generate_dict(value) + close_tag
-        elif isinstance(value, list):
-            open_tag = "<" + key + " type=\"array\">"
-            return open_tag + self.__generate_list(value) + close_tag
+            return tags[0] + str(value) + tags[1]
         elif isinstance(value, bool):
-            open_tag = "<" + key + " type=\"boolean\">"
-            return open_tag + self.__generate_boolean(value) + close_tag
-        elif isinstance(value, integer_types) and not isinstance(value, bool):
-            open_tag = "<" + key + " type=\"integer\">"
-            return open_tag + str(value) + close_tag
+            return tags[3] + self.__generate_boolean(value) + tags[1]
+        elif isinstance(value, integer_types):
+            return tags[4] + str(value) + tags[1]
         elif isinstance(value, type(None)):
-            return open_tag + close_tag
+            return tags[0] + tags[1]
         elif isinstance(value, datetime.datetime) or isinstance(value, datetime.date):
-            open_tag = "<" + key + " type=\"datetime\">"
-            return open_tag + self.__generate_datetime(value) + close_tag
+            return tags[5] + self.__generate_datetime(value) + tags[1]
         else:
             raise RuntimeError("Unexpected XML node type: " + str(type(value)))
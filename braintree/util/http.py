@@ -1,10 +1,13 @@
 import sys
+import time
 import requests
+from time import perf_counter
 from base64 import encodebytes
 import json
 import braintree
 from braintree import version
 from braintree.environment import Environment
+from braintree.util.instrumentation import NULL_TIMING, current_timing, finish_timing, http_operation, start_timing
 from braintree.util.xml_util import XmlUtil
 from braintree.exceptions.authentication_error import AuthenticationError
 from braintree.exceptions.authorization_error import AuthorizationError
@@ -22,6 +25,67 @@ from braintree.exceptions.too_many_requests_error import TooManyRequestsError
 from braintree.exceptions.unexpected_error import UnexpectedError
 from braintree.exceptions.upgrade_required_error import UpgradeRequiredError
 
+class _RequestAttempts(object):
+    """
+    Retry, backoff and rate limit bookkeeping for the attempts of one request, shared by
+    :class:`Http` and :class:`AsyncHttp <braintree.util.async_http.AsyncHttp>` so that each
+    only performs its own waiting and I/O.
+    """
+
+    def __init__(self, config, idempotent, timing):
+        self.config = config
+        self.timing = timing
+        self.retry_policy = getattr(config, "retry_policy", None) if idempotent else None
+        self.rate_limiter = getattr(config, "rate_limiter", None)
+        self.endpoint_class = None
+        self.started = time.monotonic()
+        self.attempt = 0
+
+    def prepare(self, http, path, content_type, params, files, header_overrides):
+        phase_started = perf_counter()
+        try:
+            return http._prepare_request(path, content_type, params, files, header_overrides)
+        finally:
+            self.timing.add("serialize", perf_counter() - phase_started)
+
+    def rate_limit_delay(self, http_verb, full_path):
+        """ Reserves a slot with the rate limiter and returns the seconds to wait for it. """
+        if not self.rate_limiter:
+            return 0
+        self.endpoint_class = self.rate_limiter.endpoint_class(http_verb, full_path)
+        return self.rate_limiter.reserve(self.config.merchant_id, self.endpoint_class)
+
+    def retry_delay_for_exception(self, exception):
+        """ Returns the seconds to wait before retrying after ``exception``, or None to give up. """
+        if not self.retry_policy:
+            return None
+        return self.retry_policy.delay_for_exception(self.attempt, self.started, exception)
+
+    def retry_delay_for_response(self, request_body, response):
+        """ Records ``response`` and returns the seconds to wait before retrying it, or None to keep it. """
+        status, response_body = response[0], response[1]
+        self.timing.record_request(request_body, status, response_body)
+        if self.rate_limiter:
+            self.rate_limiter.record(self.config.merchant_id, self.endpoint_class, status)
+        if not self.retry_policy or not Http.is_error_status(status):
+            return None
+        response_headers = response[2] if len(response) > 2 else None
+        return self.retry_policy.delay_for_status(self.attempt, self.started, status, response_headers)
+
+    def waited(self, delay):
+        self.timing.add("wait", delay)
+
+    def retried(self, delay):
+        self.timing.add("wait", delay)
+        self.attempt += 1
+
+    def process(self, http, response, content_type):
+        phase_started = perf_counter()
+        try:
+            return http._process_response(response[0], response[1], content_type)
+        finally:
+            self.timing.add("parse", perf_counter() - phase_started)
+
 class Http(object):
     class ContentType(object):
         Xml = "application/xml"
@@ -59,36 +123,84 @@ class Http(object):
         self.config = config
         self.environment = environment or self.config.environment
 
-    def post(self, path, params=None):
-        return self._make_request("POST", path, Http.ContentType.Xml, params)
+    def post(self, path, params=None, idempotent=False):
+        return self._make_request("POST", path, Http.ContentType.Xml, params, idempotent=idempotent)
 
-    def delete(self, path):
-        return self._make_request("DELETE", path, Http.ContentType.Xml)
+    def delete(self, path, idempotent=False):
+        return self._make_request("DELETE", path, Http.ContentType.Xml, idempotent=idempotent)
 
     def get(self, path):
-        return self._make_request("GET", path, Http.ContentType.Xml)
+        return self._make_request("GET", path, Http.ContentType.Xml, idempotent=True)
 
-    def put(self, path, params=None):
-        return self._make_request("PUT", path, Http.ContentType.Xml, params)
+    def put(self, path, params=None, idempotent=False):
+        return self._make_request("PUT", path, Http.ContentType.Xml, params, idempotent=idempotent)
 
     def post_multipart(self, path, files, params=None):
         return self._make_request("POST", path, Http.ContentType.Multipart, params, files)
 
-    def _make_request(self, http_verb, path, content_type, params=None, files=None, header_overrides=None):
+    def _make_request(self, http_verb, path, content_type, params=None, files=None, header_overrides=None, idempotent=False):
+        metrics_sink = getattr(self.config, "metrics_sink", None)
+        if metrics_sink is None:
+            return self.__send(http_verb, path, content_type, params, files, header_overrides, idempotent, NULL_TIMING)
+
+        timing = current_timing()
+        if timing is not None:
+            return self.__send(http_verb, path, content_type, params, files, header_overrides, idempotent, timing)
+
+        timing, token, started = start_timing(http_operation(http_verb, path))
+        try:
+            return self.__send(http_verb, path, content_type, params, files, header_overrides, idempotent, timing)
+        except Exception as e:
+            timing.error = e.__class__.__name__
+            raise
+        finally:
+            finish_timing(metrics_sink, timing, token, started)
+
+    def __send(self, http_verb, path, content_type, params, files, header_overrides, idempotent, timing):
         http_strategy = self.config.http_strategy()
+        attempts = _RequestAttempts(self.config, idempotent, timing)
+
+        while True:
+            full_path, headers, request_body = attempts.prepare(self, path, content_type, params, files, header_overrides)
+
+            delay = attempts.rate_limit_delay(http_verb, full_path)
+            if delay > 0:
+                time.sleep(delay)
+                attempts.waited(delay)
+
+            phase_started = perf_counter()
+            try:
+                response = http_strategy.http_do(http_verb, full_path, headers, request_body)
+            except Exception as e:
+                timing.add("network", perf_counter() - phase_started)
+                delay = attempts.retry_delay_for_exception(e)
+                if delay is not None:
+                    attempts.retry_policy.sleep(delay)
+                    attempts.retried(delay)
+                    continue
+                if self.config.wrap_http_exceptions:
+                    http_strategy.handle_exception(e)
+                else:
+                    raise
+            timing.add("network", perf_counter() - phase_started)
+
+            delay = attempts.retry_delay_for_response(request_body, response)
+            if delay is not None:
+                attempts.retry_policy.sleep(delay)
+                attempts.retried(delay)
+                continue
+
+            return attempts.process(self, response, content_type)
+
+    def _prepare_request(self, path, content_type, params=None, files=None, header_overrides=None):
         headers = self.__headers(content_type, header_overrides)
         request_body = self.__request_body(content_type, params, files)
 
         full_path = path if path.startswith(self.config.base_url()) or path.startswith(self.config.graphql_base_url()) else (self.config.base_url() + path)
 
-        try:
-            status, response_body = http_strategy.http_do(http_verb, full_path, headers, request_body)
-        except Exception as e:
-            if self.config.wrap_http_exceptions:
-                http_strategy.handle_exception(e)
-            else:
-                raise
+        return full_path, headers, request_body
 
+    def _process_response(self, status, response_body, content_type):
         if Http.is_error_status(status):
             Http.raise_exception_from_status(status)
         else:
@@ -113,7 +225,7 @@ class Http(object):
         else:
           verify = self.environment.ssl_certificate
 
-        response = self.__request_function(http_verb)(
+        response = self._request_function(http_verb)(
             path if path.startswith(self.config.base_url()) or path.startswith(self.config.graphql_base_url()) else (self.config.base_url() + path),
             headers=headers,
             data=data,
@@ -122,7 +234,7 @@ class Http(object):
             timeout=self.config.timeout
         )
 
-        return [response.status_code, response.text]
+        return [response.status_code, response.text, response.headers]
 
     def handle_exception(self, exception):
         if isinstance(exception, requests.exceptions.ReadTimeout):
@@ -138,7 +250,7 @@ class Http(object):
         else:
             raise UnexpectedError(exception)
 
-    def __request_function(self, method):
+    def _request_function(self, method):
         if method == "GET":
             return requests.get
         elif method == "POST":
@@ -182,6 +294,8 @@ class Http(object):
 
     def __request_body(self, content_type, params, files):
         if content_type == Http.ContentType.Xml:
+            if params and getattr(self.config, "stream_request_body", False):
+                return XmlUtil.xml_chunks_from_dict(params)
             request_body = XmlUtil.xml_from_dict(params) if params else ''
             return request_body
         elif files == None:
@@ -0,0 +1,90 @@
+import os
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+
+class HttpPool(object):
+    """
+    A pool of keep-alive connections shared by every request made through a
+    :class:`PooledHttp <braintree.util.pooled_http.PooledHttp>` strategy. ::
+
+        pool = braintree.util.HttpPool(pool_maxsize=20, idle_timeout=30)
+
+        braintree.Configuration.configure(
+            braintree.Environment.Sandbox,
+            "your_merchant_id",
+            "your_public_key",
+            "your_private_key",
+            http_strategy=braintree.util.PooledHttp,
+            http_pool=pool
+        )
+
+    ``pool_connections`` is the number of hosts kept in the pool,
+    ``pool_maxsize`` the number of connections kept per host, and
+    ``idle_timeout`` the number of seconds after which an unused pool is
+    closed. With ``pool_block`` set, callers wait for a free connection
+    instead of opening connections beyond ``pool_maxsize``.
+
+    The pool is safe to share between threads and is rebuilt in a forked
+    child process.
+    """
+
+    def __init__(self, pool_connections=10, pool_maxsize=10, idle_timeout=None, pool_block=False):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.idle_timeout = idle_timeout
+        self.pool_block = pool_block
+        self.__lock = threading.Lock()
+        self.__session = None
+        self.__pid = None
+        self.__last_used = None
+
+    def __getstate__(self):
+        # Connections belong to the process that opened them; a copy starts without any.
+        state = self.__dict__.copy()
+        del state["_HttpPool__lock"]
+        state["_HttpPool__session"] = None
+        state["_HttpPool__pid"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__lock = threading.Lock()
+
+    def session(self):
+        with self.__lock:
+            now = time.monotonic()
+            if self.__session is not None and (self.__pid != os.getpid() or self.__is_idle(now)):
+                self.__discard()
+            if self.__session is None:
+                self.__session = self.__build_session()
+                self.__pid = os.getpid()
+            self.__last_used = now
+            return self.__session
+
+    def close(self):
+        with self.__lock:
+            if self.__session is not None:
+                self.__discard()
+
+    def __is_idle(self, now):
+        return self.idle_timeout is not None and now - self.__last_used > self.idle_timeout
+
+    def __discard(self):
+        # A session inherited across fork() shares sockets with the parent, so
+        # it is dropped without closing them.
+        if self.__pid == os.getpid():
+            self.__session.close()
+        self.__session = None
+
+    def __build_session(self):
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
@@ -0,0 +1,187 @@
+import asyncio
+import contextvars
+import functools
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from time import perf_counter
+from urllib.parse import urlsplit
+
+_current_timing = contextvars.ContextVar("braintree_operation_timing", default=None)
+
+# The fixed segments of gateway paths; any other segment is an id.
+_PATH_SEGMENTS = frozenset("""
+    accept access_tokens add_ons addresses advanced_search advanced_search_ids all any
+    apple_pay cancel cancel_release client_token clone confirm_micro_transfer_amounts
+    connect create_for_currency create_verification create_via_api credit_card customers
+    discounts disputes document_uploads escrow evidence expired expired_ids expiring
+    expiring_ids finalize from_nonce grant graphql hold_in_escrow line_items
+    merchant_accounts merchants nonces oauth payment_method_nonces payment_methods
+    paypal_account plans processing refund registered_domains release_from_escrow revoke
+    revoke_access_token sample_notification settle settlement_confirm settlement_decline
+    settlement_pending submit_for_partial_settlement submit_for_settlement subscriptions
+    three_d_secure transactions unregister_domain update_details us_bank_account
+    us_bank_account_verifications validate_domains verifications void webhooks
+""".split())
+
+class MetricsSink(ABC):
+    """
+    Receives an :class:`OperationTiming` for every gateway operation once it
+    completes. Subclass it and pass an instance as ``metrics_sink`` when
+    configuring the gateway::
+
+        class StatsdSink(braintree.util.MetricsSink):
+            def record(self, timing):
+                for phase, seconds in timing.phases.items():
+                    statsd.timing("braintree." + timing.operation + "." + phase, seconds * 1000)
+
+        gateway = braintree.BraintreeGateway(braintree.Configuration(..., metrics_sink=StatsdSink()))
+
+    ``record`` is called on the thread that made the request, so it should
+    return quickly and must not raise.
+    """
+
+    @abstractmethod
+    def record(self, timing):
+        pass
+
+class OperationTiming(object):
+    """
+    Timings for one gateway operation, such as ``transaction.sale``.
+
+    ``phases`` maps each phase to the seconds spent in it:
+
+    * ``verify_keys`` -- validating params against the signature
+    * ``serialize`` -- building the XML request
+    * ``wait`` -- waiting on the rate limiter or between retries
+    * ``network`` -- the http strategy's round trip
+    * ``parse`` -- parsing the response body
+    * ``hydrate`` -- the rest of the operation, mostly building resource objects
+
+    ``requests`` counts the HTTP attempts made, ``request_bytes`` and
+    ``response_bytes`` their total body sizes (streamed request bodies are not
+    counted), ``status`` the last HTTP status and ``error`` the name of the
+    exception raised by the operation, if any.
+    """
+
+    def __init__(self, operation):
+        self.operation = operation
+        self.phases = {}
+        self.requests = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.status = None
+        self.error = None
+        self.total = None
+
+    @contextmanager
+    def phase(self, name):
+        started = perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, perf_counter() - started)
+
+    def add(self, name, seconds):
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def record_request(self, request_body, status, response_body):
+        self.requests += 1
+        self.status = status
+        if isinstance(request_body, (str, bytes)):
+            self.request_bytes += len(request_body)
+        if isinstance(response_body, (str, bytes)):
+            self.response_bytes += len(response_body)
+
+    def finish(self, total):
+        self.total = total
+        self.phases["hydrate"] = max(0.0, total - sum(self.phases.values()))
+
+    def __repr__(self):
+        return "<OperationTiming {operation: %r, total: %r, phases: %r, status: %r}>" % (self.operation, self.total, self.phases, self.status)
+
+class NullTiming(object):
+    """ Stands in for an :class:`OperationTiming` when no metrics sink is configured. """
+
+    def add(self, name, seconds):
+        pass
+
+    def record_request(self, request_body, status, response_body):
+        pass
+
+NULL_TIMING = NullTiming()
+
+def current_timing():
+    """ Returns the timing of the operation running in the current context, if any. """
+    return _current_timing.get()
+
+def http_operation(http_verb, path):
+    """
+    Names the operation of a request made outside an instrumented gateway, such as
+    ``PUT /merchants/:merchant_id/transactions/:id/void``. Ids and the query string are left
+    out so that the names stay few.
+    """
+    segments = []
+    for segment in urlsplit(path).path.split("/"):
+        if segment and segment not in _PATH_SEGMENTS:
+            segment = ":merchant_id" if segments and segments[-1] == "merchants" else ":id"
+        segments.append(segment)
+    return http_verb + " " + "/".join(segments)
+
+def start_timing(operation):
+    timing = OperationTiming(operation)
+    return timing, _current_timing.set(timing), perf_counter()
+
+def finish_timing(sink, timing, token, started):
+    _current_timing.reset(token)
+    timing.finish(perf_counter() - started)
+    sink.record(timing)
+
+class InstrumentedGateway(object):
+    """
+    Wraps one of the gateways of a :class:`BraintreeGateway <braintree.braintree_gateway.BraintreeGateway>`
+    so that each public method call is timed as an operation named
+    ``<gateway name>.<method name>`` and reported to ``sink``. Only used when
+    a metrics sink is configured.
+    """
+
+    def __init__(self, gateway, name, sink):
+        self.__gateway = gateway
+        self.__name = name
+        self.__sink = sink
+
+    def __getattr__(self, attribute):
+        value = getattr(self.__gateway, attribute)
+        if attribute.startswith("_") or not callable(value):
+            return value
+
+        operation = self.__name + "." + attribute
+        sink = self.__sink
+
+        if asyncio.iscoroutinefunction(value):
+            @functools.wraps(value)
+            async def instrumented(*args, **kwargs):
+                if current_timing() is not None:
+                    return await value(*args, **kwargs)
+                timing, token, started = start_timing(operation)
+                try:
+                    return await value(*args, **kwargs)
+                except Exception as e:
+                    timing.error = e.__class__.__name__
+                    raise
+                finally:
+                    finish_timing(sink, timing, token, started)
+        else:
+            @functools.wraps(value)
+            def instrumented(*args, **kwargs):
+                if current_timing() is not None:
+                    return value(*args, **kwargs)
+                timing, token, started = start_timing(operation)
+                try:
+                    return value(*args, **kwargs)
+                except Exception as e:
+                    timing.error = e.__class__.__name__
+                    raise
+                finally:
+                    finish_timing(sink, timing, token, started)
+
+        return instrumented
@@ -1,30 +1,90 @@
-from xml.dom import minidom
+from xml.parsers import expat
 from datetime import datetime
 from braintree.util.datetime_parser import parse_datetime
-import re
-import sys
 
 binary_type = bytes
 
 class Parser(object):
+    """
+    Converts a gateway XML response into nested dictionaries in a single
+    expat pass, without building an intermediate DOM.
+    """
+
     def __init__(self, xml):
-        if isinstance(xml, binary_type):
-            xml = xml.decode('utf-8')
-        self.doc = minidom.parseString("><".join(re.split(">\s+<", xml)).strip())
+        if xml[:1].isspace():
+            xml = xml.lstrip()
+        self.xml = xml
 
     def parse(self):
-        return {self.__underscored(self.doc.documentElement.tagName): self.__parse_node(self.doc.documentElement)}
-
-    def __parse_node(self, root):
-        child = root.firstChild
-        if self.__get_node_attribute(root, "type") == "array":
-            return self.__build_list(child)
-        elif not child:
-            return self.__node_content(root, None)
-        elif (child.nodeType == minidom.Node.TEXT_NODE):
-            return self.__node_content(root, child.nodeValue)
+        self.__root = None
+        self.__stack = []
+
+        parser = expat.ParserCreate()
+        parser.buffer_text = True
+        parser.StartElementHandler = self.__start_element
+        parser.EndElementHandler = self.__end_element
+        parser.CharacterDataHandler = self.__character_data
+        parser.Parse(self.xml, True)
+
+        return self.__root
+
+    # Each open element is tracked as a list of
+    # [tag, attributes, mode, value, text_parts, has_text_child] where mode is
+    # None until the first non-whitespace child is seen, then "text", "dict"
+    # or "list". Whitespace-only text between tags is ignored.
+    def __start_element(self, tag, attributes):
+        if self.__stack:
+            parent = self.__stack[-1]
+            self.__flush_text(parent)
+            if parent[2] is None:
+                parent[2] = "dict"
+                parent[3] = {}
+
+        if attributes.get("type") == "array":
+            self.__stack.append([tag, attributes, "list", [], [], False])
         else:
-            return self.__build_dict(child)
+            self.__stack.append([tag, attributes, None, None, [], False])
+
+    def __end_element(self, _):
+        tag, attributes, mode, value, text_parts, has_text_child = frame = self.__stack.pop()
+
+        if mode is None:
+            self.__flush_text(frame)
+            mode, value, has_text_child = frame[2], frame[3], frame[5]
+            if mode is None:
+                value = self.__node_content(attributes, None)
+
+        key = self.__underscored(tag)
+        if not self.__stack:
+            self.__root = {key: value}
+            return
+
+        parent = self.__stack[-1]
+        parent_mode = parent[2]
+        if parent_mode == "list":
+            parent[3].append(value)
+        elif parent_mode == "dict":
+            d = parent[3]
+            if mode == "list" or has_text_child:
+                d[key] = value
+            elif not d.get(key):
+                d[key] = value
+            else:
+                self.__convert_to_list(d, key)
+                d[key].append(value)
+
+    def __character_data(self, data):
+        frame = self.__stack[-1]
+        if frame[2] is None:
+            frame[4].append(data)
+
+    def __flush_text(self, frame):
+        text = "".join(frame[4])
+        frame[4] = []
+        if frame[2] is None and text and not text.isspace():
+            frame[2] = "text"
+            frame[3] = self.__node_content(frame[1], text)
+            frame[5] = True
 
     def __convert_to_boolean(self, value):
         if value == "true" or value == "1":
@@ -43,38 +103,9 @@ class Parser(object):
         if not isinstance(val, list):
             dict[key] = [val]
 
-    def __build_list(self, child):
-        l = []
-        while child is not None:
-            if (child.nodeType == minidom.Node.ELEMENT_NODE):
-                l.append(self.__parse_node(child))
-            child = child.nextSibling
-        return l
-
-    def __build_dict(self, child):
-        d = {}
-        while child is not None:
-            if (child.nodeType == minidom.Node.ELEMENT_NODE):
-                child_tag = self.__underscored(child.tagName)
-                if self.__get_node_attribute(child, "type") == "array" or child.firstChild and child.firstChild.nodeType == minidom.Node.TEXT_NODE:
-                    d[child_tag] = self.__parse_node(child)
-                else:
-                    if not d.get(child_tag):
-                        d[child_tag] = self.__parse_node(child)
-                    else:
-                        self.__convert_to_list(d, child_tag)
-                        d[child_tag].append(self.__parse_node(child))
-
-            child = child.nextSibling
-        return d
-
-    def __get_node_attribute(self, node, attribute):
-        attribute_node = node.attributes.get(attribute)
-        return attribute_node and attribute_node.value
-
-    def __node_content(self, parent, content):
-        parent_type = self.__get_node_attribute(parent, "type")
-        parent_nil = self.__get_node_attribute(parent, "nil")
+    def __node_content(self, attributes, content):
+        parent_type = attributes.get("type")
+        parent_nil = attributes.get("nil")
 
         if parent_type == "integer":
             return int(content)
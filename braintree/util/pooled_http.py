@@ -0,0 +1,20 @@
+from braintree.util.http import Http
+
+class PooledHttp(Http):
+    """
+    An http strategy that reuses keep-alive connections from the
+    configuration's :class:`HttpPool <braintree.util.http_pool.HttpPool>`
+    instead of opening a new connection for every request.
+    """
+
+    def _request_function(self, method):
+        session = self.config.http_pool().session()
+
+        if method == "GET":
+            return session.get
+        elif method == "POST":
+            return session.post
+        elif method == "PUT":
+            return session.put
+        elif method == "DELETE":
+            return session.delete
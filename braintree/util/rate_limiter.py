@@ -0,0 +1,128 @@
+import threading
+import time
+
+class RateLimiter(object):
+    """
+    Paces outbound requests with a token bucket per merchant and endpoint
+    class. A single limiter can be shared by every gateway in a process. ::
+
+        limiter = braintree.util.RateLimiter(
+            rate=20,
+            burst=40,
+            endpoint_rates={braintree.util.RateLimiter.Search: 2},
+            merchant_rates={"high_volume_merchant_id": 50}
+        )
+
+        braintree.Configuration.configure(
+            braintree.Environment.Production,
+            "your_merchant_id",
+            "your_public_key",
+            "your_private_key",
+            rate_limiter=limiter
+        )
+
+    ``rate`` is the number of requests per second allowed for an endpoint
+    class without an entry in ``endpoint_rates``, and ``burst`` the number of
+    requests that may be sent at once after a quiet period. ``merchant_rates``
+    sets the limits of single merchants: an entry is either a rate for every
+    endpoint class of the merchant or a dictionary of endpoint class rates,
+    which fall back to ``endpoint_rates`` and ``rate``. When ``adaptive``
+    is set, a 429 response halves the rate of its bucket (down to
+    ``min_rate``) and each successful response restores a fraction of it.
+    """
+
+    Search = "search"
+    Write = "write"
+    Read = "read"
+
+    def __init__(self, rate=10, burst=None, endpoint_rates=None, adaptive=True, min_rate=0.5, merchant_rates=None):
+        self.rate = rate
+        self.burst = burst
+        self.endpoint_rates = endpoint_rates or {}
+        self.merchant_rates = merchant_rates or {}
+        self.adaptive = adaptive
+        self.min_rate = min_rate
+        self.__buckets = {}
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def endpoint_class(http_verb, path):
+        if "/advanced_search" in path:
+            return RateLimiter.Search
+        elif http_verb == "GET":
+            return RateLimiter.Read
+        else:
+            return RateLimiter.Write
+
+    def reserve(self, merchant_id, endpoint_class):
+        """
+        Takes a token for a request and returns the number of seconds the
+        caller must wait before sending it.
+        """
+        return self.__bucket(merchant_id, endpoint_class).reserve()
+
+    def record(self, merchant_id, endpoint_class, status):
+        if not self.adaptive:
+            return
+        bucket = self.__bucket(merchant_id, endpoint_class)
+        if status == 429:
+            bucket.slow_down(self.min_rate)
+        elif status < 400:
+            bucket.speed_up()
+
+    def current_rate(self, merchant_id, endpoint_class):
+        return self.__bucket(merchant_id, endpoint_class).rate
+
+    def __bucket(self, merchant_id, endpoint_class):
+        key = (merchant_id, endpoint_class)
+        bucket = self.__buckets.get(key)
+        if bucket is None:
+            with self.__lock:
+                bucket = self.__buckets.get(key)
+                if bucket is None:
+                    rate = self.__rate(merchant_id, endpoint_class)
+                    bucket = _TokenBucket(rate, self.burst or rate)
+                    self.__buckets[key] = bucket
+        return bucket
+
+    def __rate(self, merchant_id, endpoint_class):
+        rate = self.endpoint_rates.get(endpoint_class, self.rate)
+        merchant_rate = self.merchant_rates.get(merchant_id)
+        if isinstance(merchant_rate, dict):
+            return merchant_rate.get(endpoint_class, rate)
+        elif merchant_rate is not None:
+            return merchant_rate
+        return rate
+
+class _TokenBucket(object):
+    def __init__(self, rate, capacity):
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self.__tokens = capacity
+        self.__updated = time.monotonic()
+        self.__lock = threading.Lock()
+
+    def reserve(self):
+        with self.__lock:
+            self.__refill()
+            self.__tokens -= 1
+            if self.__tokens >= 0:
+                return 0
+            return -self.__tokens / self.rate
+
+    def slow_down(self, min_rate):
+        with self.__lock:
+            self.__refill()
+            self.rate = max(min_rate, self.rate / 2.0)
+
+    def speed_up(self):
+        with self.__lock:
+            if self.rate < self.max_rate:
+                self.__refill()
+                self.rate = min(self.max_rate, self.rate + self.max_rate / 20.0)
+
+    def __refill(self):
+        now = time.monotonic()
+        self.__tokens = min(self.capacity, self.__tokens + (now - self.__updated) * self.rate)
+        self.__updated = now
@@ -0,0 +1,35 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+def read_ahead(function, arguments, window):
+    """
+    Calls ``function`` with each tuple in ``arguments`` on a pool of
+    ``window`` threads and yields the results in the order of ``arguments``.
+    At most ``window`` calls are in flight or waiting to be consumed, and an
+    exception raised by a call is re-raised when its result is reached.
+    """
+    if window < 1:
+        raise ValueError("window must be at least 1")
+
+    arguments = iter(arguments)
+    pending = deque()
+    executor = ThreadPoolExecutor(max_workers=window)
+
+    def submit_next():
+        args = next(arguments, None)
+        if args is None:
+            return False
+        pending.append(executor.submit(function, *args))
+        return True
+
+    try:
+        while len(pending) < window and submit_next():
+            pass
+        while pending:
+            result = pending.popleft().result()
+            submit_next()
+            yield result
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
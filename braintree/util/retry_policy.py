@@ -0,0 +1,91 @@
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import requests
+
+try:
+    import aiohttp
+    _TRANSIENT_EXCEPTIONS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout, aiohttp.ClientConnectionError)
+except ImportError:
+    _TRANSIENT_EXCEPTIONS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+
+class RetryPolicy(object):
+    """
+    Retries requests that fail with a transient error, waiting between
+    attempts with exponential backoff and full jitter. ::
+
+        braintree.Configuration.configure(
+            braintree.Environment.Sandbox,
+            "your_merchant_id",
+            "your_public_key",
+            "your_private_key",
+            retry_policy=braintree.util.RetryPolicy(max_retries=4, max_retry_time=20)
+        )
+
+    Only idempotent requests are retried: GET requests and the search
+    requests the SDK marks as idempotent. A ``Retry-After`` header sent with
+    a retryable status is honored instead of the computed backoff. A request
+    is not retried once ``max_retries`` retries have been made or the next
+    attempt would start more than ``max_retry_time`` seconds after the first.
+    """
+
+    def __init__(self, max_retries=3, backoff_factor=0.5, max_backoff=30, max_retry_time=60,
+                 retry_statuses=(429, 500, 503, 504),
+                 retry_exceptions=_TRANSIENT_EXCEPTIONS):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.max_retry_time = max_retry_time
+        self.retry_statuses = retry_statuses
+        self.retry_exceptions = retry_exceptions
+
+    def delay_for_status(self, attempt, started, status, response_headers=None):
+        """
+        Returns the number of seconds to wait before retrying a request that
+        returned ``status``, or None if it should not be retried.
+        """
+        if status not in self.retry_statuses:
+            return None
+        return self.__delay(attempt, started, self.__retry_after(response_headers))
+
+    def delay_for_exception(self, attempt, started, exception):
+        """
+        Returns the number of seconds to wait before retrying a request that
+        raised ``exception``, or None if it should not be retried.
+        """
+        if not isinstance(exception, self.retry_exceptions):
+            return None
+        return self.__delay(attempt, started, None)
+
+    def sleep(self, seconds):
+        time.sleep(seconds)
+
+    def __delay(self, attempt, started, retry_after):
+        if attempt >= self.max_retries:
+            return None
+
+        if retry_after is not None:
+            delay = retry_after
+        else:
+            delay = random.uniform(0, min(self.max_backoff, self.backoff_factor * (2 ** attempt)))
+
+        if time.monotonic() + delay - started > self.max_retry_time:
+            return None
+        return delay
+
+    def __retry_after(self, response_headers):
+        value = (response_headers or {}).get("Retry-After")
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError, IndexError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
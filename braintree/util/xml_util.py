@@ -6,6 +6,10 @@ class XmlUtil(object):
     def xml_from_dict(dict):
         return Generator(dict).generate()
 
+    @staticmethod
+    def xml_chunks_from_dict(dict, chunk_size=8192):
+        return Generator(dict).chunks(chunk_size)
+
     @staticmethod
     def dict_from_xml(xml):
         return Parser(xml).parse()
@@ -0,0 +1,61 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+class WebhookDeduplicationStore(ABC):
+    """
+    Remembers the fingerprints of webhook notifications that have been handled, so that
+    :class:`WebhookPipeline` can drop redeliveries. Subclass it to share the fingerprints
+    between processes or hosts, for instance in a cache server; fingerprints are tuples of
+    strings and None.
+    """
+
+    @abstractmethod
+    def add(self, fingerprint):
+        """ Stores ``fingerprint`` and returns True, or returns False when it is already stored. """
+
+    @abstractmethod
+    def discard(self, fingerprint):
+        """ Forgets ``fingerprint``, so that a notification whose handler failed is handled when redelivered. """
+
+class MemoryWebhookDeduplicationStore(WebhookDeduplicationStore):
+    """
+    Keeps fingerprints in memory for ``ttl`` seconds. When ``max_size`` is given, the
+    oldest fingerprints are evicted early to stay within it.
+    """
+
+    def __init__(self, ttl=86400, max_size=None, clock=time.monotonic):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.__clock = clock
+        self.__expiries = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def add(self, fingerprint):
+        with self.__lock:
+            now = self.__clock()
+            self.__evict(now)
+            if fingerprint in self.__expiries:
+                return False
+            self.__expiries[fingerprint] = now + self.ttl
+            if self.max_size is not None and len(self.__expiries) > self.max_size:
+                self.__expiries.popitem(last=False)
+            return True
+
+    def discard(self, fingerprint):
+        with self.__lock:
+            self.__expiries.pop(fingerprint, None)
+
+    def __len__(self):
+        with self.__lock:
+            self.__evict(self.__clock())
+            return len(self.__expiries)
+
+    def __evict(self, now):
+        # Every entry lives for the same ttl, so insertion order is expiry order.
+        while self.__expiries:
+            fingerprint, expiry = next(iter(self.__expiries.items()))
+            if expiry > now:
+                break
+            del self.__expiries[fingerprint]
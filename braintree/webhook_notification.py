@@ -15,6 +15,7 @@ from braintree.connected_merchant_status_transitioned import ConnectedMerchantSt
 from braintree.granted_payment_instrument_update import GrantedPaymentInstrumentUpdate
 from braintree.revoked_payment_method_metadata import RevokedPaymentMethodMetadata
 from braintree.local_payment_completed import LocalPaymentCompleted
+from braintree.util.xml_util import XmlUtil
 
 class WebhookNotification(Resource):
     class Kind(object):
@@ -60,44 +61,74 @@ class WebhookNotification(Resource):
     def verify(challenge):
         return Configuration.gateway().webhook_notification.verify(challenge)
 
-    def __init__(self, gateway, attributes):
+    def __init__(self, gateway, attributes, subject_xml=None):
         Resource.__init__(self, gateway, attributes)
 
         if "source_merchant_id" not in attributes:
             self.source_merchant_id = None
 
-        if "api_error_response" in attributes["subject"]:
-            node_wrapper = attributes["subject"]["api_error_response"]
+        # The subject is built on first access of an attribute that is not set yet, so
+        # routing on kind, timestamp and source_merchant_id does not pay for it. It is
+        # given either parsed, in attributes, or as the XML of its element.
+        if subject_xml is not None:
+            self._subject_xml = subject_xml
+            self._setattrs.append("subject")
+        self._subject_pending = True
+
+    def __getattr__(self, name):
+        if name.startswith("__") or "_subject_pending" not in self.__dict__:
+            raise AttributeError("'%s' object has no attribute '%s'" % (type(self).__name__, name))
+        # Threads that race to build the subject each build it without locking; the first
+        # value stored for an attribute wins, as with LazyAttribute.
+        for key, value in self.__subject_attributes().items():
+            self.__dict__.setdefault(key, value)
+        self.__dict__.pop("_subject_xml", None)
+        self.__dict__.pop("_subject_pending", None)
+        return object.__getattribute__(self, name)
+
+    def __subject_attributes(self):
+        # Only reads the instance dict, so that lookups from here never reach __getattr__.
+        attributes = {}
+        gateway = self.__dict__["gateway"]
+        if "_subject_xml" in self.__dict__:
+            attributes["subject"] = XmlUtil.dict_from_xml(self.__dict__["_subject_xml"])["subject"]
+        subject = attributes.get("subject", self.__dict__.get("subject"))
+        if not isinstance(subject, dict):
+            return attributes
+
+        if "api_error_response" in subject:
+            node_wrapper = subject["api_error_response"]
         else:
-            node_wrapper = attributes["subject"]
+            node_wrapper = subject
 
         if "subscription" in node_wrapper:
-            self.subscription = Subscription(gateway, node_wrapper['subscription'])
+            attributes["subscription"] = Subscription(gateway, node_wrapper['subscription'])
         elif "merchant_account" in node_wrapper:
-            self.merchant_account = MerchantAccount(gateway, node_wrapper['merchant_account'])
+            attributes["merchant_account"] = MerchantAccount(gateway, node_wrapper['merchant_account'])
         elif "transaction" in node_wrapper:
-            self.transaction = Transaction(gateway, node_wrapper['transaction'])
+            attributes["transaction"] = Transaction(gateway, node_wrapper['transaction'])
         elif "connected_merchant_status_transitioned" in node_wrapper:
-            self.connected_merchant_status_transitioned = ConnectedMerchantStatusTransitioned(gateway, node_wrapper['connected_merchant_status_transitioned'])
+            attributes["connected_merchant_status_transitioned"] = ConnectedMerchantStatusTransitioned(gateway, node_wrapper['connected_merchant_status_transitioned'])
         elif "connected_merchant_paypal_status_changed" in node_wrapper:
-            self.connected_merchant_paypal_status_changed = ConnectedMerchantPayPalStatusChanged(gateway, node_wrapper['connected_merchant_paypal_status_changed'])
+            attributes["connected_merchant_paypal_status_changed"] = ConnectedMerchantPayPalStatusChanged(gateway, node_wrapper['connected_merchant_paypal_status_changed'])
         elif "partner_merchant" in node_wrapper:
-            self.partner_merchant = PartnerMerchant(gateway, node_wrapper['partner_merchant'])
+            attributes["partner_merchant"] = PartnerMerchant(gateway, node_wrapper['partner_merchant'])
         elif "oauth_application_revocation" in node_wrapper:
-            self.oauth_access_revocation = OAuthAccessRevocation(node_wrapper["oauth_application_revocation"])
+            attributes["oauth_access_revocation"] = OAuthAccessRevocation(node_wrapper["oauth_application_revocation"])
         elif "disbursement" in node_wrapper:
-            self.disbursement = Disbursement(gateway, node_wrapper['disbursement'])
+            attributes["disbursement"] = Disbursement(gateway, node_wrapper['disbursement'])
         elif "dispute" in node_wrapper:
-            self.dispute = Dispute(node_wrapper['dispute'])
+            attributes["dispute"] = Dispute(node_wrapper['dispute'])
         elif "account_updater_daily_report" in node_wrapper:
-            self.account_updater_daily_report = AccountUpdaterDailyReport(gateway, node_wrapper['account_updater_daily_report'])
+            attributes["account_updater_daily_report"] = AccountUpdaterDailyReport(gateway, node_wrapper['account_updater_daily_report'])
         elif "granted_payment_instrument_update" in node_wrapper:
-            self.granted_payment_instrument_update = GrantedPaymentInstrumentUpdate(gateway, node_wrapper["granted_payment_instrument_update"])
-        elif attributes["kind"] in [WebhookNotification.Kind.GrantedPaymentMethodRevoked, WebhookNotification.Kind.PaymentMethodRevokedByCustomer]:
-            self.revoked_payment_method_metadata = RevokedPaymentMethodMetadata(gateway, node_wrapper)
+            attributes["granted_payment_instrument_update"] = GrantedPaymentInstrumentUpdate(gateway, node_wrapper["granted_payment_instrument_update"])
+        elif self.__dict__.get("kind") in [WebhookNotification.Kind.GrantedPaymentMethodRevoked, WebhookNotification.Kind.PaymentMethodRevokedByCustomer]:
+            attributes["revoked_payment_method_metadata"] = RevokedPaymentMethodMetadata(gateway, node_wrapper)
         elif "local_payment" in node_wrapper:
-            self.local_payment_completed = LocalPaymentCompleted(gateway, node_wrapper["local_payment"])
+            attributes["local_payment_completed"] = LocalPaymentCompleted(gateway, node_wrapper["local_payment"])
 
         if "errors" in node_wrapper:
-            self.errors = ValidationErrorCollection(node_wrapper['errors'])
-            self.message = node_wrapper['message']
+            attributes["errors"] = ValidationErrorCollection(node_wrapper['errors'])
+            attributes["message"] = node_wrapper['message']
+        return attributes
@@ -0,0 +1,211 @@
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from queue import Queue
+from braintree.util.xml_util import XmlUtil
+from braintree.webhook_deduplication_store import MemoryWebhookDeduplicationStore
+from braintree.webhook_notification import WebhookNotification
+from braintree.webhook_verifier import WebhookVerifier
+
+_STOP = object()
+_SUBJECT_ID_KEYS = ("id", "token", "payment_id", "merchant_id", "merchant_public_id")
+_verifiers = {}
+
+def _parse_attributes(keys, signature, payload):
+    # Runs in pool processes, which each build a verifier once per set of keys.
+    verifier = _verifiers.get(keys)
+    if verifier is None:
+        verifier = _verifiers[keys] = WebhookVerifier(keys=keys)
+    return XmlUtil.dict_from_xml(verifier.verify(signature, payload))["notification"]
+
+class WebhookPipeline(object):
+    """
+    Ingests webhook deliveries off the request thread. Raw ``bt_signature`` and
+    ``bt_payload`` pairs are queued by :meth:`submit`, then verified and parsed by a pool of
+    workers, deduplicated and dispatched to the handlers registered for their kind::
+
+        pipeline = braintree.WebhookPipeline(gateway, workers=4)
+
+        @pipeline.on(braintree.WebhookNotification.Kind.SubscriptionChargedUnsuccessfully)
+        def charge_failed(notification):
+            notify_customer(notification.subscription.id)
+
+        pipeline.start()
+        pipeline.submit(request.form["bt_signature"], request.form["bt_payload"])
+
+    With ``executor=WebhookPipeline.Processes``, signatures are verified and payloads parsed
+    in a pool of ``workers`` processes; notifications are built and handlers called in this
+    process either way. :meth:`submit` blocks while ``queue_size`` deliveries are waiting.
+
+    A notification is dropped when its fingerprint, the kind, timestamp and subject id, is
+    already in ``store``, a :class:`MemoryWebhookDeduplicationStore` unless given. When a
+    handler raises, the fingerprint is forgotten so that a redelivery is handled again.
+    Deliveries that fail verification, and handlers that raise, are passed to
+    ``on_error(signature, payload, exception)`` and counted in :attr:`error_count`, as are
+    exceptions raised by ``store`` or by ``on_error`` itself; the workers keep running.
+    """
+
+    Threads = "thread"
+    Processes = "process"
+
+    def __init__(self, gateway, workers=4, executor=Threads, queue_size=1000, store=None, on_error=None):
+        if executor not in (WebhookPipeline.Threads, WebhookPipeline.Processes):
+            raise ValueError("executor must be WebhookPipeline.Threads or WebhookPipeline.Processes")
+        self.gateway = gateway
+        self.workers = max(1, workers)
+        self.executor = executor
+        self.store = store if store is not None else MemoryWebhookDeduplicationStore()
+        self.on_error = on_error
+        self.processed_count = 0
+        self.duplicate_count = 0
+        self.unhandled_count = 0
+        self.error_count = 0
+        self.__queue = Queue(queue_size)
+        self.__handlers = {}
+        self.__threads = []
+        self.__processes = None
+        self.__keys = None
+        self.__stopped = False
+        self.__lock = threading.Lock()
+
+    def on(self, kind, handler=None):
+        """
+        Registers ``handler(notification)`` for notifications of ``kind``, or for every kind
+        without handlers of its own when ``kind`` is None. Returns a decorator when
+        ``handler`` is not given.
+        """
+        if handler is None:
+            def register(handler):
+                self.on(kind, handler)
+                return handler
+            return register
+        with self.__lock:
+            self.__handlers.setdefault(kind, []).append(handler)
+        return handler
+
+    def start(self):
+        if self.executor == WebhookPipeline.Processes:
+            config = self.gateway.config
+            keys = ((config.public_key, config.private_key),) + tuple(config.webhook_keys or ())
+            self.__keys = tuple((public_key, private_key) for public_key, private_key in keys if public_key and private_key)
+            self.__processes = ProcessPoolExecutor(max_workers=self.workers)
+        for index in range(self.workers):
+            thread = threading.Thread(target=self.__work, name="braintree-webhook-pipeline-%d" % index)
+            thread.daemon = True
+            thread.start()
+            self.__threads.append(thread)
+        return self
+
+    def submit(self, signature, payload, block=True, timeout=None):
+        """
+        Queues a delivery. Raises ``queue.Full`` when the queue is full and ``block`` is
+        false, or ``timeout`` seconds pass before there is room.
+        """
+        if self.__stopped:
+            raise RuntimeError("webhook pipeline has been stopped")
+        self.__queue.put((signature, payload), block, timeout)
+
+    def join(self):
+        """ Waits until every queued delivery has been handled. """
+        self.__queue.join()
+
+    def stop(self):
+        """ Handles the deliveries already queued, then stops the workers. """
+        self.__stopped = True
+        for thread in self.__threads:
+            self.__queue.put(_STOP)
+        for thread in self.__threads:
+            thread.join()
+        self.__threads = []
+        if self.__processes is not None:
+            self.__processes.shutdown()
+            self.__processes = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    @staticmethod
+    def fingerprint(attributes):
+        """ Returns the (kind, timestamp, subject id) fingerprint of parsed notification ``attributes``. """
+        timestamp = attributes.get("timestamp")
+        if isinstance(timestamp, datetime):
+            timestamp = timestamp.isoformat()
+        return (attributes.get("kind"), timestamp, WebhookPipeline.__subject_id(attributes.get("subject")))
+
+    @staticmethod
+    def __subject_id(subject):
+        if not isinstance(subject, dict):
+            return None
+        if "api_error_response" in subject:
+            subject = subject["api_error_response"]
+        for node in subject.values():
+            if isinstance(node, dict):
+                for key in _SUBJECT_ID_KEYS:
+                    if node.get(key) is not None:
+                        return str(node[key])
+        return None
+
+    def __work(self):
+        while True:
+            delivery = self.__queue.get()
+            try:
+                if delivery is _STOP:
+                    return
+                self.__handle(*delivery)
+            except Exception:
+                # A worker must outlive any delivery, or queued ones would never be handled.
+                self.__count("error_count")
+            finally:
+                self.__queue.task_done()
+
+    def __handle(self, signature, payload):
+        try:
+            if self.__processes is not None:
+                attributes = self.__processes.submit(_parse_attributes, self.__keys, signature, payload).result()
+            else:
+                attributes = self.gateway.webhook_notification.parse_attributes(signature, payload)
+        except Exception as e:
+            self.__failed(signature, payload, e)
+            return
+
+        handlers = self.__handlers.get(attributes.get("kind")) or self.__handlers.get(None)
+        if not handlers:
+            self.__count("unhandled_count")
+            return
+        fingerprint = WebhookPipeline.fingerprint(attributes)
+        try:
+            added = self.store.add(fingerprint)
+        except Exception as e:
+            self.__failed(signature, payload, e)
+            return
+        if not added:
+            self.__count("duplicate_count")
+            return
+
+        try:
+            notification = WebhookNotification(self.gateway, attributes)
+            for handler in handlers:
+                handler(notification)
+        except Exception as e:
+            self.__failed(signature, payload, e)
+            try:
+                self.store.discard(fingerprint)
+            except Exception as discard_error:
+                self.__failed(signature, payload, discard_error)
+            return
+        self.__count("processed_count")
+
+    def __failed(self, signature, payload, exception):
+        self.__count("error_count")
+        if self.on_error is not None:
+            try:
+                self.on_error(signature, payload, exception)
+            except Exception:
+                self.__count("error_count")
+
+    def __count(self, name):
+        with self.__lock:
+            setattr(self, name, getattr(self, name) + 1)
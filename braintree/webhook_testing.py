@@ -5,3 +5,15 @@ class WebhookTesting(object):
     @staticmethod
     def sample_notification(kind, id, source_merchant_id=None):
         return Configuration.gateway().webhook_testing.sample_notification(kind, id, source_merchant_id)
+
+    @staticmethod
+    def sample_notifications(count, **options):
+        return Configuration.gateway().webhook_testing.sample_notifications(count, **options)
+
+    @staticmethod
+    def write_sample_corpus(path, count, **options):
+        return Configuration.gateway().webhook_testing.write_sample_corpus(path, count, **options)
+
+    @staticmethod
+    def read_sample_corpus(path):
+        return Configuration.gateway().webhook_testing.read_sample_corpus(path)
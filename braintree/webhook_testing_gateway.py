@@ -1,13 +1,23 @@
 from braintree.util.crypto import Crypto
 from braintree.webhook_notification import WebhookNotification
+import json
+import random
 import sys
+import threading
 from base64 import encodebytes
-from datetime import datetime
+from datetime import datetime, timedelta
+
+# Stand-ins for the values that vary between notifications built from one template.
+_ID = "\x00id\x00"
+_TIMESTAMP = "\x00timestamp\x00"
+# Module level so that gateways stay picklable.
+_templates_lock = threading.Lock()
 
 class WebhookTestingGateway(object):
     def __init__(self, gateway):
         self.gateway = gateway
         self.config = gateway.config
+        self.__templates = {}
 
     def sample_notification(self, kind, id, source_merchant_id=None):
         payload = encodebytes(self.__sample_xml(kind, id, source_merchant_id))
@@ -15,8 +25,79 @@ class WebhookTestingGateway(object):
         signature = "%s|%s" % (self.gateway.config.public_key, hmac_payload)
         return {'bt_signature': signature, 'bt_payload': payload}
 
-    def __sample_xml(self, kind, id, source_merchant_id):
-        timestamp = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+    def sample_notifications(self, count, kinds=None, id_prefix="id", source_merchant_id=None, seed=None):
+        """
+        Returns ``count`` signed sample notifications, as ``sample_notification`` does, for
+        load testing webhook consumers::
+
+            samples = gateway.webhook_testing.sample_notifications(10000, kinds={
+                braintree.WebhookNotification.Kind.TransactionSettled: 8,
+                braintree.WebhookNotification.Kind.DisputeOpened: 1,
+                braintree.WebhookNotification.Kind.SubscriptionCanceled: 1
+            }, seed=42)
+
+        ``kinds`` is either a list of kinds, used in turn, or a dict of kinds to relative
+        weights, drawn at random from a generator seeded with ``seed``; by default every
+        kind is used in turn. Subject ids are ``id_prefix`` followed by the notification's
+        index, and timestamps are a second apart, ending now. The XML of each kind is built
+        once and cached, so each notification only costs substituting its id and timestamp,
+        encoding and signing.
+        """
+        if kinds is None:
+            kinds = WebhookTestingGateway.__all_kinds()
+        if isinstance(kinds, dict):
+            kinds = random.Random(seed).choices(list(kinds), weights=list(kinds.values()), k=count)
+        else:
+            kinds = [kinds[index % len(kinds)] for index in range(count)]
+
+        verifier = self.gateway.webhook_notification.verifier
+        start = datetime.utcnow() - timedelta(seconds=count - 1)
+        samples = []
+        for index, kind in enumerate(kinds):
+            timestamp = (start + timedelta(seconds=index)).strftime("%Y-%m-%dT%H:%M:%SZ")
+            xml = self.__template(kind, source_merchant_id).replace(_ID, "%s_%d" % (id_prefix, index)).replace(_TIMESTAMP, timestamp)
+            payload = encodebytes(xml.encode('utf-8'))
+            samples.append({'bt_signature': "%s|%s" % (verifier.public_key, verifier.sign(payload)), 'bt_payload': payload})
+        return samples
+
+    def write_sample_corpus(self, path, count, **options):
+        """
+        Writes ``count`` sample notifications, built by ``sample_notifications`` with
+        ``options``, to the file at ``path`` as one JSON object per line, and returns the
+        number written. The corpus is replayed with ``read_sample_corpus`` by a gateway
+        configured with the same keys.
+        """
+        samples = self.sample_notifications(count, **options)
+        with open(path, "w") as f:
+            for sample in samples:
+                f.write(json.dumps({'bt_signature': sample['bt_signature'], 'bt_payload': sample['bt_payload'].decode('ascii')}) + "\n")
+        return len(samples)
+
+    @staticmethod
+    def read_sample_corpus(path):
+        """ Yields the notifications of a corpus written by ``write_sample_corpus``, as ``sample_notification`` returns them. """
+        with open(path) as f:
+            for line in f:
+                if line.strip():
+                    sample = json.loads(line)
+                    yield {'bt_signature': sample['bt_signature'], 'bt_payload': sample['bt_payload'].encode('ascii')}
+
+    @staticmethod
+    def __all_kinds():
+        return sorted(value for name, value in vars(WebhookNotification.Kind).items() if not name.startswith("_"))
+
+    def __template(self, kind, source_merchant_id):
+        key = (kind, source_merchant_id)
+        template = self.__templates.get(key)
+        if template is None:
+            template = self.__sample_xml(kind, _ID, source_merchant_id, _TIMESTAMP).decode('utf-8')
+            with _templates_lock:
+                self.__templates[key] = template
+        return template
+
+    def __sample_xml(self, kind, id, source_merchant_id, timestamp=None):
+        if timestamp is None:
+            timestamp = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
 
         source_merchant_id_xml = ''
         if source_merchant_id is not None:
@@ -0,0 +1,168 @@
+import hashlib
+import hmac
+import re
+from base64 import decodebytes
+from braintree.exceptions.configuration_error import ConfigurationError
+from braintree.exceptions.invalid_signature_error import InvalidSignatureError
+from braintree.util.datetime_parser import parse_datetime
+
+text_type = str
+
+_ILLEGAL_PAYLOAD_CHARACTERS = re.compile(b"[^A-Za-z0-9+=/\n]")
+_KIND = re.compile(br"<kind>\s*([^<]*?)\s*</kind>")
+_TIMESTAMP = re.compile(br"<timestamp[^>]*>\s*([^<]*?)\s*</timestamp>")
+
+class WebhookVerifier(object):
+    """
+    Verifies webhook signatures against a keyring of API key pairs. The HMAC key derived
+    from each private key is computed once, so verifying a notification costs one pass over
+    its payload::
+
+        verifier = WebhookVerifier(public_key, private_key)
+        xml = verifier.verify(bt_signature, bt_payload)
+        kind, timestamp = verifier.kind_and_timestamp(bt_signature, bt_payload)
+
+    While keys are being rotated, the other pairs are given as ``keys``, and a signature is
+    accepted when it was made with any key in the ring::
+
+        verifier = WebhookVerifier(new_public_key, new_private_key, keys=[(old_public_key, old_private_key)])
+
+    The signature's public keys are looked up in the ring and only the payload signature
+    of the first known key is checked. ``public_key`` is the key that :meth:`sign` uses.
+
+    A gateway keeps one for its configuration, holding ``public_key`` and ``private_key``
+    and the pairs of its ``webhook_keys`` option, which :meth:`WebhookNotificationGateway.parse`
+    uses.
+    """
+
+    def __init__(self, public_key=None, private_key=None, keys=()):
+        self.public_key = public_key
+        self.__derived_keys = {}
+        self.__hmacs = {}
+        if public_key is not None and private_key is not None:
+            self.add_key(public_key, private_key)
+        for key in keys:
+            self.add_key(*key)
+        if self.public_key is None and self.__hmacs:
+            self.public_key = next(iter(self.__hmacs))
+
+    @property
+    def public_keys(self):
+        """ Returns the public keys in the ring. """
+        return list(self.__hmacs)
+
+    def add_key(self, public_key, private_key):
+        """ Accepts signatures made with ``private_key`` under ``public_key``. """
+        if isinstance(private_key, text_type):
+            private_key = private_key.encode("ascii")
+        derived_key = hashlib.sha1(private_key).digest()
+        self.__derived_keys[public_key] = derived_key
+        self.__hmacs[public_key] = hmac.new(derived_key, digestmod=hashlib.sha1)
+
+    def remove_key(self, public_key):
+        """
+        Stops accepting signatures made under ``public_key``. When it is :attr:`public_key`, the
+        oldest remaining key of the ring takes its place, or None when the ring is empty.
+        """
+        self.__derived_keys.pop(public_key, None)
+        self.__hmacs.pop(public_key, None)
+        if public_key == self.public_key:
+            self.public_key = next(iter(self.__hmacs), None)
+
+    def __getstate__(self):
+        # HMAC objects cannot be pickled; they are rebuilt from the derived keys.
+        return {"public_key": self.public_key, "derived_keys": self.__derived_keys}
+
+    def __setstate__(self, state):
+        self.public_key = state["public_key"]
+        self.__derived_keys = dict(state["derived_keys"])
+        self.__hmacs = dict(
+            (public_key, hmac.new(derived_key, digestmod=hashlib.sha1))
+            for public_key, derived_key in self.__derived_keys.items()
+        )
+
+    def sign(self, content):
+        """ Returns the hex HMAC-SHA1 digest of ``content`` with the key of :attr:`public_key`. """
+        if isinstance(content, text_type):
+            content = content.encode("ascii")
+        key = self.__hmacs.get(self.public_key)
+        if key is None:
+            raise ConfigurationError("private_key is required to sign webhook content")
+        digest = key.copy()
+        digest.update(content)
+        return digest.hexdigest()
+
+    def verify(self, signature, payload):
+        """
+        Checks that ``signature`` holds a signature of ``payload`` for this verifier's public
+        key and returns the decoded notification XML. Raises :class:`InvalidSignatureError`
+        otherwise.
+        """
+        if signature is None:
+            raise InvalidSignatureError("signature cannot be blank")
+        if payload is None:
+            raise InvalidSignatureError("payload cannot be blank")
+        if isinstance(payload, text_type):
+            payload = payload.encode("ascii")
+        if _ILLEGAL_PAYLOAD_CHARACTERS.search(payload):
+            raise InvalidSignatureError("payload contains illegal characters")
+        key, expected = self.__matching_signature(signature)
+        if not expected:
+            raise InvalidSignatureError("no matching public key")
+        if not self.__payload_matches(key, expected, payload):
+            raise InvalidSignatureError("signature does not match payload - one has been modified")
+        return decodebytes(payload)
+
+    def kind_and_timestamp(self, signature, payload):
+        """
+        Verifies the notification and returns its kind and timestamp, read from the XML
+        without parsing the subject. Suited to routing or discarding notifications before
+        building a :class:`WebhookNotification`.
+        """
+        return self.envelope(self.verify(signature, payload))
+
+    @staticmethod
+    def envelope(xml):
+        """ Returns the kind and timestamp of verified notification ``xml``. """
+        # The subject may itself hold kind and timestamp elements, so only the notification's
+        # own children are searched.
+        outside, _ = WebhookVerifier.split_subject(xml)
+        kind = _KIND.search(outside)
+        timestamp = _TIMESTAMP.search(outside)
+        return (
+            kind.group(1).decode("utf-8") if kind else None,
+            parse_datetime(timestamp.group(1).decode("ascii")) if timestamp else None
+        )
+
+    @staticmethod
+    def split_subject(xml):
+        """
+        Splits notification ``xml`` into the notification without its subject and the XML of
+        the subject element, which is None when the notification has no subject element.
+        """
+        subject_start = xml.find(b"<subject")
+        subject_end = xml.rfind(b"</subject>")
+        if subject_start == -1 or subject_end < subject_start:
+            return xml, None
+        subject_end += len(b"</subject>")
+        return xml[:subject_start] + xml[subject_end:], xml[subject_start:subject_end]
+
+    def __matching_signature(self, signature_string):
+        for pair in signature_string.split("&"):
+            public_key, separator, signature = pair.partition("|")
+            if separator:
+                key = self.__hmacs.get(public_key)
+                if key is not None:
+                    return key, signature
+        return None, None
+
+    def __payload_matches(self, key, expected, payload):
+        expected = expected.encode("ascii", "replace")
+        digest = key.copy()
+        digest.update(payload)
+        if hmac.compare_digest(digest.hexdigest().encode("ascii"), expected):
+            return True
+        # Some senders sign the payload with a trailing newline; continue the same digest
+        # rather than hashing the payload again.
+        digest.update(b"\n")
+        return hmac.compare_digest(digest.hexdigest().encode("ascii"), expected)
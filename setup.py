@@ -21,6 +21,7 @@ setup(
     packages=["braintree", "braintree.dispute_details", "braintree.exceptions", "braintree.exceptions.http", "braintree.merchant_account", "braintree.util", "braintree.test"],
     package_data={"braintree": ["ssl/*"]},
     install_requires=["requests>=0.11.1,<3.0"],
+    extras_require={"async": ["aiohttp>=3.6,<4.0"], "columnar": ["numpy>=1.13"]},
     zip_safe=False,
     license="MIT",
     classifiers=[
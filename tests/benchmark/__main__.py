@@ -0,0 +1,130 @@
+"""
+Runs the benchmarks of the SDK's CPU hot paths.
+
+    python -m tests.benchmark --output results.json
+    python -m tests.benchmark --compare results.json --threshold 10
+
+Results are written as JSON with the per-operation time of each benchmark in
+seconds. With ``--compare``, medians are compared against an earlier result
+file and the exit status is 1 when any benchmark is slower by more than
+``--threshold`` percent.
+"""
+
+import argparse
+import gc
+import json
+import platform
+import re
+import statistics
+import sys
+from datetime import datetime
+from braintree.version import Version
+from tests.benchmark.benchmarks import BENCHMARKS
+
+FORMAT_VERSION = 1
+
+def calibrate(function, min_time):
+    loops = 1
+    while True:
+        if function(loops) >= min_time or loops >= 1 << 24:
+            return loops
+        loops *= 2
+
+def measure(function, rounds, min_time):
+    loops = calibrate(function, min_time)
+    function(loops)
+    timings = []
+    gc_was_enabled = gc.isenabled()
+    try:
+        for _ in range(rounds):
+            gc.collect()
+            gc.disable()
+            timings.append(function(loops) / loops)
+            if gc_was_enabled:
+                gc.enable()
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return {
+        "loops": loops,
+        "rounds": rounds,
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "mean": statistics.mean(timings),
+        "stdev": statistics.stdev(timings) if rounds > 1 else 0.0
+    }
+
+def run(pattern, rounds, min_time):
+    results = {}
+    for name, function in BENCHMARKS.items():
+        if pattern and not re.search(pattern, name):
+            continue
+        results[name] = measure(function, rounds, min_time)
+        print("%-45s %12.2f us  (+- %.2f us, %d loops x %d rounds)" % (
+            name,
+            results[name]["median"] * 1e6,
+            results[name]["stdev"] * 1e6,
+            results[name]["loops"],
+            rounds
+        ))
+    return {
+        "format": FORMAT_VERSION,
+        "created_at": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "sdk_version": Version,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "benchmarks": results
+    }
+
+def compare(baseline, current, threshold):
+    regressions = []
+    print("")
+    print("%-45s %12s %12s %8s" % ("benchmark", "baseline us", "current us", "change"))
+    for name, result in current["benchmarks"].items():
+        if name not in baseline["benchmarks"]:
+            continue
+        before = baseline["benchmarks"][name]["median"]
+        after = result["median"]
+        change = (after - before) / before * 100
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print("%-45s %12.2f %12.2f %+7.1f%%%s" % (name, before * 1e6, after * 1e6, change, flag))
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m tests.benchmark", description="Benchmark the SDK's CPU hot paths.")
+    parser.add_argument("--filter", help="only run benchmarks whose name matches this regular expression")
+    parser.add_argument("--rounds", type=int, default=10, help="number of timed rounds per benchmark (default 10)")
+    parser.add_argument("--min-time", type=float, default=0.1, help="minimum seconds per round (default 0.1)")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--compare", help="compare against results written by an earlier --output")
+    parser.add_argument("--threshold", type=float, default=10.0, help="percent slowdown reported as a regression (default 10)")
+    parser.add_argument("--list", action="store_true", help="list benchmark names and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name in BENCHMARKS:
+            print(name)
+        return 0
+
+    current = run(args.filter, args.rounds, args.min_time)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(current, f, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if baseline.get("format") != FORMAT_VERSION:
+            print("cannot compare with %s: unsupported format %r" % (args.compare, baseline.get("format")))
+            return 2
+        if compare(baseline, current, args.threshold):
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
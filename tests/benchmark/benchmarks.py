@@ -0,0 +1,77 @@
+from collections import OrderedDict
+from time import perf_counter
+from braintree.resource import Resource
+from braintree.transaction import Transaction
+from braintree.util.datetime_parser import parse_datetime
+from braintree.util.generator import Generator
+from braintree.util.parser import Parser
+from tests.benchmark import fixtures
+
+# Each benchmark takes a number of loops, runs the operation that many
+# times and returns the elapsed seconds, so that setup is not timed.
+BENCHMARKS = OrderedDict()
+
+def benchmark(name):
+    def register(function):
+        BENCHMARKS[name] = function
+        return function
+    return register
+
+@benchmark("parser.search_page")
+def parse_search_page(loops):
+    xml = fixtures.search_page_xml(50)
+    started = perf_counter()
+    for _ in range(loops):
+        Parser(xml).parse()
+    return perf_counter() - started
+
+@benchmark("parser.transaction")
+def parse_transaction(loops):
+    xml = fixtures.transaction_xml()
+    started = perf_counter()
+    for _ in range(loops):
+        Parser(xml).parse()
+    return perf_counter() - started
+
+@benchmark("generator.transaction_sale")
+def generate_sale(loops):
+    params = {"transaction": fixtures.sale_params()}
+    started = perf_counter()
+    for _ in range(loops):
+        Generator(params).generate()
+    return perf_counter() - started
+
+@benchmark("resource.verify_keys.transaction_create")
+def verify_sale_keys(loops):
+    params = fixtures.sale_params()
+    started = perf_counter()
+    for _ in range(loops):
+        Resource.verify_keys(params, Transaction.create_signature)
+    return perf_counter() - started
+
+@benchmark("transaction.init")
+def hydrate_transaction(loops):
+    gateway = fixtures.gateway()
+    attributes = Parser(fixtures.transaction_xml()).parse()["transaction"]
+    started = perf_counter()
+    for _ in range(loops):
+        Transaction(gateway, attributes)
+    return perf_counter() - started
+
+@benchmark("webhook_notification.parse")
+def parse_webhook(loops):
+    gateway = fixtures.gateway()
+    samples = fixtures.webhook_samples(gateway)
+    started = perf_counter()
+    for index in range(loops):
+        sample = samples[index % len(samples)]
+        gateway.webhook_notification.parse(sample["bt_signature"], sample["bt_payload"])
+    return perf_counter() - started
+
+@benchmark("datetime_parser.parse_datetime")
+def parse_timestamps(loops):
+    timestamps = fixtures.TIMESTAMPS
+    started = perf_counter()
+    for index in range(loops):
+        parse_datetime(timestamps[index % len(timestamps)])
+    return perf_counter() - started
@@ -0,0 +1,257 @@
+from braintree.configuration import Configuration
+from braintree.environment import Environment
+from braintree.braintree_gateway import BraintreeGateway
+from braintree.webhook_notification import WebhookNotification
+
+TRANSACTION_XML = """<transaction>
+  <id>txn%(index)05d</id>
+  <status>settled</status>
+  <type>sale</type>
+  <currency-iso-code>USD</currency-iso-code>
+  <amount>%(amount)s</amount>
+  <tax-amount>1.25</tax-amount>
+  <discount-amount>0.50</discount-amount>
+  <shipping-amount>4.99</shipping-amount>
+  <merchant-account-id>sandbox_merchant_account</merchant-account-id>
+  <order-id>order-%(index)05d</order-id>
+  <created-at type="datetime">2020-03-%(day)02dT12:%(minute)02d:37Z</created-at>
+  <updated-at type="datetime">2020-03-%(day)02dT13:%(minute)02d:02Z</updated-at>
+  <customer>
+    <id>customer%(index)05d</id>
+    <first-name>Jane</first-name>
+    <last-name>Doe</last-name>
+    <company>Braintree</company>
+    <email>jane.doe%(index)d@example.com</email>
+    <phone>312-555-1234</phone>
+    <fax nil="true"/>
+    <website>https://www.example.com</website>
+  </customer>
+  <billing>
+    <id>billing%(index)05d</id>
+    <first-name>Jane</first-name>
+    <last-name>Doe</last-name>
+    <street-address>222 W Merchandise Mart Plaza</street-address>
+    <extended-address>Suite 800</extended-address>
+    <locality>Chicago</locality>
+    <region>IL</region>
+    <postal-code>60654</postal-code>
+    <country-name>United States of America</country-name>
+    <country-code-alpha2>US</country-code-alpha2>
+    <country-code-alpha3>USA</country-code-alpha3>
+    <country-code-numeric>840</country-code-numeric>
+  </billing>
+  <shipping>
+    <id>shipping%(index)05d</id>
+    <first-name>John</first-name>
+    <last-name>Doe</last-name>
+    <street-address>1 E Main St</street-address>
+    <extended-address nil="true"/>
+    <locality>Chicago</locality>
+    <region>IL</region>
+    <postal-code>60622</postal-code>
+    <country-name>United States of America</country-name>
+    <country-code-alpha2>US</country-code-alpha2>
+    <country-code-alpha3>USA</country-code-alpha3>
+    <country-code-numeric>840</country-code-numeric>
+  </shipping>
+  <credit-card>
+    <token>token%(index)05d</token>
+    <bin>411111</bin>
+    <last-4>1111</last-4>
+    <card-type>Visa</card-type>
+    <expiration-month>05</expiration-month>
+    <expiration-year>2029</expiration-year>
+    <customer-location>US</customer-location>
+    <cardholder-name>Jane Doe</cardholder-name>
+    <image-url>https://assets.braintreegateway.com/payment_method_logo/visa.png</image-url>
+    <prepaid>No</prepaid>
+    <healthcare>No</healthcare>
+    <debit>Yes</debit>
+    <durbin-regulated>No</durbin-regulated>
+    <commercial>Unknown</commercial>
+    <payroll>No</payroll>
+    <issuing-bank>Chase</issuing-bank>
+    <country-of-issuance>USA</country-of-issuance>
+    <product-id>F</product-id>
+    <unique-number-identifier>abc%(index)05d</unique-number-identifier>
+    <venmo-sdk type="boolean">false</venmo-sdk>
+  </credit-card>
+  <status-history type="array">
+    <status-event>
+      <timestamp type="datetime">2020-03-%(day)02dT12:%(minute)02d:37Z</timestamp>
+      <status>authorized</status>
+      <amount>%(amount)s</amount>
+      <user>merchant_user</user>
+      <transaction-source>api</transaction-source>
+    </status-event>
+    <status-event>
+      <timestamp type="datetime">2020-03-%(day)02dT12:%(minute)02d:38Z</timestamp>
+      <status>submitted_for_settlement</status>
+      <amount>%(amount)s</amount>
+      <user>merchant_user</user>
+      <transaction-source>api</transaction-source>
+    </status-event>
+    <status-event>
+      <timestamp type="datetime">2020-03-%(day)02dT13:%(minute)02d:02Z</timestamp>
+      <status>settled</status>
+      <amount>%(amount)s</amount>
+      <user nil="true"/>
+      <transaction-source></transaction-source>
+    </status-event>
+  </status-history>
+  <add-ons type="array">
+    <add-on>
+      <id>increase_10</id>
+      <amount>10.00</amount>
+      <quantity type="integer">1</quantity>
+      <never-expires type="boolean">true</never-expires>
+      <number-of-billing-cycles nil="true"/>
+    </add-on>
+  </add-ons>
+  <discounts type="array">
+    <discount>
+      <id>discount_7</id>
+      <amount>7.00</amount>
+      <quantity type="integer">2</quantity>
+      <never-expires type="boolean">false</never-expires>
+      <number-of-billing-cycles type="integer">3</number-of-billing-cycles>
+    </discount>
+  </discounts>
+  <descriptor>
+    <name>company*product12</name>
+    <phone>3125551234</phone>
+    <url>example.com</url>
+  </descriptor>
+  <disbursement-details>
+    <settlement-amount>%(amount)s</settlement-amount>
+    <settlement-currency-iso-code>USD</settlement-currency-iso-code>
+    <settlement-currency-exchange-rate>1</settlement-currency-exchange-rate>
+    <funds-held type="boolean">false</funds-held>
+    <success type="boolean">true</success>
+    <disbursement-date type="date">2020-03-%(day)02d</disbursement-date>
+  </disbursement-details>
+  <subscription>
+    <billing-period-start-date type="date">2020-03-01</billing-period-start-date>
+    <billing-period-end-date type="date">2020-03-31</billing-period-end-date>
+  </subscription>
+  <risk-data>
+    <id>risk%(index)05d</id>
+    <decision>Approve</decision>
+    <device-data-captured type="boolean">true</device-data-captured>
+    <fraud-service-provider>kount</fraud-service-provider>
+  </risk-data>
+  <custom-fields>
+    <store-me>value%(index)d</store-me>
+  </custom-fields>
+  <disputes type="array"/>
+  <authorization-adjustments type="array"/>
+  <payment-instrument-type>credit_card</payment-instrument-type>
+  <processor-response-code>1000</processor-response-code>
+  <processor-response-text>Approved</processor-response-text>
+  <network-transaction-id>020500000000000</network-transaction-id>
+</transaction>"""
+
+def transaction_xml(index=0):
+    return TRANSACTION_XML % {
+        "index": index,
+        "amount": "%d.%02d" % (10 + index % 990, index % 100),
+        "day": 1 + index % 28,
+        "minute": index % 60
+    }
+
+def search_page_xml(size=50):
+    """ A page of full transactions as returned by transactions/advanced_search. """
+    return '<credit-card-transactions type="collection">%s</credit-card-transactions>' % "".join(
+        transaction_xml(index) for index in range(size)
+    )
+
+def sale_params(index=0):
+    return {
+        "amount": "%d.00" % (10 + index),
+        "order_id": "order-%05d" % index,
+        "merchant_account_id": "sandbox_merchant_account",
+        "payment_method_nonce": "fake-valid-nonce",
+        "device_data": '{"device_session_id": "abc123", "fraud_merchant_id": "600000"}',
+        "tax_amount": "1.25",
+        "shipping_amount": "4.99",
+        "customer": {
+            "first_name": "Jane",
+            "last_name": "Doe",
+            "email": "jane.doe@example.com",
+            "phone": "312-555-1234"
+        },
+        "billing": {
+            "first_name": "Jane",
+            "last_name": "Doe",
+            "street_address": "222 W Merchandise Mart Plaza",
+            "extended_address": "Suite 800",
+            "locality": "Chicago",
+            "region": "IL",
+            "postal_code": "60654",
+            "country_code_alpha2": "US"
+        },
+        "shipping": {
+            "first_name": "John",
+            "last_name": "Doe",
+            "street_address": "1 E Main St",
+            "locality": "Chicago",
+            "region": "IL",
+            "postal_code": "60622",
+            "country_code_alpha2": "US",
+            "shipping_method": "ground"
+        },
+        "custom_fields": {
+            "store_me": "value",
+            "campaign": "spring"
+        },
+        "descriptor": {
+            "name": "company*product12",
+            "phone": "3125551234",
+            "url": "example.com"
+        },
+        "line_items": [
+            {
+                "quantity": "%d" % (1 + item),
+                "name": "Item %d" % item,
+                "kind": "debit",
+                "unit_amount": "3.00",
+                "total_amount": "%d.00" % (3 * (1 + item)),
+                "product_code": "sku-%d" % item
+            }
+            for item in range(5)
+        ],
+        "options": {
+            "submit_for_settlement": True,
+            "store_in_vault_on_success": True,
+            "paypal": {
+                "custom_field": "custom",
+                "supplementary_data": {"key1": "value1", "key2": "value2"}
+            }
+        }
+    }
+
+def gateway():
+    return BraintreeGateway(Configuration(
+        Environment.Development,
+        "benchmark_merchant_id",
+        public_key="benchmark_public_key",
+        private_key="benchmark_private_key"
+    ))
+
+WEBHOOK_KINDS = [
+    WebhookNotification.Kind.TransactionSettled,
+    WebhookNotification.Kind.SubscriptionChargedSuccessfully,
+    WebhookNotification.Kind.DisputeOpened,
+    WebhookNotification.Kind.DisbursementException,
+    WebhookNotification.Kind.SubMerchantAccountApproved
+]
+
+def webhook_samples(gateway):
+    return [gateway.webhook_testing.sample_notification(kind, "subject_%d" % index) for index, kind in enumerate(WEBHOOK_KINDS)]
+
+TIMESTAMPS = [
+    "2020-03-18T12:34:56Z",
+    "2020-03-18T12:34:56.123456Z",
+    "2020-03-18T12:34:56+05:30",
+    "2020-03-18T12:34:56-07:00"
+]
@@ -0,0 +1,172 @@
+import asyncio
+import gc
+import braintree.configuration
+from tests.test_helper import *
+
+class FakeAsyncStrategy(object):
+    responses = {}
+
+    def __init__(self, config, environment):
+        self.requests = []
+
+    async def http_do(self, http_verb, path, headers, request_body):
+        self.requests.append((http_verb, path, request_body))
+        await asyncio.sleep(0)
+        for suffix, response in self.responses.items():
+            if path.endswith(suffix):
+                return response(request_body) if callable(response) else response
+        return (404, "")
+
+class TestAsyncBraintreeGateway(unittest.TestCase):
+    def setUp(self):
+        self.gateway = AsyncBraintreeGateway(Configuration.instantiate(), http_strategy=FakeAsyncStrategy)
+
+    def run_async(self, coroutine):
+        return asyncio.run(coroutine)
+
+    def test_find_transaction_returns_transaction(self):
+        FakeAsyncStrategy.responses = {
+            "/transactions/abc": (200, "<transaction><id>abc</id><amount>10.00</amount></transaction>")
+        }
+        transaction = self.run_async(self.gateway.transaction.find("abc"))
+
+        self.assertEqual("abc", transaction.id)
+        self.assertEqual(Decimal("10.00"), transaction.amount)
+
+    def test_find_transaction_retries_with_retry_policy(self):
+        responses = [(503, ""), (429, "", {"Retry-After": "0"}), (200, "<transaction><id>abc</id><amount>10.00</amount></transaction>")]
+        FakeAsyncStrategy.responses = {
+            "/transactions/abc": lambda request_body: responses.pop(0)
+        }
+        config = braintree.configuration.Configuration(
+            Environment.Development, "merchant_id", "public_key", "private_key",
+            retry_policy=RetryPolicy(backoff_factor=0)
+        )
+        gateway = AsyncBraintreeGateway(config, http_strategy=FakeAsyncStrategy)
+        transaction = self.run_async(gateway.transaction.find("abc"))
+
+        self.assertEqual("abc", transaction.id)
+        self.assertEqual([], responses)
+
+    @raises_with_regexp(NotFoundError, "transaction with id 'missing' not found")
+    def test_find_transaction_raises_not_found(self):
+        FakeAsyncStrategy.responses = {}
+        self.run_async(self.gateway.transaction.find("missing"))
+
+    def test_sale_returns_successful_result(self):
+        FakeAsyncStrategy.responses = {
+            "/transactions": (201, "<transaction><id>new</id><type>sale</type><amount>10.00</amount></transaction>")
+        }
+        result = self.run_async(self.gateway.transaction.sale({"amount": "10.00"}))
+
+        self.assertTrue(result.is_success)
+        self.assertEqual("new", result.transaction.id)
+        self.assertIn("<type>sale</type>", self.gateway.http_strategy.requests[0][2])
+
+    def test_customer_update_returns_error_result(self):
+        FakeAsyncStrategy.responses = {
+            "/customers/c1": (422, "<api-error-response><message>Invalid</message><errors><errors type=\"array\"/></errors><params/></api-error-response>")
+        }
+        result = self.run_async(self.gateway.customer.update("c1", {"first_name": "Jane"}))
+
+        self.assertFalse(result.is_success)
+        self.assertEqual("Invalid", result.message)
+
+    def test_search_results_support_async_iteration(self):
+        def fetch(request_body):
+            ids = re.findall(r"<item>(\w+)</item>", request_body)
+            transactions = "".join("<transaction><id>%s</id><amount>1.00</amount></transaction>" % i for i in ids)
+            return (200, "<credit-card-transactions type=\"collection\">%s</credit-card-transactions>" % transactions)
+
+        FakeAsyncStrategy.responses = {
+            "/advanced_search_ids": (200, "<search-results><page-size type=\"integer\">2</page-size><ids type=\"array\"><item>t1</item><item>t2</item><item>t3</item></ids></search-results>"),
+            "/advanced_search": fetch
+        }
+
+        async def collect():
+            collection = await self.gateway.transaction.search(TransactionSearch.amount == "10.00")
+            return [transaction.id async for transaction in collection]
+
+        self.assertEqual(["t1", "t2", "t3"], self.run_async(collect()))
+
+    def test_search_results_prefetch_batches_in_order(self):
+        def fetch(request_body):
+            ids = re.findall(r"<item>(\w+)</item>", request_body)
+            transactions = "".join("<transaction><id>%s</id><amount>1.00</amount></transaction>" % i for i in ids)
+            return (200, "<credit-card-transactions type=\"collection\">%s</credit-card-transactions>" % transactions)
+
+        FakeAsyncStrategy.responses = {
+            "/advanced_search_ids": (200, "<search-results><page-size type=\"integer\">1</page-size><ids type=\"array\"><item>t1</item><item>t2</item><item>t3</item></ids></search-results>"),
+            "/advanced_search": fetch
+        }
+
+        async def collect():
+            collection = await self.gateway.transaction.search(TransactionSearch.amount == "10.00")
+            return [transaction.id async for transaction in collection.prefetch(batches=2)]
+
+        self.assertEqual(["t1", "t2", "t3"], self.run_async(collect()))
+
+    def test_prefetch_cancels_pending_pages_when_closed_early(self):
+        cancelled = []
+
+        async def fetch(query, ids):
+            if ids != ["0"]:
+                try:
+                    await asyncio.Event().wait()
+                except asyncio.CancelledError:
+                    cancelled.append(ids[0])
+                    raise
+            return ids
+
+        async def consume():
+            collection = AsyncResourceCollection(None, {"search_results": {"page_size": 1, "ids": ["0", "1", "2"]}}, fetch)
+            async with collection.prefetch(batches=3) as results:
+                async for item in results:
+                    break
+            return item, sorted(cancelled)
+
+        self.assertEqual(("0", ["1", "2"]), self.run_async(consume()))
+
+    def test_prefetch_cancels_pending_pages_when_collected(self):
+        cancelled = []
+
+        async def fetch(query, ids):
+            if ids != ["0"]:
+                try:
+                    await asyncio.Event().wait()
+                except asyncio.CancelledError:
+                    cancelled.append(ids[0])
+                    raise
+            return ids
+
+        async def consume():
+            results = AsyncResourceCollection(None, {"search_results": {"page_size": 1, "ids": ["0", "1", "2"]}}, fetch).prefetch(batches=3)
+            async for item in results:
+                break
+            del results
+            gc.collect()
+            await asyncio.sleep(0)
+            return sorted(cancelled)
+
+        self.assertEqual(["1", "2"], self.run_async(consume()))
+
+    def test_dispute_search_pages_with_async_iteration(self):
+        def page(request_body):
+            return (200, "<disputes><page-size type=\"integer\">1</page-size><total-items type=\"integer\">2</total-items><dispute><id>d</id></dispute></disputes>")
+
+        FakeAsyncStrategy.responses = {"?page=1": page, "?page=2": page}
+
+        async def collect():
+            result = await self.gateway.dispute.search(DisputeSearch.status.in_list([Dispute.Status.Open]))
+            return [dispute.id async for dispute in result.disputes]
+
+        self.assertEqual(["d", "d"], self.run_async(collect()))
+        self.assertEqual(2, len(self.gateway.http_strategy.requests))
+
+    def test_default_strategy_is_aiohttp_strategy(self):
+        try:
+            import aiohttp
+        except ImportError:
+            return
+        gateway = AsyncBraintreeGateway(Configuration.instantiate())
+        self.assertIsInstance(gateway.http_strategy, AiohttpStrategy)
@@ -0,0 +1,111 @@
+from tests.test_helper import *
+import copy
+import pickle
+from braintree.compact_resource import compact, CompactResource
+from braintree.dispute import Dispute
+from braintree.paginated_collection import PaginatedCollection
+from braintree.paginated_result import PaginatedResult
+
+class TestCompactResource(unittest.TestCase):
+    def transaction_attributes(self, transaction_id="txn"):
+        return {
+            "id": transaction_id,
+            "amount": "27.00",
+            "status": "settled",
+            "billing": {"first_name": "Jane", "postal_code": "60654"},
+            "status_history": [{"status": "settled", "amount": "27.00"}],
+            "custom_fields": {"store_me": "value"}
+        }
+
+    def test_has_the_attributes_and_repr_of_the_resource(self):
+        transaction = Transaction(None, self.transaction_attributes())
+        compact_transaction = compact(Transaction(None, self.transaction_attributes()))
+
+        self.assertIsInstance(compact_transaction, Transaction)
+        self.assertIsInstance(compact_transaction, CompactResource)
+        self.assertEqual(Decimal("27.00"), compact_transaction.amount)
+        self.assertEqual("60654", compact_transaction.billing_details.postal_code)
+        self.assertIs(compact_transaction.billing_details, compact_transaction.billing_details)
+        self.assertEqual(Decimal("27.00"), compact_transaction.status_history[0].amount)
+        self.assertEqual({"store_me": "value"}, compact_transaction.custom_fields)
+        self.assertIsNone(compact_transaction.risk_data)
+        self.assertEqual(
+            re.sub(r" at \d+>", "", repr(transaction)),
+            re.sub(r" at \d+>", "", repr(compact_transaction))
+        )
+
+    def test_copies_build_lazy_fields_independently(self):
+        compact_transaction = compact(Transaction(None, self.transaction_attributes()))
+        copied = copy.copy(compact_transaction)
+
+        self.assertEqual("60654", copied.billing_details.postal_code)
+        self.assertEqual("60654", compact_transaction.billing_details.postal_code)
+        self.assertIsNot(copied.billing_details, compact_transaction.billing_details)
+
+    def test_pickle_round_trip(self):
+        compact_transaction = compact(Transaction(None, self.transaction_attributes()))
+        self.assertEqual("60654", compact_transaction.billing_details.postal_code)
+
+        copied = pickle.loads(pickle.dumps(compact_transaction))
+
+        self.assertIsInstance(copied, Transaction)
+        self.assertIsInstance(copied, CompactResource)
+        self.assertIs(type(compact_transaction), type(copied))
+        self.assertEqual(Decimal("27.00"), copied.amount)
+        self.assertEqual("60654", copied.billing_details.postal_code)
+        self.assertEqual(Decimal("27.00"), copied.status_history[0].amount)
+
+    def test_does_not_keep_an_instance_dict(self):
+        compact_transaction = compact(Transaction(None, self.transaction_attributes()))
+        compact_transaction.amount
+        compact_transaction.billing_details
+
+        with self.assertRaises(AttributeError):
+            compact_transaction.paypal_details
+        self.assertFalse(hasattr(compact_transaction, "__dict__") and compact_transaction.__dict__)
+
+    def test_missing_attributes_raise_attribute_error(self):
+        compact_transaction = compact(Transaction(None, self.transaction_attributes()))
+        other_transaction = compact(Transaction(None, dict(self.transaction_attributes(), order_id="order")))
+
+        self.assertEqual("order", other_transaction.order_id)
+        with self.assertRaises(AttributeError):
+            compact_transaction.order_id
+
+    def test_attributes_can_be_set_and_deleted(self):
+        compact_transaction = compact(Transaction(None, self.transaction_attributes()))
+        compact_transaction.amount = Decimal("1.00")
+        compact_transaction.note = "refund requested"
+
+        self.assertEqual(Decimal("1.00"), compact_transaction.amount)
+        self.assertEqual("refund requested", compact_transaction.note)
+
+        del compact_transaction.note
+        self.assertFalse(hasattr(compact_transaction, "note"))
+
+    def test_compact_resources_are_returned_unchanged(self):
+        compact_transaction = compact(Transaction(None, self.transaction_attributes()))
+        self.assertIs(compact_transaction, compact(compact_transaction))
+
+    def test_resource_collection_compact_yields_compact_resources(self):
+        collection_data = {"search_results": {"page_size": 2, "ids": ["0", "1", "2"]}}
+
+        def fetch(query, ids):
+            return [Transaction(None, self.transaction_attributes(transaction_id)) for transaction_id in ids]
+
+        collection = ResourceCollection("query", collection_data, fetch)
+        transactions = list(collection.compact())
+
+        self.assertEqual(["0", "1", "2"], [transaction.id for transaction in transactions])
+        self.assertTrue(all(isinstance(transaction, CompactResource) for transaction in transactions))
+        self.assertFalse(isinstance(collection.first, CompactResource))
+
+    def test_paginated_collection_compact_yields_compact_resources(self):
+        def fetch(page):
+            return PaginatedResult(3, 2, [Dispute({"id": str(index), "amount": "1.00"}) for index in range(2 * page - 2, min(2 * page, 3))])
+
+        disputes = list(PaginatedCollection(fetch).compact())
+
+        self.assertEqual(["0", "1", "2"], [dispute.id for dispute in disputes])
+        self.assertEqual(Decimal("1.00"), disputes[2].amount)
+        self.assertTrue(all(isinstance(dispute, CompactResource) for dispute in disputes))
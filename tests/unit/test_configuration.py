@@ -1,7 +1,10 @@
 from tests.test_helper import *
 import braintree
 import os
+import copy
 import imp
+import pickle
+from unittest.mock import patch
 
 class TestConfiguration(unittest.TestCase):
     def test_works_with_unconfigured_configuration(self):
@@ -167,3 +170,56 @@ class TestConfiguration(unittest.TestCase):
             Configuration(client_id='client_id$development$integration_client_id')
 
         self.assertIn("Missing client_secret when constructing BraintreeGateway", str(error.exception))
+
+    def test_gateway_is_reused_between_static_calls(self):
+        self.assertIs(Configuration.gateway(), Configuration.gateway())
+
+    def test_gateway_is_rebuilt_when_configure_is_called(self):
+        try:
+            gateway = Configuration.gateway()
+            braintree.Configuration.configure(
+                braintree.Environment.Development,
+                'other_merchant_id',
+                'public_key',
+                'private_key'
+            )
+            other_gateway = Configuration.gateway()
+            self.assertIsNot(gateway, other_gateway)
+            self.assertEqual("other_merchant_id", other_gateway.config.merchant_id)
+        finally:
+            reset_braintree_configuration()
+
+    def test_gateway_is_rebuilt_when_static_attributes_change(self):
+        old_merchant_id = Configuration.merchant_id
+        try:
+            gateway = Configuration.gateway()
+            Configuration.merchant_id = "other_merchant_id"
+            self.assertIsNot(gateway, Configuration.gateway())
+            self.assertEqual("other_merchant_id", Configuration.gateway().config.merchant_id)
+        finally:
+            Configuration.merchant_id = old_merchant_id
+
+    def test_gateway_is_rebuilt_in_forked_process(self):
+        gateway = Configuration.gateway()
+        with patch("os.getpid", return_value=os.getpid() + 1):
+            self.assertIsNot(gateway, Configuration.gateway())
+
+    def test_configuration_pickle_round_trip(self):
+        config = braintree.configuration.Configuration(
+            environment=braintree.Environment.Development,
+            merchant_id="integration_merchant_id",
+            public_key="integration_public_key",
+            private_key="integration_private_key",
+            http_pool=braintree.util.HttpPool(pool_maxsize=3)
+        )
+        config.http_pool().session()
+
+        copied = pickle.loads(pickle.dumps(config))
+
+        self.assertEqual("integration_merchant_id", copied.merchant_id)
+        self.assertEqual(3, copied.http_pool().pool_maxsize)
+        self.assertIsNotNone(copied.http_pool().session())
+        self.assertEqual("integration_private_key", copy.deepcopy(config).private_key)
+
+    def test_configure_does_not_build_an_http_pool(self):
+        self.assertIsNone(Configuration.default_http_pool)
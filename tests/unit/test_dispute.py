@@ -251,3 +251,9 @@ class TestDispute(unittest.TestCase):
     @raises_with_regexp(NotFoundError, "evidence with id ' ' for dispute with id 'dispute_id' not found")
     def test_remove_evidence_empty_evidence_id_raises_value_exception(self):
         Dispute.remove_evidence("dispute_id", " ")
+
+    def test_transaction_and_transaction_details_are_the_same_lazily_built_object(self):
+        dispute = Dispute(dict(self.attributes))
+        self.assertNotIn("transaction_details", dispute.__dict__)
+
+        self.assertIs(dispute.transaction, dispute.transaction_details)
@@ -11,6 +11,8 @@ class TestExports(unittest.TestCase):
         self.assertNotEqual(braintree.AmexExpressCheckoutCard, None)
         self.assertNotEqual(braintree.AndroidPayCard, None)
         self.assertNotEqual(braintree.ApplePayCard, None)
+        self.assertNotEqual(braintree.AsyncBraintreeGateway, None)
+        self.assertNotEqual(braintree.AsyncResourceCollection, None)
         self.assertNotEqual(braintree.BraintreeGateway, None)
         self.assertNotEqual(braintree.ClientToken, None)
         self.assertNotEqual(braintree.Configuration, None)
@@ -31,6 +33,7 @@ class TestExports(unittest.TestCase):
         self.assertNotEqual(braintree.ErrorResult, None)
         self.assertNotEqual(braintree.Errors, None)
         self.assertNotEqual(braintree.EuropeBankAccount, None)
+        self.assertNotEqual(braintree.FindManyResult, None)
         self.assertNotEqual(braintree.Merchant, None)
         self.assertNotEqual(braintree.MerchantAccount, None)
         self.assertNotEqual(braintree.MerchantAccountGateway, None)
@@ -66,5 +69,9 @@ class TestExports(unittest.TestCase):
         self.assertNotEqual(braintree.Version, None)
         self.assertNotEqual(braintree.WebhookNotification, None)
         self.assertNotEqual(braintree.WebhookNotificationGateway, None)
+        self.assertNotEqual(braintree.WebhookPipeline, None)
+        self.assertNotEqual(braintree.WebhookDeduplicationStore, None)
+        self.assertNotEqual(braintree.MemoryWebhookDeduplicationStore, None)
+        self.assertNotEqual(braintree.WebhookVerifier, None)
         self.assertNotEqual(braintree.WebhookTesting, None)
         self.assertNotEqual(braintree.WebhookTestingGateway, None)
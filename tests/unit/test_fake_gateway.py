@@ -0,0 +1,64 @@
+from tests.test_helper import *
+from datetime import datetime, timedelta
+from braintree.test.fake_gateway import FakeGateway
+
+class TestFakeGateway(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.fake = FakeGateway(transactions=120, customers=5, subscriptions=5, verifications=5, disputes=25).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.fake.stop()
+
+    def setUp(self):
+        self.gateway = BraintreeGateway(self.fake.configuration())
+
+    def test_sale_find_and_void(self):
+        result = self.gateway.transaction.sale({"amount": "10.00", "payment_method_nonce": Nonces.Transactable})
+        self.assertTrue(result.is_success)
+        self.assertEqual(Transaction.Status.Authorized, result.transaction.status)
+
+        self.assertEqual(Decimal("10.00"), self.gateway.transaction.find(result.transaction.id).amount)
+        self.assertEqual(Transaction.Status.Voided, self.gateway.transaction.void(result.transaction.id).transaction.status)
+
+    def test_sale_without_amount_returns_validation_error(self):
+        result = self.gateway.transaction.sale({"payment_method_nonce": Nonces.Transactable})
+
+        self.assertFalse(result.is_success)
+        self.assertEqual(ErrorCodes.Transaction.AmountIsRequired, result.errors.for_object("transaction").on("amount")[0].code)
+
+    @raises(NotFoundError)
+    def test_find_missing_transaction_raises_not_found(self):
+        self.gateway.transaction.find("missing")
+
+    def test_search_pages_through_matching_transactions(self):
+        now = datetime.utcnow()
+        collection = self.gateway.transaction.search(TransactionSearch.created_at.between(now - timedelta(days=100), now))
+        ids = [transaction.id for transaction in collection.items]
+
+        self.assertTrue(len(ids) >= 120)
+        self.assertEqual(len(ids), len(set(ids)))
+
+    def test_dispute_search_is_paged(self):
+        disputes = list(self.gateway.dispute.search(DisputeSearch.status.in_list(["open", "won", "lost", "accepted"])).disputes.items)
+        self.assertEqual(25, len(disputes))
+
+    def test_customer_and_payment_method(self):
+        customer = self.gateway.customer.find("customer_0")
+        token = customer.credit_cards[0].token
+
+        self.assertEqual(token, self.gateway.payment_method.find(token).token)
+
+    def test_webhook_samples_verify_with_the_configured_keys(self):
+        sample = self.fake.sample_notification(WebhookNotification.Kind.SubscriptionWentPastDue, "sub_id")
+        notification = self.gateway.webhook_notification.parse(sample["bt_signature"], sample["bt_payload"])
+
+        self.assertEqual("sub_id", notification.subscription.id)
+
+    def test_injects_errors(self):
+        with FakeGateway(transactions=1, error_rate=1.0, errors=(503,)) as fake:
+            gateway = BraintreeGateway(fake.configuration())
+            with self.assertRaises(ServiceUnavailableError):
+                gateway.transaction.find("txn_0")
+            self.assertEqual(1, fake.injected_error_count)
@@ -0,0 +1,66 @@
+import threading
+from tests.test_helper import *
+from braintree.find_many_result import FindManyResult
+
+class TestFindManyResult(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def fetch(self, query, ids):
+        with self.lock:
+            self.calls.append(ids)
+        # The server returns matches in its own order and omits unknown ids.
+        return [Transaction(None, {"id": resource_id, "amount": "1.00"}) for resource_id in sorted(ids) if resource_id != "missing"]
+
+    def test_preserves_the_order_of_the_given_ids(self):
+        result = FindManyResult.fetch(["c", "a", "missing", "b"], self.fetch, 50, 4)
+
+        self.assertEqual(["c", "a", "b"], [transaction.id for transaction in result])
+        self.assertEqual(["missing"], result.missing_ids)
+        self.assertEqual("a", result.get("a").id)
+        self.assertIsNone(result.get("missing"))
+        self.assertEqual(3, len(result))
+
+    def test_fetches_in_chunks(self):
+        ids = ["id_%03d" % index for index in range(120)]
+        result = FindManyResult.fetch(ids, self.fetch, 50, 4)
+
+        self.assertEqual(ids, [transaction.id for transaction in result.items])
+        self.assertEqual([50, 50, 20], sorted((len(chunk) for chunk in self.calls), reverse=True))
+
+    def test_fetches_each_id_once(self):
+        result = FindManyResult.fetch(["a", "b", "a", None, ""], self.fetch, 50, 4)
+
+        self.assertEqual([["a", "b"]], self.calls)
+        self.assertEqual(["a", "b"], [transaction.id for transaction in result])
+        self.assertEqual([], result.missing_ids)
+
+    def test_reports_each_missing_id_once_and_skips_blank_ids(self):
+        result = FindManyResult.fetch(["missing", "a", " ", "missing", None, ""], self.fetch, 50, 4)
+
+        self.assertEqual(["a"], [transaction.id for transaction in result])
+        self.assertEqual(["missing"], result.missing_ids)
+
+    def test_accepts_a_generator_of_ids(self):
+        result = FindManyResult.fetch((resource_id for resource_id in ["b", "missing", "a"]), self.fetch, 50, 4)
+
+        self.assertEqual(["b", "a"], [transaction.id for transaction in result])
+        self.assertEqual(["missing"], result.missing_ids)
+
+    def test_accepts_ids_that_are_not_strings(self):
+        result = FindManyResult.fetch([1, 2], lambda query, ids: [{"id": 1}], 50, 4)
+
+        self.assertEqual([{"id": 1}], result.items)
+        self.assertEqual([2], result.missing_ids)
+
+    def test_reads_ids_of_raw_responses(self):
+        result = FindManyResult.fetch(["b", "a"], lambda query, ids: [{"id": resource_id} for resource_id in ids], 1, 2)
+
+        self.assertEqual([{"id": "b"}, {"id": "a"}], result.items)
+
+    def test_without_ids_does_not_fetch(self):
+        result = FindManyResult.fetch([], self.fetch, 50, 4)
+
+        self.assertEqual([], result.items)
+        self.assertEqual([], self.calls)
@@ -3,6 +3,7 @@ import traceback
 from tests.test_helper import *
 from braintree.exceptions.http.timeout_error import *
 from braintree.attribute_getter import AttributeGetter
+from braintree.util.instrumentation import http_operation
 
 class TestHttp(unittest.TestCase):
     @raises(RequestTimeoutError)
@@ -110,14 +111,134 @@ class TestHttp(unittest.TestCase):
         http = self.setup_http_strategy(test_http_do_strategy)
         http.post_multipart("/some_path", "files", params)
 
-    def setup_http_strategy(self, http_do):
+    def test_request_body_streams_chunks_when_configured(self):
+        def test_http_do_strategy(http_verb, path, headers, request_body):
+            self.assertFalse(isinstance(request_body, str))
+            self.assertEqual(b"<method>post</method>", b"".join(request_body))
+            return (200, "")
+
+        http = self.setup_http_strategy(test_http_do_strategy, stream_request_body=True)
+        http.post("/some_path", {"method": "post"})
+
+    def test_retries_idempotent_request_on_retryable_status(self):
+        responses = [(503, ""), (429, "", {"Retry-After": "0"}), (200, "<ok>yes</ok>")]
+        def test_http_do_strategy(http_verb, path, headers, request_body):
+            return responses.pop(0)
+
+        retry_policy = RetryPolicy(backoff_factor=0)
+        http = self.setup_http_strategy(test_http_do_strategy, retry_policy=retry_policy)
+        self.assertEqual({"ok": "yes"}, http.get("/some_path"))
+        self.assertEqual([], responses)
+
+    def test_retries_idempotent_request_on_connection_error(self):
+        responses = [requests.exceptions.ConnectionError(), (200, "<ok>yes</ok>")]
+        def test_http_do_strategy(http_verb, path, headers, request_body):
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        http = self.setup_http_strategy(test_http_do_strategy, retry_policy=RetryPolicy(backoff_factor=0))
+        self.assertEqual({"ok": "yes"}, http.post("/some_path", {"search": "x"}, idempotent=True))
+
+    @raises(ServiceUnavailableError)
+    def test_does_not_retry_non_idempotent_request(self):
+        responses = [(503, ""), (200, "")]
+        def test_http_do_strategy(http_verb, path, headers, request_body):
+            return responses.pop(0)
+
+        http = self.setup_http_strategy(test_http_do_strategy, retry_policy=RetryPolicy(backoff_factor=0))
+        http.post("/some_path", {"method": "post"})
+
+    @raises(TooManyRequestsError)
+    def test_stops_retrying_after_max_retries(self):
+        calls = []
+        def test_http_do_strategy(http_verb, path, headers, request_body):
+            calls.append(path)
+            return (429, "")
+
+        http = self.setup_http_strategy(test_http_do_strategy, retry_policy=RetryPolicy(max_retries=2, backoff_factor=0))
+        try:
+            http.get("/some_path")
+        finally:
+            self.assertEqual(3, len(calls))
+
+    def test_rate_limiter_paces_requests_and_records_statuses(self):
+        class RecordingRateLimiter(RateLimiter):
+            def __init__(self):
+                RateLimiter.__init__(self)
+                self.events = []
+
+            def reserve(self, merchant_id, endpoint_class):
+                self.events.append(("reserve", merchant_id, endpoint_class))
+                return 0
+
+            def record(self, merchant_id, endpoint_class, status):
+                self.events.append(("record", merchant_id, endpoint_class, status))
+
+        def test_http_do_strategy(http_verb, path, headers, request_body):
+            return (200, "")
+
+        rate_limiter = RecordingRateLimiter()
+        http = self.setup_http_strategy(test_http_do_strategy, rate_limiter=rate_limiter)
+        http.post("/transactions/advanced_search_ids", {"search": "x"})
+        http.put("/transactions/id/void")
+
+        self.assertEqual([
+            ("reserve", "merchant_id", RateLimiter.Search),
+            ("record", "merchant_id", RateLimiter.Search, 200),
+            ("reserve", "merchant_id", RateLimiter.Write),
+            ("record", "merchant_id", RateLimiter.Write, 200)
+        ], rate_limiter.events)
+
+    def test_metrics_sink_receives_phase_timings(self):
+        class RecordingSink(MetricsSink):
+            def __init__(self):
+                self.timings = []
+
+            def record(self, timing):
+                self.timings.append(timing)
+
+        def test_http_do_strategy(http_verb, path, headers, request_body):
+            return (200, "<transaction><id>abc</id></transaction>")
+
+        sink = RecordingSink()
+        http = self.setup_http_strategy(test_http_do_strategy, metrics_sink=sink)
+        http.put("/transactions/abc/void", {"transaction": {"amount": "10.00"}})
+
+        self.assertEqual(1, len(sink.timings))
+        timing = sink.timings[0]
+        self.assertEqual("PUT /transactions/:id/void", timing.operation)
+        self.assertEqual(1, timing.requests)
+        self.assertEqual(200, timing.status)
+        self.assertTrue(timing.request_bytes > 0)
+        self.assertEqual(len("<transaction><id>abc</id></transaction>"), timing.response_bytes)
+        self.assertEqual(set(["serialize", "network", "parse", "hydrate"]), set(timing.phases.keys()))
+
+    def test_operation_names_leave_out_ids(self):
+        self.assertEqual(
+            "GET /merchants/:merchant_id/payment_methods/any/:id",
+            http_operation("GET", "/merchants/integration_merchant_id/payment_methods/any/token-1")
+        )
+        self.assertEqual(
+            "POST /merchants/:merchant_id/disputes/:id/evidence",
+            http_operation("POST", "/merchants/m1/disputes/d1/evidence?page=2")
+        )
+        self.assertEqual("POST /graphql", http_operation("POST", "https://payments.sandbox.braintree-api.com/graphql"))
+
+    def setup_http_strategy(self, http_do, stream_request_body=False, retry_policy=None, rate_limiter=None, metrics_sink=None):
         config = AttributeGetter({
                 "base_url": (lambda: ""),
                 "has_access_token": (lambda: False),
                 "has_client_credentials": (lambda: False),
                 "http_strategy": (lambda: AttributeGetter({"http_do": http_do})),
+                "merchant_id": "merchant_id",
+                "metrics_sink": metrics_sink,
                 "public_key": "",
                 "private_key": "",
+                "rate_limiter": rate_limiter,
+                "retry_policy": retry_policy,
+                "stream_request_body": stream_request_body,
                 "wrap_http_exceptions": False})
 
         return Http(config, "fake_environment")
@@ -40,3 +40,37 @@ class TestPaginatedCollection(unittest.TestCase):
         self.assertEqual(2, len(items))
         self.assertEqual(1, items[0])
         self.assertEqual(2, items[1])
+
+    def test_prefetch_yields_items_in_page_order(self):
+        def paging_function(current_page):
+            if current_page > 4:
+                raise "too many pages fetched"
+            else:
+                time.sleep(0.01 * (4 - current_page))
+                return PaginatedResult(7, 2, [current_page * 10, current_page * 10 + 1][:7 - (current_page - 1) * 2])
+        collection = PaginatedCollection(paging_function)
+
+        items = [i for i in collection.prefetch(workers=3)]
+        self.assertEqual([10, 11, 20, 21, 30, 31, 40], items)
+
+    def test_prefetch_fetches_remaining_pages_concurrently(self):
+        import threading
+        barrier = threading.Barrier(2, timeout=5)
+        def paging_function(current_page):
+            if current_page > 1:
+                barrier.wait()
+            return PaginatedResult(3, 1, [current_page])
+        collection = PaginatedCollection(paging_function)
+
+        items = [i for i in collection.prefetch(workers=2)]
+        self.assertEqual([1, 2, 3], items)
+
+    def test_prefetch_fetches_once_for_single_page(self):
+        def paging_function(current_page):
+            if current_page > 1:
+                raise "too many pages fetched"
+            else:
+                return PaginatedResult(2, 5, [1, 2])
+        collection = PaginatedCollection(paging_function)
+
+        self.assertEqual([1, 2], [i for i in collection.prefetch()])
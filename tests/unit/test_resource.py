@@ -113,3 +113,60 @@ class TestResource(unittest.TestCase):
             }
         }
         Resource.verify_keys(params, signature)
+
+    def test_verify_keys_reports_invalid_keys_in_params_order(self):
+        signature = [
+            "amount",
+            {"options": ["submit_for_settlement", {"paypal": [{"supplementary_data": ["__any_key__"]}]}]}
+        ]
+        params = {
+            "bad": "value",
+            "amount": "10.00",
+            "options": {
+                "submit_for_settlement": True,
+                "nope": True,
+                "paypal": {"supplementary_data": {"ok-key_1": "value", "not ok": "value"}}
+            }
+        }
+        with self.assertRaisesRegex(KeyError, r"Invalid keys: bad, options\[nope\], options\[paypal\]\[supplementary_data\]\[not ok\]"):
+            Resource.verify_keys(params, signature)
+
+    def test_verify_keys_allows_wildcard_keys_with_nested_params(self):
+        signature = [
+            {"foo": [{"__any_key__": ["bar"]}]}
+        ]
+        Resource.verify_keys({"foo": {"anything": {"bar": "value"}}}, signature)
+
+        with self.assertRaises(KeyError):
+            Resource.verify_keys({"foo": {"anything": {"baz": "value"}}}, signature)
+
+    def test_verify_keys_results_do_not_depend_on_cached_signatures(self):
+        params = {"customer": {"one": "foo"}}
+        Resource.verify_keys(params, [{"customer": ["one", "two"]}])
+
+        with self.assertRaises(KeyError):
+            Resource.verify_keys(params, [{"customer": ["two"]}])
+        Resource.verify_keys(params, [{"customer": ["one", "two"]}])
+
+    def test_verify_keys_calls_a_signature_method_once(self):
+        calls = []
+
+        def signature():
+            calls.append(1)
+            return [{"customer": ["one"]}]
+
+        Resource.verify_keys({"customer": {"one": "foo"}}, signature)
+        with self.assertRaises(KeyError):
+            Resource.verify_keys({"customer": {"two": "foo"}}, signature)
+        self.assertEqual(1, len(calls))
+
+    def test_verify_keys_evicts_the_least_recently_used_signature(self):
+        limit = braintree.resource._COMPILED_SIGNATURES_LIMIT
+        signature = [{"customer": ["one"]}]
+        Resource.verify_keys({}, signature)
+        for index in range(limit):
+            Resource.verify_keys({}, [{"customer": ["key%d" % index]}])
+            Resource.verify_keys({}, signature)
+
+        self.assertEqual(limit, len(braintree.resource._compiled_signatures))
+        self.assertIn(repr(signature), braintree.resource._compiled_signatures)
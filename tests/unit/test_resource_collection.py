@@ -49,3 +49,42 @@ class TestResourceCollection(unittest.TestCase):
     def test_no_search_results(self):
         bad_collection_data = {}
         ResourceCollection("some_query", bad_collection_data, TestResourceCollection.TestResource.fetch)
+
+    def test_prefetch_yields_items_in_order(self):
+        collection = ResourceCollection("some_query", self.collection_data, TestResourceCollection.TestResource.fetch)
+        self.assertEqual(self.TestResource.items, list(collection.prefetch(batches=2)))
+
+    def test_prefetch_fetches_batches_concurrently(self):
+        import threading
+        barrier = threading.Barrier(3, timeout=5)
+        def fetch(_, ids):
+            barrier.wait()
+            return TestResourceCollection.TestResource.fetch(_, ids)
+
+        collection = ResourceCollection("some_query", self.collection_data, fetch)
+        self.assertEqual(self.TestResource.items, list(collection.prefetch(batches=3)))
+
+    def test_prefetch_bounds_the_read_ahead_window(self):
+        import threading
+        lock = threading.Lock()
+        fetched = []
+        def fetch(_, ids):
+            with lock:
+                fetched.append(ids)
+            return TestResourceCollection.TestResource.fetch(_, ids)
+
+        collection = ResourceCollection("some_query", self.collection_data, fetch)
+        items = collection.prefetch(batches=1)
+        self.assertEqual("a", next(items))
+        self.assertTrue(len(fetched) <= 2)
+        items.close()
+
+    @raises_with_regexp(UnexpectedError, "boom")
+    def test_prefetch_surfaces_fetch_errors(self):
+        def fetch(_, ids):
+            if "2" in ids:
+                raise UnexpectedError("boom")
+            return TestResourceCollection.TestResource.fetch(_, ids)
+
+        collection = ResourceCollection("some_query", self.collection_data, fetch)
+        list(collection.prefetch(batches=2))
@@ -0,0 +1,112 @@
+import os
+import tempfile
+from tests.test_helper import *
+from braintree.search_checkpoint import SearchCheckpoint
+
+class TestSearchCheckpoint(unittest.TestCase):
+    criteria = {"created_at": {"min": datetime(2020, 3, 1), "max": datetime(2020, 4, 1)}}
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "export.checkpoint")
+        self.searches = 0
+        self.fetched = []
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def search(self):
+        self.searches += 1
+        return {"search_results": {"page_size": 2, "ids": ["0", "1", "2", "3", "4"]}}
+
+    def fetch(self, query, ids):
+        self.fetched.append(ids)
+        return ["item_" + resource_id for resource_id in ids]
+
+    def fetch_raw(self, query, ids):
+        self.fetched.append(ids)
+        return [{"id": resource_id} for resource_id in ids]
+
+    def collection(self, criteria=None):
+        response, checkpoint = SearchCheckpoint.run(self.path, "transactions", criteria or self.criteria, self.search)
+        return ResourceCollection([], response, self.fetch, raw_method=self.fetch_raw, checkpoint=checkpoint)
+
+    def test_resumes_from_the_next_unconsumed_batch(self):
+        items = self.collection().items
+        self.assertEqual(["item_0", "item_1", "item_2"], [next(items) for _ in range(3)])
+        items.close()
+
+        self.assertEqual(["item_2", "item_3", "item_4"], list(self.collection()))
+        self.assertEqual(1, self.searches)
+        self.assertEqual([["0", "1"], ["2", "3"], ["2", "3"], ["4"]], self.fetched)
+
+    def test_prefetch_records_progress(self):
+        items = self.collection().prefetch(batches=2)
+        self.assertEqual(["item_0", "item_1", "item_2"], [next(items) for _ in range(3)])
+        items.close()
+
+        self.assertEqual(["item_2", "item_3", "item_4"], list(self.collection().prefetch(batches=2)))
+
+    def test_removes_the_file_when_iteration_completes(self):
+        self.assertEqual(5, len(list(self.collection())))
+
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_iterates_again_from_the_start_once_complete(self):
+        items = self.collection().items
+        [next(items) for _ in range(3)]
+        items.close()
+
+        collection = self.collection()
+        self.assertEqual(["item_2", "item_3", "item_4"], list(collection))
+        self.assertEqual(["item_0", "item_1", "item_2", "item_3", "item_4"], list(collection))
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_to_columns_reads_every_batch_of_a_resumed_search(self):
+        items = self.collection().items
+        [next(items) for _ in range(3)]
+        items.close()
+        self.fetched = []
+
+        frame = self.collection().to_columns(["id"])
+        self.assertEqual(["0", "1", "2", "3", "4"], [frame["id"][i] for i in range(len(frame))])
+        self.assertEqual([["0", "1"], ["2", "3"], ["4"]], self.fetched)
+        self.assertEqual(1, self.searches)
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_to_columns_records_progress(self):
+        checkpoint_batches = []
+        method = self.fetch_raw
+
+        def fetch_raw(query, ids):
+            if os.path.exists(self.path):
+                checkpoint_batches.append(SearchCheckpoint(self.path, "transactions", self.criteria).next_batch)
+            return method(query, ids)
+
+        self.fetch_raw = fetch_raw
+        self.collection().to_columns(["id"])
+        self.assertEqual([0, 1, 2], checkpoint_batches)
+
+    def test_ignores_a_progress_line_cut_short(self):
+        items = self.collection().items
+        [next(items) for _ in range(3)]
+        items.close()
+        with open(self.path, "a") as f:
+            f.write('{"next_ba')
+
+        self.assertEqual(1, SearchCheckpoint(self.path, "transactions", self.criteria).next_batch)
+
+    @raises_with_regexp(ValueError, "search checkpoint .* was written for a different search")
+    def test_rejects_a_checkpoint_for_different_criteria(self):
+        items = self.collection().items
+        next(items)
+        items.close()
+
+        self.collection({"status": {"is": "settled"}})
+
+    def test_without_a_path_searches_without_a_checkpoint(self):
+        response, checkpoint = SearchCheckpoint.run(None, "transactions", self.criteria, self.search)
+
+        self.assertIsNone(checkpoint)
+        self.assertEqual(["0", "1", "2", "3", "4"], response["search_results"]["ids"])
+        self.assertFalse(os.path.exists(self.path))
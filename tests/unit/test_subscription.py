@@ -16,3 +16,13 @@ class TestSubscription(unittest.TestCase):
     @raises(NotFoundError)
     def test_finding_None_id_raises_not_found_exception(self):
         Subscription.find(None)
+
+    def test_constructor_builds_transactions_when_first_read(self):
+        subscription = Subscription(None, {
+            "price": "10.00",
+            "transactions": [{"id": "txn", "amount": "10.00"}]
+        })
+        self.assertNotIn("transactions", subscription.__dict__)
+
+        self.assertEqual(Decimal("10.00"), subscription.price)
+        self.assertEqual(Decimal("10.00"), subscription.transactions[0].amount)
@@ -1,7 +1,10 @@
 from tests.test_helper import *
 from braintree.test.credit_card_numbers import CreditCardNumbers
+import copy
+import pickle
 from datetime import datetime
 from datetime import date
+from datetime import timedelta
 from braintree.authorization_adjustment import AuthorizationAdjustment
 from unittest.mock import MagicMock
 
@@ -205,3 +208,166 @@ class TestTransaction(unittest.TestCase):
         self.assertEqual(transaction.network_transaction_id, "123456789012345")
         self.assertEqual(transaction.network_response_code, "00")
         self.assertEqual(transaction.network_response_text, "Successful approval/completion or V.I.P. PIN verification is successful")
+
+    def test_constructor_builds_nested_resources_when_first_read(self):
+        attributes = {
+            'amount': '27.00',
+            'billing': {'first_name': 'Jane', 'postal_code': '60654'},
+            'status_history': [{'status': 'authorized', 'amount': '27.00'}]
+        }
+
+        transaction = Transaction(None, attributes)
+        self.assertNotIn("billing_details", transaction.__dict__)
+        self.assertNotIn("status_history", transaction.__dict__)
+
+        billing_details = transaction.billing_details
+        self.assertEqual("60654", billing_details.postal_code)
+        self.assertIs(billing_details, transaction.billing_details)
+        self.assertEqual(Decimal("27.00"), transaction.status_history[0].amount)
+        self.assertEqual(Decimal("27.00"), transaction.amount)
+
+    def test_repr_is_unchanged_by_lazy_attributes(self):
+        transaction = Transaction(None, {'id': 'txn', 'amount': '27.00', 'disputes': []})
+        self.assertRegex(repr(transaction), r"^<Transaction {id: 'txn', amount: Decimal\('27.00'\), disputes: \[\]} at \d+>$")
+
+    def test_lazy_attributes_can_be_assigned_before_they_are_read(self):
+        transaction = Transaction(None, {'amount': '27.00', 'shipping': {'postal_code': '60622'}})
+        transaction.amount = Decimal("1.00")
+        transaction.shipping_details = None
+
+        self.assertEqual(Decimal("1.00"), transaction.amount)
+        self.assertIsNone(transaction.shipping_details)
+
+    def test_copies_build_lazy_attributes_independently(self):
+        transaction = Transaction(None, {'amount': '27.00', 'billing': {'postal_code': '60654'}, 'subscription': {'billing_period_start_date': None}})
+        copied = copy.copy(transaction)
+
+        self.assertEqual("60654", copied.billing_details.postal_code)
+        self.assertEqual("60654", transaction.billing_details.postal_code)
+        self.assertIsNot(copied.billing_details, transaction.billing_details)
+        self.assertIsNotNone(copy.deepcopy(transaction).subscription_details)
+
+    def test_lazy_transaction_pickle_round_trip(self):
+        transaction = Transaction(None, {'id': 'txn', 'amount': '27.00', 'status_history': [{'status': 'authorized', 'amount': '27.00'}]})
+
+        copied = pickle.loads(pickle.dumps(transaction))
+
+        self.assertEqual(Decimal("27.00"), copied.amount)
+        self.assertEqual(Decimal("27.00"), copied.status_history[0].amount)
+
+    def test_building_a_lazy_attribute_leaves_the_attributes_unchanged(self):
+        attributes = {'amount': '27.00', 'billing': {'postal_code': '60654'}}
+        Transaction(None, attributes).billing_details
+
+        self.assertEqual({'postal_code': '60654'}, attributes['billing'])
+
+    @raises(AttributeError)
+    def test_missing_amount_still_raises_attribute_error(self):
+        Transaction(None, {})
+
+    def test_find_with_raw_returns_the_parsed_response(self):
+        transaction_gateway = TransactionGateway(BraintreeGateway(None))
+        transaction_gateway.config = MagicMock(name="config")
+        transaction_gateway.config.http.return_value.get.return_value = {"transaction": {"id": "txn", "amount": "10.00"}}
+
+        self.assertEqual({"id": "txn", "amount": "10.00"}, transaction_gateway.find("txn", raw=True))
+        self.assertEqual(Decimal("10.00"), transaction_gateway.find("txn").amount)
+
+    def test_search_with_raw_yields_parsed_responses(self):
+        transaction_gateway = TransactionGateway(BraintreeGateway(None))
+        transaction_gateway.config = MagicMock(name="config")
+        transaction_gateway.config.http.return_value.post.side_effect = [
+            {"search_results": {"page_size": 50, "ids": ["txn"]}},
+            {"credit_card_transactions": {"transaction": [{"id": "txn", "amount": "10.00"}]}}
+        ]
+
+        self.assertEqual([{"id": "txn", "amount": "10.00"}], list(transaction_gateway.search(TransactionSearch.id == "txn", raw=True)))
+
+    @raises_with_regexp(ValueError, "raw search results cannot be compacted")
+    def test_search_with_raw_cannot_be_compacted(self):
+        transaction_gateway = TransactionGateway(BraintreeGateway(None))
+        transaction_gateway.config = MagicMock(name="config")
+        transaction_gateway.config.http.return_value.post.return_value = {"search_results": {"page_size": 50, "ids": ["txn"]}}
+
+        transaction_gateway.search(TransactionSearch.id == "txn", raw=True).compact()
+
+    def setup_sharded_search_gateway(self, created_at, search_limit, timeouts=()):
+        transaction_gateway = TransactionGateway(BraintreeGateway(None))
+        transaction_gateway.config = MagicMock(name="config")
+        transaction_gateway.config.base_merchant_path.return_value = "/merchants/merchant_id"
+        searched_windows = []
+
+        def post(url, params, idempotent=False):
+            criteria = params["search"]
+            if url.endswith("advanced_search_ids"):
+                window = (criteria["created_at"]["min"], criteria["created_at"]["max"])
+                searched_windows.append(window)
+                if window in timeouts:
+                    raise RequestTimeoutError()
+                ids = [transaction_id for transaction_id, timestamp in sorted(created_at.items()) if window[0] <= timestamp <= window[1]]
+                return {"search_results": {"page_size": 2, "ids": ids[:search_limit]}}
+            return {"credit_card_transactions": {"transaction": [{"id": transaction_id, "amount": "1.00"} for transaction_id in criteria["ids"]]}}
+
+        transaction_gateway.config.http.return_value.post.side_effect = post
+        return transaction_gateway, searched_windows
+
+    def test_sharded_search_subdivides_windows_with_too_many_ids(self):
+        start = datetime(2020, 3, 1)
+        created_at = dict(("txn_%02d" % index, start + timedelta(hours=index)) for index in range(48))
+        transaction_gateway, searched_windows = self.setup_sharded_search_gateway(created_at, search_limit=10)
+
+        collection = transaction_gateway.sharded_search(start, start + timedelta(days=2), windows=2, max_ids=10, min_window=timedelta(hours=1))
+
+        self.assertEqual(sorted(created_at), sorted(collection.ids))
+        self.assertEqual(sorted(created_at), sorted(transaction.id for transaction in collection))
+        self.assertTrue(len(searched_windows) > 2)
+
+    def test_sharded_search_subdivides_windows_that_time_out(self):
+        start = datetime(2020, 3, 1)
+        end = start + timedelta(days=2)
+        created_at = dict(("txn_%02d" % index, start + timedelta(hours=index)) for index in range(48))
+        transaction_gateway, searched_windows = self.setup_sharded_search_gateway(created_at, search_limit=None, timeouts=[(start, end)])
+
+        collection = transaction_gateway.sharded_search(start, end, windows=1, raw=True)
+
+        self.assertEqual(sorted(created_at), collection.ids)
+        self.assertEqual({"id": "txn_00", "amount": "1.00"}, collection.first)
+        self.assertEqual([(start, start + timedelta(days=1)), (start, end), (start + timedelta(days=1), end)], sorted(searched_windows))
+
+    @raises(RequestTimeoutError)
+    def test_sharded_search_raises_when_the_smallest_window_times_out(self):
+        start = datetime(2020, 3, 1)
+        end = start + timedelta(minutes=1)
+        transaction_gateway, _ = self.setup_sharded_search_gateway({}, search_limit=None, timeouts=[(start, end)])
+
+        transaction_gateway.sharded_search(start, end, windows=1, min_window=timedelta(minutes=1))
+
+    def test_sharded_search_splits_date_bounds_as_datetimes(self):
+        start = date(2020, 3, 1)
+        created_at = dict(("txn_%02d" % index, datetime(2020, 3, 1) + timedelta(hours=index)) for index in range(48))
+        transaction_gateway, searched_windows = self.setup_sharded_search_gateway(created_at, search_limit=10)
+
+        collection = transaction_gateway.sharded_search(start, date(2020, 3, 3), windows=1, max_ids=10, min_window=timedelta(hours=1))
+
+        self.assertEqual(sorted(created_at), sorted(collection.ids))
+        self.assertTrue(all(isinstance(window[0], datetime) for window in searched_windows[1:]))
+
+    @raises_with_regexp(ValueError, "search window from .* matches 2 or more transactions")
+    def test_sharded_search_raises_when_the_smallest_window_hits_max_ids(self):
+        start = datetime(2020, 3, 1)
+        created_at = dict(("txn_%02d" % index, start) for index in range(5))
+        transaction_gateway, _ = self.setup_sharded_search_gateway(created_at, search_limit=2)
+
+        transaction_gateway.sharded_search(start, start + timedelta(hours=1), windows=1, max_ids=2, min_window=timedelta(minutes=1))
+
+    @raises_with_regexp(ValueError, "search window from .* matches 2 or more transactions")
+    def test_sharded_search_stops_splitting_windows_that_no_longer_shrink(self):
+        start = datetime(2020, 3, 1)
+        created_at = dict(("txn_%02d" % index, start) for index in range(5))
+        transaction_gateway, searched_windows = self.setup_sharded_search_gateway(created_at, search_limit=2)
+
+        transaction_gateway.sharded_search(date(2020, 3, 1), date(2020, 3, 2), windows=1, max_ids=2, min_window=timedelta(0))
+
+    @raises_with_regexp(ValueError, "created_at is set by the search windows")
+    def test_sharded_search_rejects_queries_on_the_window_field(self):
+        TransactionGateway(BraintreeGateway(None)).sharded_search(datetime(2020, 3, 1), datetime(2020, 3, 2), TransactionSearch.created_at >= datetime(2020, 3, 1))
@@ -0,0 +1,206 @@
+from tests.test_helper import *
+import braintree.configuration
+from queue import Full
+
+class TestWebhookPipeline(unittest.TestCase):
+    def setUp(self):
+        self.gateway = Configuration.gateway()
+
+    def sample(self, kind, id="my_id"):
+        sample_notification = WebhookTesting.sample_notification(kind, id)
+        return sample_notification["bt_signature"], sample_notification["bt_payload"]
+
+    def test_dispatches_notifications_by_kind(self):
+        canceled = []
+        defaults = []
+        with WebhookPipeline(self.gateway, workers=2) as pipeline:
+            pipeline.on(WebhookNotification.Kind.SubscriptionCanceled, canceled.append)
+            pipeline.on(None, defaults.append)
+            pipeline.submit(*self.sample(WebhookNotification.Kind.SubscriptionCanceled, "sub_1"))
+            pipeline.submit(*self.sample(WebhookNotification.Kind.TransactionSettled, "txn_1"))
+            pipeline.join()
+
+        self.assertEqual(["sub_1"], [notification.subscription.id for notification in canceled])
+        self.assertEqual(["txn_1"], [notification.transaction.id for notification in defaults])
+        self.assertEqual(2, pipeline.processed_count)
+
+    def test_on_can_be_used_as_a_decorator(self):
+        handled = []
+        with WebhookPipeline(self.gateway) as pipeline:
+            @pipeline.on(WebhookNotification.Kind.Check)
+            def check(notification):
+                handled.append(notification.kind)
+
+            pipeline.submit(*self.sample(WebhookNotification.Kind.Check))
+            pipeline.join()
+
+        self.assertEqual([WebhookNotification.Kind.Check], handled)
+
+    def test_drops_redelivered_notifications(self):
+        handled = []
+        signature, payload = self.sample(WebhookNotification.Kind.SubscriptionCanceled)
+        with WebhookPipeline(self.gateway, workers=1) as pipeline:
+            pipeline.on(WebhookNotification.Kind.SubscriptionCanceled, handled.append)
+            for _ in range(3):
+                pipeline.submit(signature, payload)
+            pipeline.join()
+
+        self.assertEqual(1, len(handled))
+        self.assertEqual(2, pipeline.duplicate_count)
+
+    def test_handles_a_redelivery_after_the_handler_failed(self):
+        calls = []
+        errors = []
+        def flaky(notification):
+            calls.append(notification)
+            if len(calls) == 1:
+                raise ValueError("handler failed")
+
+        signature, payload = self.sample(WebhookNotification.Kind.SubscriptionCanceled)
+        with WebhookPipeline(self.gateway, workers=1, on_error=lambda s, p, e: errors.append(e)) as pipeline:
+            pipeline.on(WebhookNotification.Kind.SubscriptionCanceled, flaky)
+            pipeline.submit(signature, payload)
+            pipeline.submit(signature, payload)
+            pipeline.join()
+
+        self.assertEqual(2, len(calls))
+        self.assertEqual("handler failed", str(errors[0]))
+        self.assertEqual(1, pipeline.processed_count)
+
+    def test_reports_deliveries_that_fail_verification(self):
+        errors = []
+        signature, payload = self.sample(WebhookNotification.Kind.Check)
+        with WebhookPipeline(self.gateway, on_error=lambda s, p, e: errors.append(e)) as pipeline:
+            pipeline.on(None, lambda notification: None)
+            pipeline.submit("bad_signature", payload)
+            pipeline.join()
+
+        self.assertEqual(1, pipeline.error_count)
+        self.assertTrue(isinstance(errors[0], InvalidSignatureError))
+
+    def test_counts_notifications_without_handlers(self):
+        with WebhookPipeline(self.gateway) as pipeline:
+            pipeline.submit(*self.sample(WebhookNotification.Kind.Check))
+            pipeline.join()
+
+        self.assertEqual(1, pipeline.unhandled_count)
+
+    def test_submit_raises_when_the_queue_is_full(self):
+        pipeline = WebhookPipeline(self.gateway, queue_size=1)
+        pipeline.submit(*self.sample(WebhookNotification.Kind.Check))
+
+        with self.assertRaises(Full):
+            pipeline.submit(*self.sample(WebhookNotification.Kind.Check), block=False)
+
+    def test_parses_in_worker_processes(self):
+        handled = []
+        with WebhookPipeline(self.gateway, workers=2, executor=WebhookPipeline.Processes) as pipeline:
+            pipeline.on(WebhookNotification.Kind.SubscriptionCanceled, handled.append)
+            for index in range(4):
+                pipeline.submit(*self.sample(WebhookNotification.Kind.SubscriptionCanceled, "sub_%d" % index))
+            pipeline.join()
+
+        self.assertEqual(["sub_0", "sub_1", "sub_2", "sub_3"], sorted(notification.subscription.id for notification in handled))
+
+    def test_parses_in_worker_processes_with_only_webhook_keys(self):
+        handled = []
+        signature, payload = self.sample(WebhookNotification.Kind.Check)
+        gateway = BraintreeGateway(braintree.configuration.Configuration(
+            environment=Environment.Development,
+            merchant_id="integration_merchant_id",
+            webhook_keys=[(self.gateway.config.public_key, self.gateway.config.private_key)]
+        ))
+        with WebhookPipeline(gateway, workers=1, executor=WebhookPipeline.Processes) as pipeline:
+            pipeline.on(WebhookNotification.Kind.Check, handled.append)
+            pipeline.submit(signature, payload)
+            pipeline.join()
+
+        self.assertEqual(1, len(handled))
+        self.assertEqual(0, pipeline.error_count)
+
+    def test_workers_survive_a_failing_store(self):
+        class FailingStore(MemoryWebhookDeduplicationStore):
+            def add(self, fingerprint):
+                if fingerprint[2] == "sub_0":
+                    raise IOError("store unavailable")
+                return MemoryWebhookDeduplicationStore.add(self, fingerprint)
+
+        handled = []
+        errors = []
+        with WebhookPipeline(self.gateway, workers=1, store=FailingStore(), on_error=lambda s, p, e: errors.append(e)) as pipeline:
+            pipeline.on(WebhookNotification.Kind.SubscriptionCanceled, handled.append)
+            pipeline.submit(*self.sample(WebhookNotification.Kind.SubscriptionCanceled, "sub_0"))
+            pipeline.submit(*self.sample(WebhookNotification.Kind.SubscriptionCanceled, "sub_1"))
+            pipeline.join()
+
+        self.assertEqual(["sub_1"], [notification.subscription.id for notification in handled])
+        self.assertEqual("store unavailable", str(errors[0]))
+        self.assertEqual(1, pipeline.error_count)
+
+    def test_workers_survive_a_failing_discard_and_on_error(self):
+        class FailingStore(MemoryWebhookDeduplicationStore):
+            def discard(self, fingerprint):
+                raise IOError("store unavailable")
+
+        def on_error(signature, payload, exception):
+            raise ValueError("on_error failed")
+
+        def handler(notification):
+            raise ValueError("handler failed")
+
+        with WebhookPipeline(self.gateway, workers=1, store=FailingStore(), on_error=on_error) as pipeline:
+            pipeline.on(WebhookNotification.Kind.SubscriptionCanceled, handler)
+            pipeline.on(WebhookNotification.Kind.Check, lambda notification: None)
+            pipeline.submit(*self.sample(WebhookNotification.Kind.SubscriptionCanceled))
+            pipeline.submit(*self.sample(WebhookNotification.Kind.Check))
+            pipeline.join()
+
+        self.assertEqual(4, pipeline.error_count)
+        self.assertEqual(1, pipeline.processed_count)
+
+    def test_fingerprint_uses_kind_timestamp_and_subject_id(self):
+        attributes = self.gateway.webhook_notification.parse_attributes(*self.sample(WebhookNotification.Kind.DisputeOpened, "dispute_id"))
+
+        kind, timestamp, subject_id = WebhookPipeline.fingerprint(attributes)
+
+        self.assertEqual(WebhookNotification.Kind.DisputeOpened, kind)
+        self.assertEqual(attributes["timestamp"].isoformat(), timestamp)
+        self.assertEqual("dispute_id", subject_id)
+
+class TestMemoryWebhookDeduplicationStore(unittest.TestCase):
+    def test_add_returns_false_for_stored_fingerprints(self):
+        store = MemoryWebhookDeduplicationStore()
+
+        self.assertTrue(store.add(("check", "t", None)))
+        self.assertFalse(store.add(("check", "t", None)))
+
+    def test_evicts_fingerprints_after_the_ttl(self):
+        now = [0]
+        store = MemoryWebhookDeduplicationStore(ttl=10, clock=lambda: now[0])
+        store.add("a")
+        now[0] = 5
+        store.add("b")
+        now[0] = 10
+
+        self.assertEqual(1, len(store))
+        self.assertTrue(store.add("a"))
+        self.assertFalse(store.add("b"))
+
+    def test_evicts_the_oldest_fingerprints_beyond_max_size(self):
+        store = MemoryWebhookDeduplicationStore(max_size=2)
+        for fingerprint in ["a", "b", "c"]:
+            store.add(fingerprint)
+
+        self.assertTrue(store.add("a"))
+        self.assertFalse(store.add("c"))
+
+    def test_discard_forgets_a_fingerprint(self):
+        store = MemoryWebhookDeduplicationStore()
+        store.add("a")
+        store.discard("a")
+
+        self.assertTrue(store.add("a"))
+
+    @raises(TypeError)
+    def test_store_base_is_abstract(self):
+        WebhookDeduplicationStore()
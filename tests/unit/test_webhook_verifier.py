@@ -0,0 +1,157 @@
+from tests.test_helper import *
+import pickle
+import braintree.configuration
+from braintree.webhook_verifier import WebhookVerifier
+
+class TestWebhookVerifier(unittest.TestCase):
+    def setUp(self):
+        self.verifier = WebhookVerifier("integration_public_key", "integration_private_key")
+
+    def test_sign_matches_crypto_hmac(self):
+        self.assertEqual(
+            Crypto.sha1_hmac_hash("integration_private_key", "some content"),
+            self.verifier.sign("some content")
+        )
+
+    def test_verify_returns_the_decoded_xml(self):
+        sample_notification = WebhookTesting.sample_notification(WebhookNotification.Kind.SubscriptionWentPastDue, "my_id")
+
+        xml = self.verifier.verify(sample_notification["bt_signature"], sample_notification["bt_payload"])
+
+        self.assertIn(b"<kind>subscription_went_past_due</kind>", xml)
+
+    def test_verify_finds_the_public_key_among_several_signatures(self):
+        sample_notification = WebhookTesting.sample_notification(WebhookNotification.Kind.Check, "my_id")
+        signature = "other_public_key|abc&" + sample_notification["bt_signature"]
+
+        self.assertIn(b"<kind>check</kind>", self.verifier.verify(signature, sample_notification["bt_payload"]))
+
+    def test_verify_accepts_a_payload_signed_with_a_trailing_newline(self):
+        sample_notification = WebhookTesting.sample_notification(WebhookNotification.Kind.Check, "my_id")
+
+        self.verifier.verify(sample_notification["bt_signature"], sample_notification["bt_payload"].rstrip())
+
+    def test_verify_raises_when_the_payload_was_modified(self):
+        sample_notification = WebhookTesting.sample_notification(WebhookNotification.Kind.Check, "my_id")
+        payload = sample_notification["bt_payload"][:-2] + b"A\n"
+
+        with self.assertRaisesRegex(InvalidSignatureError, "signature does not match payload - one has been modified"):
+            self.verifier.verify(sample_notification["bt_signature"], payload)
+
+    def test_verify_raises_when_no_public_key_matches(self):
+        sample_notification = WebhookTesting.sample_notification(WebhookNotification.Kind.Check, "my_id")
+        verifier = WebhookVerifier("other_public_key", "integration_private_key")
+
+        with self.assertRaisesRegex(InvalidSignatureError, "no matching public key"):
+            verifier.verify(sample_notification["bt_signature"], sample_notification["bt_payload"])
+
+    def test_kind_and_timestamp_ignores_elements_of_the_subject(self):
+        sample_notification = WebhookTesting.sample_notification(WebhookNotification.Kind.DisputeOpened, "my_id")
+
+        kind, timestamp = self.verifier.kind_and_timestamp(sample_notification["bt_signature"], sample_notification["bt_payload"])
+        notification = WebhookNotification.parse(sample_notification["bt_signature"], sample_notification["bt_payload"])
+
+        self.assertEqual(WebhookNotification.Kind.DisputeOpened, kind)
+        self.assertEqual(notification.timestamp, timestamp)
+
+    def test_gateway_kind_and_timestamp(self):
+        sample_notification = WebhookTesting.sample_notification(WebhookNotification.Kind.SubscriptionCanceled, "my_id")
+        gateway = Configuration.gateway()
+
+        kind, timestamp = gateway.webhook_notification.kind_and_timestamp(sample_notification["bt_signature"], sample_notification["bt_payload"])
+
+        self.assertEqual(WebhookNotification.Kind.SubscriptionCanceled, kind)
+        self.assertTrue((datetime.utcnow() - timestamp).seconds < 10)
+
+    def test_verify_accepts_signatures_of_any_key_in_the_ring(self):
+        old = self.sample_signed_with("old_public_key", "old_private_key")
+        new = self.sample_signed_with("new_public_key", "new_private_key")
+        verifier = WebhookVerifier("new_public_key", "new_private_key", keys=[("old_public_key", "old_private_key")])
+
+        self.assertIn(b"<kind>check</kind>", verifier.verify(old["bt_signature"], old["bt_payload"]))
+        self.assertIn(b"<kind>check</kind>", verifier.verify(new["bt_signature"], new["bt_payload"]))
+        self.assertEqual(["new_public_key", "old_public_key"], verifier.public_keys)
+
+    def test_verify_checks_the_first_known_key_of_the_signature(self):
+        sample = self.sample_signed_with("old_public_key", "old_private_key")
+        signature = "unknown|abc&" + sample["bt_signature"] + "&new_public_key|def"
+        verifier = WebhookVerifier("new_public_key", "new_private_key", keys=[("old_public_key", "old_private_key")])
+
+        verifier.verify(signature, sample["bt_payload"])
+
+    def test_remove_key_stops_accepting_its_signatures(self):
+        sample = self.sample_signed_with("old_public_key", "old_private_key")
+        verifier = WebhookVerifier("new_public_key", "new_private_key", keys=[("old_public_key", "old_private_key")])
+        verifier.remove_key("old_public_key")
+
+        with self.assertRaisesRegex(InvalidSignatureError, "no matching public key"):
+            verifier.verify(sample["bt_signature"], sample["bt_payload"])
+
+    def test_remove_key_of_the_public_key_promotes_the_next_key(self):
+        verifier = WebhookVerifier("new_public_key", "new_private_key", keys=[("old_public_key", "old_private_key")])
+        verifier.remove_key("new_public_key")
+
+        self.assertEqual("old_public_key", verifier.public_key)
+        self.assertEqual(Crypto.sha1_hmac_hash("old_private_key", "content"), verifier.sign("content"))
+
+        verifier.remove_key("old_public_key")
+        self.assertIsNone(verifier.public_key)
+        with self.assertRaisesRegex(ConfigurationError, "private_key is required"):
+            verifier.sign("content")
+
+    def test_sign_uses_the_public_key_s_pair(self):
+        verifier = WebhookVerifier(keys=[("first_public_key", "first_private_key"), ("second_public_key", "second_private_key")])
+
+        self.assertEqual("first_public_key", verifier.public_key)
+        self.assertEqual(Crypto.sha1_hmac_hash("first_private_key", "content"), verifier.sign("content"))
+
+    def test_gateway_accepts_the_configured_webhook_keys(self):
+        sample = self.sample_signed_with("old_public_key", "old_private_key")
+        gateway = BraintreeGateway(braintree.configuration.Configuration(
+            environment=Environment.Development,
+            merchant_id="integration_merchant_id",
+            public_key="new_public_key",
+            private_key="new_private_key",
+            webhook_keys=[("old_public_key", "old_private_key")]
+        ))
+
+        notification = gateway.webhook_notification.parse(sample["bt_signature"], sample["bt_payload"])
+
+        self.assertEqual(WebhookNotification.Kind.Check, notification.kind)
+
+    def test_gateway_verify_pairs_the_signing_key_with_its_public_key(self):
+        gateway = BraintreeGateway(braintree.configuration.Configuration(
+            environment=Environment.Development,
+            merchant_id="integration_merchant_id",
+            webhook_keys=[("old_public_key", "old_private_key"), ("new_public_key", "new_private_key")]
+        ))
+        challenge = "20f9f8ed05f77439fe955c977e4c8a53"
+
+        self.assertEqual(
+            "old_public_key|" + Crypto.sha1_hmac_hash("old_private_key", challenge),
+            gateway.webhook_notification.verify(challenge)
+        )
+
+        gateway.webhook_notification.verifier.remove_key("old_public_key")
+        self.assertEqual(
+            "new_public_key|" + Crypto.sha1_hmac_hash("new_private_key", challenge),
+            gateway.webhook_notification.verify(challenge)
+        )
+
+    def sample_signed_with(self, public_key, private_key):
+        gateway = BraintreeGateway(braintree.configuration.Configuration(
+            environment=Environment.Development,
+            merchant_id="integration_merchant_id",
+            public_key=public_key,
+            private_key=private_key
+        ))
+        return gateway.webhook_testing.sample_notification(WebhookNotification.Kind.Check, "my_id")
+
+    def test_verifier_pickles_with_its_keys(self):
+        verifier = WebhookVerifier("new_public_key", "new_private_key", keys=[("old_public_key", "old_private_key")])
+        sample = self.sample_signed_with("old_public_key", "old_private_key")
+
+        copied = pickle.loads(pickle.dumps(verifier))
+
+        self.assertEqual(verifier.sign("content"), copied.sign("content"))
+        self.assertIn(b"<kind>check</kind>", copied.verify(sample["bt_signature"], sample["bt_payload"]))
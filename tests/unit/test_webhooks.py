@@ -1,4 +1,8 @@
 from tests.test_helper import *
+import pickle
+import tempfile
+import threading
+import braintree.configuration
 from datetime import date
 from braintree.dispute import Dispute
 from braintree.credit_card import CreditCard
@@ -30,6 +34,103 @@ class TestWebhooks(unittest.TestCase):
 
         self.assertEqual('my_source_merchant_id', notification.source_merchant_id)
 
+    def test_parse_builds_the_subject_when_it_is_first_read(self):
+        sample_notification = WebhookTesting.sample_notification(
+            WebhookNotification.Kind.SubscriptionWentPastDue,
+            "my_id"
+        )
+
+        notification = WebhookNotification.parse(sample_notification['bt_signature'], sample_notification['bt_payload'])
+
+        self.assertEqual(WebhookNotification.Kind.SubscriptionWentPastDue, notification.kind)
+        self.assertNotIn("subject", notification.__dict__)
+        self.assertNotIn("subscription", notification.__dict__)
+        self.assertEqual("my_id", notification.subscription.id)
+        self.assertEqual("my_id", notification.subject["subscription"]["id"])
+        self.assertFalse(hasattr(notification, "transaction"))
+
+    def test_notification_from_attributes_builds_the_subject_when_it_is_first_read(self):
+        sample_notification = WebhookTesting.sample_notification(
+            WebhookNotification.Kind.TransactionSettled,
+            "my_id"
+        )
+        attributes = Configuration.gateway().webhook_notification.parse_attributes(sample_notification['bt_signature'], sample_notification['bt_payload'])
+
+        notification = WebhookNotification(Configuration.gateway(), attributes)
+
+        self.assertNotIn("transaction", notification.__dict__)
+        self.assertEqual("my_id", notification.transaction.id)
+        self.assertIn("<WebhookNotification {", repr(notification))
+
+    def test_threads_reading_the_subject_share_one_value(self):
+        sample_notification = WebhookTesting.sample_notification(
+            WebhookNotification.Kind.SubscriptionWentPastDue,
+            "my_id"
+        )
+        notification = WebhookNotification.parse(sample_notification['bt_signature'], sample_notification['bt_payload'])
+
+        subscriptions = []
+        threads = [threading.Thread(target=lambda: subscriptions.append(notification.subscription)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(8, len(subscriptions))
+        self.assertTrue(all(subscription is notification.subscription for subscription in subscriptions))
+        self.assertNotIn("_subject_pending", notification.__dict__)
+
+    def test_sample_notifications_builds_parsable_notifications_of_each_kind(self):
+        kinds = [WebhookNotification.Kind.SubscriptionWentPastDue, WebhookNotification.Kind.TransactionSettled, WebhookNotification.Kind.DisputeOpened]
+
+        samples = WebhookTesting.sample_notifications(6, kinds=kinds, id_prefix="bulk")
+        notifications = [WebhookNotification.parse(sample['bt_signature'], sample['bt_payload']) for sample in samples]
+
+        self.assertEqual(kinds * 2, [notification.kind for notification in notifications])
+        self.assertEqual("bulk_0", notifications[0].subscription.id)
+        self.assertEqual("bulk_4", notifications[4].transaction.id)
+        self.assertEqual("bulk_5", notifications[5].dispute.id)
+        self.assertTrue(notifications[0].timestamp < notifications[5].timestamp)
+
+    def test_sample_notifications_matches_sample_notification(self):
+        kind = WebhookNotification.Kind.SubMerchantAccountDeclined
+        single = WebhookTesting.sample_notification(kind, "id_0", "source_merchant")
+        bulk = WebhookTesting.sample_notifications(1, kinds=[kind], source_merchant_id="source_merchant")[0]
+
+        timestamp = re.compile(br"<timestamp[^<]*</timestamp>")
+        self.assertEqual(timestamp.sub(b"", b64decode(single['bt_payload'])), timestamp.sub(b"", b64decode(bulk['bt_payload'])))
+
+    def test_sample_notifications_draws_weighted_kinds_reproducibly(self):
+        kinds = {WebhookNotification.Kind.TransactionSettled: 3, WebhookNotification.Kind.Check: 1}
+
+        first = WebhookTesting.sample_notifications(50, kinds=kinds, seed=7)
+        second = WebhookTesting.sample_notifications(50, kinds=kinds, seed=7)
+
+        first_kinds = [WebhookNotification.parse(sample['bt_signature'], sample['bt_payload']).kind for sample in first]
+        second_kinds = [WebhookNotification.parse(sample['bt_signature'], sample['bt_payload']).kind for sample in second]
+        self.assertEqual(first_kinds, second_kinds)
+        self.assertEqual(set(kinds), set(first_kinds))
+
+    def test_sample_corpus_can_be_replayed(self):
+        path = os.path.join(tempfile.mkdtemp(), "webhooks.corpus")
+        try:
+            self.assertEqual(10, WebhookTesting.write_sample_corpus(path, 10, kinds=[WebhookNotification.Kind.SubscriptionCanceled]))
+
+            samples = list(WebhookTesting.read_sample_corpus(path))
+            notifications = [WebhookNotification.parse(sample['bt_signature'], sample['bt_payload']) for sample in samples]
+
+            self.assertEqual(["id_%d" % index for index in range(10)], [notification.subscription.id for notification in notifications])
+        finally:
+            os.remove(path)
+
+    def test_gateway_pickles_after_building_sample_notifications(self):
+        gateway = BraintreeGateway(braintree.configuration.Configuration.instantiate())
+        gateway.webhook_testing.sample_notifications(2, kinds=[WebhookNotification.Kind.Check])
+
+        copied = pickle.loads(pickle.dumps(gateway.webhook_testing))
+
+        self.assertEqual(2, len(copied.sample_notifications(2, kinds=[WebhookNotification.Kind.Check])))
+
     @raises(InvalidSignatureError)
     def test_completely_invalid_signature(self):
         sample_notification = WebhookTesting.sample_notification(
@@ -106,6 +106,35 @@ class TestXmlUtil(unittest.TestCase):
         expected = {"container": {"elements": [{"val": "val1"}, {"val": "val2"}, {"val": "val3"}]}}
         self.assertEqual(expected, XmlUtil.dict_from_xml(xml))
 
+    def test_dict_from_xml_repeated_elements_become_list(self):
+        xml = """
+        <container>
+            <elem><val>val1</val></elem>
+            <elem><val>val2</val></elem>
+        </container>
+        """
+        expected = {"container": {"elem": [{"val": "val1"}, {"val": "val2"}]}}
+        self.assertEqual(expected, XmlUtil.dict_from_xml(xml))
+
+    def test_dict_from_xml_preserves_whitespace_around_text(self):
+        xml = """
+        <container>
+            <elem>  a &amp; b
+            </elem>
+            <blank>   </blank>
+        </container>
+        """
+        expected = {"container": {"elem": "  a & b\n            ", "blank": ""}}
+        self.assertEqual(expected, XmlUtil.dict_from_xml(xml))
+
+    def test_dict_from_xml_bytes_with_declaration(self):
+        xml = b"""
+        <?xml version="1.0" encoding="UTF-8"?>
+        <container><date type="date">2020-01-02</date></container>
+        """
+        expected = {"container": {"date": date(2020, 1, 2)}}
+        self.assertEqual(expected, XmlUtil.dict_from_xml(xml))
+
     def test_xml_from_dict_escapes_keys_and_values(self):
         test_dict = {"k<ey": "va&lue"}
         self.assertEqual("<k&lt;ey>va&amp;lue</k&lt;ey>", XmlUtil.xml_from_dict(test_dict))
@@ -162,6 +191,25 @@ class TestXmlUtil(unittest.TestCase):
         test_dict = {"a": date(2010, 1, 2)}
         self.assertEqual('<a type="datetime">2010-01-02T00:00:00Z</a>', XmlUtil.xml_from_dict(test_dict))
 
+    def test_xml_from_dict_with_nested_arrays_of_hashes(self):
+        test_dict = {"transaction": {"line_items": [{"name": "a&b", "quantity": 1}, {"name": "c", "kind": None}]}}
+        self.assertEqual(
+            '<transaction><line_items type="array"><item><name>a&amp;b</name><quantity type="integer">1</quantity></item>'
+            '<item><name>c</name><kind></kind></item></line_items></transaction>',
+            XmlUtil.xml_from_dict(test_dict)
+        )
+
+    def test_xml_chunks_from_dict_matches_xml_from_dict(self):
+        test_dict = {"container": {"elements": [{"val": "val%d" % i} for i in range(100)], "flag": True}}
+        chunks = list(XmlUtil.xml_chunks_from_dict(test_dict, chunk_size=64))
+        self.assertTrue(len(chunks) > 1)
+        self.assertEqual(XmlUtil.xml_from_dict(test_dict).encode("utf-8"), b"".join(chunks))
+
+    def test_generator_writes_to_writer(self):
+        import io
+        writer = Generator({"a": {"b": "c"}}).write(io.StringIO())
+        self.assertEqual("<a><b>c</b></a>", writer.getvalue())
+
     @staticmethod
     def __xml_and_back(test_dict):
         return XmlUtil.dict_from_xml(XmlUtil.xml_from_dict(test_dict))
@@ -0,0 +1,130 @@
+from tests.test_helper import *
+from braintree.util.columnar import AmountColumn, CategoryColumn, Column, ColumnFrame, DatetimeColumn, StringColumn
+
+class TestColumnar(unittest.TestCase):
+    records = [
+        {
+            "id": "txn_1",
+            "amount": "10.25",
+            "status": "settled",
+            "created_at": datetime(2020, 3, 18, 12, 34, 56, 123456),
+            "credit_card": {"card_type": "Visa"}
+        },
+        {
+            "id": "txn_2",
+            "amount": "-3.5",
+            "status": "voided",
+            "created_at": None,
+            "credit_card": {"card_type": None}
+        },
+        {
+            "id": "txn_3",
+            "amount": None,
+            "status": "settled",
+            "created_at": date(2020, 3, 19)
+        }
+    ]
+
+    def test_infers_column_types_from_names(self):
+        frame = ColumnFrame(["id", "amount", "status", "created_at", "credit_card.card_type"])
+
+        self.assertIsInstance(frame["id"], StringColumn)
+        self.assertIsInstance(frame["amount"], AmountColumn)
+        self.assertIsInstance(frame["status"], CategoryColumn)
+        self.assertIsInstance(frame["created_at"], DatetimeColumn)
+        self.assertIsInstance(frame["credit_card.card_type"], CategoryColumn)
+
+    def test_stores_amounts_as_fixed_point_integers(self):
+        frame = ColumnFrame(["amount"]).extend(self.records)
+
+        self.assertEqual([1025, -350, AmountColumn.MISSING], list(frame["amount"].values))
+        self.assertEqual([Decimal("10.25"), Decimal("-3.50"), None], list(frame["amount"]))
+
+    def test_rounds_amounts_finer_than_the_scale(self):
+        column = AmountColumn(scale=1)
+        column.append("10.25")
+        column.append(Decimal("10.35"))
+
+        self.assertEqual([102, 104], list(column.values))
+
+    def test_stores_categories_as_codes(self):
+        frame = ColumnFrame(["status", "credit_card.card_type"]).extend(self.records)
+
+        self.assertEqual(["settled", "voided"], frame["status"].categories)
+        self.assertEqual([0, 1, 0], list(frame["status"].codes))
+        self.assertEqual(["Visa", None, None], list(frame["credit_card.card_type"]))
+
+    def test_stores_timestamps_as_epoch_microseconds(self):
+        frame = ColumnFrame(["created_at"]).extend(self.records)
+
+        self.assertEqual(1584534896123456, frame["created_at"].values[0])
+        self.assertEqual(DatetimeColumn.MISSING, frame["created_at"].values[1])
+        self.assertEqual([datetime(2020, 3, 18, 12, 34, 56, 123456), None, datetime(2020, 3, 19)], list(frame["created_at"]))
+
+    def test_stores_strings_in_a_table(self):
+        frame = ColumnFrame({"card": StringColumn("credit_card.card_type"), "id": StringColumn()}).extend(self.records)
+
+        self.assertEqual(bytearray(b"txn_1txn_2txn_3"), frame["id"].data)
+        self.assertEqual(["txn_1", "txn_2", "txn_3"], list(frame["id"]))
+        self.assertEqual("txn_3", frame["id"][-1])
+        self.assertEqual(["Visa", None, None], list(frame["card"]))
+        self.assertEqual(3, len(frame))
+
+    def test_reads_attributes_of_resources(self):
+        frame = ColumnFrame(["id", "amount"]).extend([Transaction(None, {"id": "txn_1", "amount": "1.00"})])
+
+        self.assertEqual(["txn_1"], list(frame["id"]))
+        self.assertEqual([100], list(frame["amount"].values))
+
+    def test_to_columns_reads_parsed_records_without_building_resources(self):
+        collection_data = {"search_results": {"page_size": 2, "ids": ["0", "1", "2"]}}
+        records = self.records
+
+        def fetch(query, ids):
+            raise AssertionError("resources should not be built")
+
+        def fetch_raw(query, ids):
+            return [dict(records[int(record_id)]) for record_id in ids]
+
+        collection = ResourceCollection("query", collection_data, fetch, fetch_raw)
+
+        for batches in (1, 2):
+            frame = collection.to_columns(["id", "amount"], batches=batches)
+            self.assertEqual(["txn_1", "txn_2", "txn_3"], list(frame["id"]))
+            self.assertEqual([1025, -350, AmountColumn.MISSING], list(frame["amount"].values))
+
+    @unittest.skipIf(braintree.util.columnar.numpy is None, "numpy is not installed")
+    def test_to_numpy(self):
+        import numpy
+        arrays = ColumnFrame(["amount", "status", "created_at"]).extend(self.records).to_numpy()
+
+        self.assertEqual(numpy.int64, arrays["amount"].dtype)
+        self.assertEqual([0, 1, 0], list(arrays["status"]))
+        self.assertTrue(numpy.isnat(arrays["created_at"][1]))
+
+    @unittest.skipIf(braintree.util.columnar.numpy is None, "numpy is not installed")
+    def test_to_numpy_copies_so_that_the_frame_can_grow(self):
+        frame = ColumnFrame(["amount"]).extend(self.records)
+        arrays = frame.to_numpy()
+        frame.extend(self.records)
+
+        self.assertEqual(len(self.records), len(arrays["amount"]))
+        self.assertEqual(2 * len(self.records), len(frame))
+
+    @unittest.skipIf(braintree.util.columnar.numpy is None, "numpy is not installed")
+    def test_to_numpy_without_copy_shares_the_buffers(self):
+        frame = ColumnFrame(["amount"]).extend(self.records)
+        arrays = frame.to_numpy(copy=False)
+
+        with self.assertRaises(BufferError):
+            frame.extend(self.records)
+        self.assertEqual(1025, arrays["amount"][0])
+
+    @raises(TypeError)
+    def test_column_is_abstract(self):
+        Column()
+
+    @unittest.skipIf(braintree.util.columnar.numpy is not None, "numpy is installed")
+    @raises_with_regexp(ConfigurationError, "numpy is required")
+    def test_to_numpy_requires_numpy(self):
+        ColumnFrame(["amount"]).extend(self.records).to_numpy()
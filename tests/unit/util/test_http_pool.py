@@ -0,0 +1,67 @@
+from tests.test_helper import *
+from braintree.util.http_pool import HttpPool
+from braintree.util.pooled_http import PooledHttp
+
+class TestHttpPool(unittest.TestCase):
+    def test_session_is_reused_between_calls(self):
+        pool = HttpPool()
+        self.assertIs(pool.session(), pool.session())
+
+    def test_session_mounts_adapter_with_pool_limits(self):
+        pool = HttpPool(pool_connections=3, pool_maxsize=7, pool_block=True)
+        adapter = pool.session().get_adapter("https://api.braintreegateway.com")
+        self.assertEqual(3, adapter._pool_connections)
+        self.assertEqual(7, adapter._pool_maxsize)
+        self.assertTrue(adapter._pool_block)
+
+    def test_idle_session_is_replaced(self):
+        pool = HttpPool(idle_timeout=0)
+        first = pool.session()
+        time.sleep(0.01)
+        self.assertIsNot(first, pool.session())
+
+    def test_close_discards_session(self):
+        pool = HttpPool()
+        first = pool.session()
+        pool.close()
+        self.assertIsNot(first, pool.session())
+
+    def test_session_is_shared_across_threads(self):
+        import threading
+        pool = HttpPool()
+        sessions = []
+        threads = [threading.Thread(target=lambda: sessions.append(pool.session())) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(1, len(set(id(session) for session in sessions)))
+
+class TestPooledHttp(unittest.TestCase):
+    def test_requests_are_sent_through_the_configuration_pool(self):
+        config = Configuration(
+            environment=Environment.Development,
+            merchant_id="integration_merchant_id",
+            public_key="integration_public_key",
+            private_key="integration_private_key",
+            http_strategy=PooledHttp
+        )
+        session = config.http_pool().session()
+        self.assertEqual(session.post, config.http_strategy()._request_function("POST"))
+        self.assertIs(config.http_pool(), config.http_pool())
+
+    def test_configure_shares_one_pool_between_instantiated_configurations(self):
+        try:
+            pool = HttpPool()
+            Configuration.configure(
+                Environment.Development,
+                "integration_merchant_id",
+                "integration_public_key",
+                "integration_private_key",
+                http_strategy=PooledHttp,
+                http_pool=pool
+            )
+            self.assertIs(pool, Configuration.instantiate().http_pool())
+            self.assertIs(pool, Configuration.instantiate().http_pool())
+        finally:
+            reset_braintree_configuration()
@@ -0,0 +1,91 @@
+from tests.test_helper import *
+import asyncio
+import braintree.configuration
+from braintree.util.instrumentation import MetricsSink, OperationTiming, current_timing
+
+class RecordingSink(MetricsSink):
+    def __init__(self):
+        self.timings = []
+
+    def record(self, timing):
+        self.timings.append(timing)
+
+class FakeStrategy(object):
+    def __init__(self, config, environment):
+        pass
+
+    def http_do(self, http_verb, path, headers, request_body):
+        if path.endswith("/transactions/missing"):
+            return (404, "")
+        return (201, "<transaction><id>abc</id><amount>10.00</amount></transaction>")
+
+class FakeAsyncStrategy(FakeStrategy):
+    async def http_do(self, http_verb, path, headers, request_body):
+        return FakeStrategy.http_do(self, http_verb, path, headers, request_body)
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        self.sink = RecordingSink()
+        self.config = braintree.configuration.Configuration(
+            Environment.Development,
+            "integration_merchant_id",
+            public_key="integration_public_key",
+            private_key="integration_private_key",
+            http_strategy=FakeStrategy,
+            metrics_sink=self.sink
+        )
+
+    def test_operation_timing_attributes_remainder_to_hydrate(self):
+        timing = OperationTiming("transaction.find")
+        timing.add("network", 0.25)
+        timing.add("network", 0.25)
+        timing.add("parse", 0.1)
+        timing.finish(1.0)
+
+        self.assertEqual(1.0, timing.total)
+        self.assertEqual(0.5, timing.phases["network"])
+        self.assertAlmostEqual(0.4, timing.phases["hydrate"])
+
+    def test_gateway_operations_are_timed_by_phase(self):
+        gateway = BraintreeGateway(self.config)
+        result = gateway.transaction.sale({"amount": "10.00"})
+
+        self.assertTrue(result.is_success)
+        self.assertEqual(1, len(self.sink.timings))
+        timing = self.sink.timings[0]
+        self.assertEqual("transaction.sale", timing.operation)
+        self.assertEqual(1, timing.requests)
+        self.assertEqual(201, timing.status)
+        self.assertEqual(None, timing.error)
+        self.assertEqual(
+            set(["verify_keys", "serialize", "network", "parse", "hydrate"]),
+            set(timing.phases.keys())
+        )
+        self.assertTrue(timing.total >= sum(timing.phases.values()) - 1e-9)
+        self.assertEqual(None, current_timing())
+
+    def test_failed_operations_record_the_error(self):
+        gateway = BraintreeGateway(self.config)
+        with self.assertRaises(NotFoundError):
+            gateway.transaction.find("missing")
+
+        self.assertEqual("transaction.find", self.sink.timings[0].operation)
+        self.assertEqual("NotFoundError", self.sink.timings[0].error)
+
+    def test_gateways_are_not_wrapped_without_a_sink(self):
+        self.config.metrics_sink = None
+        gateway = BraintreeGateway(self.config)
+
+        self.assertIsInstance(gateway.transaction, TransactionGateway)
+
+    def test_async_gateway_operations_are_timed(self):
+        gateway = AsyncBraintreeGateway(self.config, http_strategy=FakeAsyncStrategy)
+        transaction = asyncio.run(gateway.transaction.find("abc"))
+
+        self.assertEqual("abc", transaction.id)
+        self.assertEqual("transaction.find", self.sink.timings[0].operation)
+        self.assertEqual(1, self.sink.timings[0].requests)
+
+    @raises(TypeError)
+    def test_metrics_sink_base_is_abstract(self):
+        MetricsSink()
@@ -0,0 +1,65 @@
+from tests.test_helper import *
+from braintree.util.rate_limiter import RateLimiter
+
+class TestRateLimiter(unittest.TestCase):
+    def test_classifies_endpoints(self):
+        self.assertEqual(RateLimiter.Search, RateLimiter.endpoint_class("POST", "/merchants/m/transactions/advanced_search_ids"))
+        self.assertEqual(RateLimiter.Read, RateLimiter.endpoint_class("GET", "/merchants/m/transactions/id"))
+        self.assertEqual(RateLimiter.Write, RateLimiter.endpoint_class("POST", "/merchants/m/transactions"))
+
+    def test_allows_burst_then_paces_requests(self):
+        limiter = RateLimiter(rate=10, burst=3)
+        delays = [limiter.reserve("m", RateLimiter.Write) for _ in range(5)]
+
+        self.assertEqual([0, 0, 0], delays[:3])
+        self.assertAlmostEqual(0.1, delays[3], places=2)
+        self.assertAlmostEqual(0.2, delays[4], places=2)
+
+    def test_buckets_are_separate_per_merchant_and_endpoint_class(self):
+        limiter = RateLimiter(rate=1, endpoint_rates={RateLimiter.Search: 1})
+        self.assertEqual(0, limiter.reserve("m1", RateLimiter.Search))
+        self.assertEqual(0, limiter.reserve("m2", RateLimiter.Search))
+        self.assertEqual(0, limiter.reserve("m1", RateLimiter.Write))
+        self.assertTrue(limiter.reserve("m1", RateLimiter.Search) > 0)
+
+    def test_uses_endpoint_rates(self):
+        limiter = RateLimiter(rate=100, endpoint_rates={RateLimiter.Search: 2})
+        self.assertEqual(2, limiter.current_rate("m", RateLimiter.Search))
+        self.assertEqual(100, limiter.current_rate("m", RateLimiter.Write))
+
+    def test_uses_merchant_rates(self):
+        limiter = RateLimiter(
+            rate=100,
+            endpoint_rates={RateLimiter.Search: 2},
+            merchant_rates={"m1": 20, "m2": {RateLimiter.Write: 5}}
+        )
+        self.assertEqual(20, limiter.current_rate("m1", RateLimiter.Search))
+        self.assertEqual(20, limiter.current_rate("m1", RateLimiter.Write))
+        self.assertEqual(2, limiter.current_rate("m2", RateLimiter.Search))
+        self.assertEqual(5, limiter.current_rate("m2", RateLimiter.Write))
+        self.assertEqual(100, limiter.current_rate("m2", RateLimiter.Read))
+        self.assertEqual(100, limiter.current_rate("m3", RateLimiter.Write))
+
+    def test_merchant_rate_sets_the_burst_when_none_is_given(self):
+        limiter = RateLimiter(rate=100, merchant_rates={"m": 2})
+        delays = [limiter.reserve("m", RateLimiter.Write) for _ in range(3)]
+
+        self.assertEqual([0, 0], delays[:2])
+        self.assertAlmostEqual(0.5, delays[2], places=2)
+
+    def test_adapts_rate_to_too_many_requests(self):
+        limiter = RateLimiter(rate=8, min_rate=1)
+        limiter.record("m", RateLimiter.Write, 429)
+        self.assertEqual(4, limiter.current_rate("m", RateLimiter.Write))
+        for _ in range(5):
+            limiter.record("m", RateLimiter.Write, 429)
+        self.assertEqual(1, limiter.current_rate("m", RateLimiter.Write))
+
+        for _ in range(100):
+            limiter.record("m", RateLimiter.Write, 200)
+        self.assertEqual(8, limiter.current_rate("m", RateLimiter.Write))
+
+    def test_non_adaptive_limiter_keeps_its_rate(self):
+        limiter = RateLimiter(rate=8, adaptive=False)
+        limiter.record("m", RateLimiter.Write, 429)
+        self.assertEqual(8, limiter.current_rate("m", RateLimiter.Write))
@@ -0,0 +1,43 @@
+from tests.test_helper import *
+from braintree.util.retry_policy import RetryPolicy
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_does_not_retry_statuses_outside_the_retry_list(self):
+        policy = RetryPolicy()
+        self.assertIsNone(policy.delay_for_status(0, time.monotonic(), 422))
+        self.assertIsNone(policy.delay_for_status(0, time.monotonic(), 404))
+
+    def test_backoff_is_jittered_and_grows_exponentially(self):
+        policy = RetryPolicy(backoff_factor=1, max_backoff=100)
+        for attempt in range(3):
+            delay = policy.delay_for_status(attempt, time.monotonic(), 503)
+            self.assertTrue(0 <= delay <= 2 ** attempt)
+
+    def test_backoff_is_capped(self):
+        policy = RetryPolicy(max_retries=20, backoff_factor=1, max_backoff=3)
+        self.assertTrue(policy.delay_for_status(10, time.monotonic(), 503) <= 3)
+
+    def test_honors_retry_after_seconds(self):
+        policy = RetryPolicy()
+        self.assertEqual(7.0, policy.delay_for_status(0, time.monotonic(), 429, {"Retry-After": "7"}))
+
+    def test_honors_retry_after_http_date(self):
+        policy = RetryPolicy()
+        retry_at = datetime.utcnow() + timedelta(seconds=30)
+        header = retry_at.strftime("%a, %d %b %Y %H:%M:%S GMT")
+        delay = policy.delay_for_status(0, time.monotonic(), 503, {"Retry-After": header})
+        self.assertTrue(25 < delay <= 30)
+
+    def test_stops_after_max_retries(self):
+        policy = RetryPolicy(max_retries=2)
+        self.assertIsNone(policy.delay_for_status(2, time.monotonic(), 503))
+
+    def test_stops_when_retry_budget_is_exhausted(self):
+        policy = RetryPolicy(max_retry_time=10)
+        self.assertIsNone(policy.delay_for_status(0, time.monotonic(), 429, {"Retry-After": "11"}))
+        self.assertIsNone(policy.delay_for_status(0, time.monotonic() - 11, 503))
+
+    def test_retries_only_transient_exceptions(self):
+        policy = RetryPolicy()
+        self.assertIsNotNone(policy.delay_for_exception(0, time.monotonic(), requests.exceptions.ConnectTimeout()))
+        self.assertIsNone(policy.delay_for_exception(0, time.monotonic(), ValueError()))